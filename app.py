@@ -1,22 +1,18 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import folium
-from streamlit_folium import st_folium
-import requests
+import os
 import json
-from datetime import datetime, timedelta
-import time
-import numpy as np
+import functools
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from urllib.parse import quote
 
 from data_sources import DataCollector
 from visualization import ChartGenerator
-from utils import format_number, get_country_coordinates, get_all_country_coordinates, cache_data
-from performance_config import optimize_memory, clear_old_cache, UI_OPTIMIZATION
-from components import render_fallback_indicator
+from utils import format_number, format_month_year
+from performance_config import optimize_memory, UI_OPTIMIZATION
+from components import render_fallback_indicator, render_consensus_metric
+from combined_view import render_combined_view
 
 # Page configuration optimized for mobile
 st.set_page_config(
@@ -35,25 +31,82 @@ def get_data_collector():
 def get_chart_generator():
     return ChartGenerator()
 
-# Lazy initialization - only create when needed
-if 'data_collector' not in st.session_state:
-    st.session_state.data_collector = get_data_collector()
-if 'chart_generator' not in st.session_state:
-    st.session_state.chart_generator = get_chart_generator()
+@st.cache_data(max_entries=1)
+def get_google_country_frame(google_data: list) -> pd.DataFrame:
+    """Google country stats as an Arrow-backed DataFrame, sorted by IPv6 adoption descending"""
+    df = pd.DataFrame(google_data).convert_dtypes(dtype_backend='pyarrow')
+    # Percentages are bounded 0-100, float32 halves the chart/table payload
+    df['ipv6_percentage'] = df['ipv6_percentage'].astype('float32[pyarrow]')
+    return df.sort_values('ipv6_percentage', ascending=False)
+
+def get_allocation_frame(top_countries: dict, with_entries: bool = False) -> pd.DataFrame:
+    """RIR top-countries allocations with explicit, narrow column dtypes"""
+    columns = ['Country', 'Allocations', 'Percentage']
+    dtypes = {'Allocations': 'int64', 'Percentage': 'float32'}
+    if with_entries:
+        records = [(c, d['allocations'], d['percentage'], d.get('entries', 0)) for c, d in top_countries.items()]
+        columns.append('Entries')
+        dtypes['Entries'] = 'int64'
+    else:
+        records = [(c, d['allocations'], d['percentage']) for c, d in top_countries.items()]
+    return pd.DataFrame.from_records(records, columns=columns).astype(dtypes)
+
+# float32 percentages would otherwise display their binary expansion
+ALLOCATION_COLUMN_CONFIG = {'Percentage': st.column_config.NumberColumn(format='%.2f')}
+
+@st.cache_resource
+def load_source_catalog() -> MappingProxyType:
+    """Read the Data Sources page catalogue once per process.
+
+    cache_resource rather than cache_data: the page only reads it, so every
+    rerun can share the parsed object instead of unpickling a fresh copy.
+    Because that one object is shared by all sessions, it is frozen into
+    tuples and read-only mappings.  Each primary source's expander markdown
+    is pre-built here too, so the page emits one element per source.
+    """
+    with open(os.path.join(os.path.dirname(__file__), 'assets', 'data_sources.json'), encoding='utf-8') as f:
+        catalog = json.load(f)
+    primary = tuple(
+        MappingProxyType({**source, 'data_types': tuple(source['data_types'])})
+        for source in catalog['primary']
+    )
+    return MappingProxyType({
+        'primary': primary,
+        'rendered': tuple(
+            (
+                f"📊 {source['name']}",
+                f"**URL**: [{source['url']}]({source['url']})\n\n"
+                f"**Description**: {source['description']}\n\n"
+                "**Data Types**:\n\n" + "\n\n".join(f"  • {data_type}" for data_type in source['data_types']) +
+                f"\n\n**Update Frequency**: {source['update_frequency']}"
+            )
+            for source in primary
+        ),
+        'additional': tuple(catalog['additional']),
+    })
+
+@st.cache_data
+def load_css() -> str:
+    """Read the static dashboard stylesheet once per process"""
+    with open(os.path.join(os.path.dirname(__file__), 'assets', 'style.css')) as f:
+        return f.read()
 
 # Initialize theme preference (default: dark)
 if 'theme' not in st.session_state:
     st.session_state.theme = 'dark'
 
-# Optimize memory on app initialization
-optimize_memory()
+# Optimize memory on app initialization, not on every rerun
+if 'memory_optimized' not in st.session_state:
+    optimize_memory()
+    st.session_state.memory_optimized = True
 
-data_collector = st.session_state.data_collector
-chart_generator = st.session_state.chart_generator
+# Both are process-wide resources; reruns get the cached instances back
+data_collector = get_data_collector()
+chart_generator = get_chart_generator()
 
-# Dynamic theme configuration
-if st.session_state.theme == 'dark':
-    theme_colors = {
+# Theme palettes, exposed to the stylesheet as CSS custom properties
+THEME_COLORS = {
+    'dark': {
         'text_color': '#e4e6eb',
         'text_secondary_color': '#b0b3b8',
         'background_color': '#18191a',
@@ -74,9 +127,8 @@ if st.session_state.theme == 'dark':
         'warning_bg': '#4d3800',
         'warning_border': '#7a5a00',
         'warning_text': '#ffeaa7'
-    }
-else:  # light theme
-    theme_colors = {
+    },
+    'light': {
         'text_color': '#1a1a1a',
         'text_secondary_color': '#666666',
         'background_color': '#ffffff',
@@ -97,476 +149,24 @@ else:  # light theme
         'warning_bg': '#fff3cd',
         'warning_border': '#ffeaa7',
         'warning_text': '#856404'
-    }
-
-# Apply theme colors
-st.markdown(f"""
-<style>
-    /* Theme: {st.session_state.theme.upper()} */
-    :root {{
-        --text-color: {theme_colors['text_color']};
-        --text-secondary-color: {theme_colors['text_secondary_color']};
-        --background-color: {theme_colors['background_color']};
-        --secondary-background-color: {theme_colors['secondary_background_color']};
-        --primary-color: {theme_colors['primary_color']};
-        --primary-hover: {theme_colors['primary_hover']};
-        --secondary-color: {theme_colors['secondary_color']};
-        --border-color: {theme_colors['border_color']};
-    }}
-
-    /* Apply styling to Streamlit elements */
-    .stApp {{
-        background-color: var(--background-color) !important;
-    }}
-
-    .main {{
-        background-color: var(--background-color) !important;
-        color: var(--text-color) !important;
-    }}
-
-    section[data-testid="stSidebar"] {{
-        background-color: var(--secondary-background-color) !important;
-    }}
-
-    section[data-testid="stSidebar"] > div {{
-        background-color: var(--secondary-background-color) !important;
-    }}
-
-    /* Fix dropdown and select elements - dark theme */
-    .stSelectbox > div > div {{
-        background-color: var(--secondary-background-color) !important;
-        color: var(--text-color) !important;
-    }}
-
-    .stSelectbox label {{
-        color: var(--text-color) !important;
-    }}
-
-    /* Dropdown menu items - dark theme */
-    div[data-baseweb="select"] > div {{
-        background-color: var(--secondary-background-color) !important;
-        color: var(--text-color) !important;
-    }}
-
-    ul[role="listbox"] {{
-        background-color: var(--secondary-background-color) !important;
-    }}
-
-    li[role="option"] {{
-        color: var(--text-color) !important;
-        background-color: var(--secondary-background-color) !important;
-    }}
-
-    li[role="option"]:hover {{
-        background-color: {theme_colors['hover_bg']} !important;
-    }}
-
-    /* Override ALL text colors for readability */
-    .stMarkdown, .stMarkdown p, .stMarkdown span, .stMarkdown div,
-    p, span, div, label, input, textarea {{
-        color: var(--text-color) !important;
-    }}
-
-    h1, h2, h3, h4, h5, h6 {{
-        color: var(--text-color) !important;
-    }}
-
-    /* Expander headers */
-    .streamlit-expanderHeader {{
-        color: var(--text-color) !important;
-        background-color: var(--secondary-background-color) !important;
-    }}
-
-    /* Dataframe text - light on dark */
-    .dataframe {{
-        color: var(--text-color) !important;
-    }}
-
-    .dataframe thead th {{
-        background-color: var(--secondary-background-color) !important;
-        color: var(--text-color) !important;
-    }}
-
-    .dataframe tbody td {{
-        background-color: var(--background-color) !important;
-        color: var(--text-color) !important;
-    }}
-
-    /* Header with logo */
-    .logo-header {{
-        display: flex;
-        align-items: center;
-        margin-bottom: 1rem;
-        padding: 0.5rem;
-    }}
-
-    .logo-header img {{
-        height: 60px;
-        width: auto;
-        margin-right: 1rem;
-    }}
-
-    .logo-header h1 {{
-        margin: 0;
-        color: var(--primary-color);
-        font-size: 1.5rem;
-        font-weight: 600;
-    }}
-
-    /* Buttons with IPv6.army styling */
-    .stButton > button {{
-        background-color: var(--primary-color);
-        color: white;
-        border: none;
-        border-radius: 0.375rem;
-        font-weight: 500;
-        transition: all 0.2s;
-    }}
-    
-    .stButton > button:hover {{
-        background-color: {theme_colors['primary_hover']};
-        transform: translateY(-1px);
-    }}
-
-    /* Metrics with IPv6.army colors */
-    [data-testid="metric-container"] {{
-        background-color: var(--secondary-color);
-        border: 1px solid var(--secondary-background-color);
-        border-radius: 0.5rem;
-        padding: 1rem;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    }}
-
-    [data-testid="metric-container"] [data-testid="metric-value"] {{
-        color: var(--primary-color);
-        font-weight: 600;
-    }}
-
-    /* Cards and containers */
-    .element-container {{
-        background-color: var(--secondary-color);
-        border-radius: 0.5rem;
-    }}
-    
-    /* Success/info/warning messages */
-    .stSuccess {{
-        background-color: {theme_colors['success_bg']};
-        border-color: {theme_colors['success_border']};
-        color: {theme_colors['success_text']};
-    }}
-
-    .stInfo {{
-        background-color: {theme_colors['info_bg']};
-        border-color: {theme_colors['info_border']};
-        color: {theme_colors['info_text']};
-    }}
-
-    .stWarning {{
-        background-color: {theme_colors['warning_bg']};
-        border-color: {theme_colors['warning_border']};
-        color: {theme_colors['warning_text']};
-    }}
-
-    /* Mobile optimization */
-    @media (max-width: 768px) {{
-        .main .block-container {{
-            padding: 1rem 1rem;
-            max-width: 100%;
-        }}
-
-        .logo-header {{
-            flex-direction: column;
-            text-align: center;
-        }}
-
-        .logo-header img {{
-            margin-right: 0;
-            margin-bottom: 0.5rem;
-        }}
-
-        /* Make sidebar responsive */
-        .sidebar .sidebar-content {{
-            width: 100%;
-        }}
-
-        /* Optimize metrics for mobile */
-        [data-testid="metric-container"] {{
-            padding: 0.5rem;
-            margin: 0.25rem 0;
-        }}
-
-        /* Make charts responsive */
-        .js-plotly-plot {{
-            width: 100% !important;
-        }}
-
-        /* Improve text readability on mobile */
-        .main h1, .main h2, .main h3 {{
-            font-size: 1.2em;
-            line-height: 1.3;
-        }}
-
-        /* Stack columns on mobile */
-        .stColumns {{
-            flex-direction: column;
-        }}
-
-        /* Make buttons full width on mobile */
-        .stButton > button {{
-            width: 100%;
-        }}
-
-        /* Improve table readability */
-        .dataframe {{
-            font-size: 0.8em;
-        }}
-    }}
-
-    /* Ensure charts are always responsive */
-    .js-plotly-plot, .plotly-graph-div {{
-        width: 100% !important;
-        height: auto !important;
-    }}
-
-    /* Improve spacing for all screen sizes */
-    .metric-container {{
-        padding: 0.75rem;
-    }}
-</style>
-""", unsafe_allow_html=True)
-
-# Scalable top menu bar
-st.markdown(f"""
-<style>
-    /* Scalable top menu bar with orange/yellow gradient */
-    .menu-bar {{
-        background: {theme_colors['menu_gradient']};
-        padding: 0;
-        margin: -1rem -1rem 2rem -1rem;
-        box-shadow: 0 4px 12px {theme_colors['menu_shadow']};
-        position: sticky;
-        top: 0;
-        z-index: 1000;
-    }}
-
-    .menu-container {{
-        max-width: 1200px;
-        margin: 0 auto;
-        padding: 0 1rem;
-    }}
-
-    .menu-header {{
-        display: flex;
-        align-items: center;
-        padding: 1rem 0 0.5rem 0;
-        border-bottom: 1px solid rgba(255,255,255,0.2);
-    }}
-
-    .menu-logo {{
-        display: flex;
-        align-items: center;
-        flex: 1;
-    }}
-
-    .menu-logo img {{
-        height: 32px;
-        width: auto;
-        margin-right: 0.75rem;
-    }}
-
-    .menu-title {{
-        color: #2d2d2d;
-        font-size: 1.4rem;
-        font-weight: 600;
-        margin: 0;
-    }}
-
-    .menu-nav {{
-        display: flex;
-        padding: 0.5rem 0;
-        gap: 0.25rem;
-        overflow-x: auto;
-        scrollbar-width: none;
-        -ms-overflow-style: none;
-        justify-content: center;
-        flex-wrap: wrap;
-    }}
-
-    .menu-nav::-webkit-scrollbar {{
-        display: none;
-    }}
-
-    .menu-item {{
-        color: #2d2d2d !important;
-        text-decoration: none;
-        padding: 0.6rem 1rem;
-        border-radius: 0.375rem;
-        font-size: 0.875rem;
-        font-weight: 500;
-        white-space: nowrap;
-        transition: all 0.2s ease;
-        background: rgba(255,255,255,0.2);
-        margin-right: 0.25rem;
-    }}
-
-    .menu-item:hover {{
-        background: rgba(255,255,255,0.35);
-        color: #1a1a1a !important;
-        text-decoration: none;
-        transform: translateY(-1px);
-    }}
-
-    .menu-item.active {{
-        background: rgba(255,255,255,0.4);
-        color: #1a1a1a !important;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-    }}
-
-    .menu-utils {{
-        display: flex;
-        gap: 0.5rem;
-        padding: 0.5rem 0;
-        border-top: 1px solid rgba(255,255,255,0.1);
-        justify-content: center;
-        flex-wrap: wrap;
-    }}
-
-    .menu-util {{
-        color: #3d3d3d !important;
-        text-decoration: none;
-        padding: 0.25rem 0.75rem;
-        border-radius: 0.25rem;
-        font-size: 0.75rem;
-        background: rgba(255,255,255,0.15);
-        transition: all 0.2s;
-    }}
-
-    .menu-util:hover {{
-        background: rgba(255,255,255,0.3);
-        color: #1a1a1a !important;
-        text-decoration: none;
-    }}
-    
-    /* Enhanced Responsive Navigation */
-    @media (max-width: 1024px) {{
-        .menu-title {{
-            font-size: 1.2rem;
-        }}
-
-        .menu-item {{
-            font-size: 0.85rem;
-            padding: 0.5rem 0.75rem;
-            margin-right: 0.2rem;
-        }}
-
-        .menu-nav {{
-            justify-content: center;
-            gap: 0.5rem;
-        }}
-    }}
-
-    @media (max-width: 768px) {{
-        .menu-header {{
-            flex-direction: column;
-            text-align: center;
-            padding: 0.75rem 0 0.5rem 0;
-        }}
-
-        .menu-logo {{
-            justify-content: center;
-            margin-bottom: 0.5rem;
-        }}
-
-        .menu-title {{
-            font-size: 1.1rem;
-        }}
-
-        .menu-nav {{
-            justify-content: center;
-            padding-bottom: 0.75rem;
-            gap: 0.4rem;
-        }}
-
-        .menu-item {{
-            font-size: 0.8rem;
-            padding: 0.5rem 0.6rem;
-            margin-right: 0;
-        }}
-
-        .menu-utils {{
-            justify-content: center;
-            gap: 0.4rem;
-        }}
-    }}
-
-    @media (max-width: 480px) {{
-        .menu-container {{
-            padding: 0 0.5rem;
-        }}
-
-        .menu-title {{
-            font-size: 1rem;
-        }}
-
-        .menu-logo img {{
-            height: 24px;
-        }}
-
-        .menu-nav {{
-            gap: 0.3rem;
-        }}
-
-        .menu-item {{
-            font-size: 0.75rem;
-            padding: 0.4rem 0.5rem;
-        }}
-
-        .menu-util {{
-            font-size: 0.65rem;
-            padding: 0.2rem 0.5rem;
-        }}
-    }}
-
-    /* Very small screens */
-    @media (max-width: 360px) {{
-        .menu-title {{
-            font-size: 0.9rem;
-        }}
-
-        .menu-item {{
-            font-size: 0.7rem;
-            padding: 0.35rem 0.45rem;
-        }}
-
-        .menu-nav {{
-            gap: 0.2rem;
-        }}
-
-        .menu-util {{
-            font-size: 0.6rem;
-        }}
-    }}
-</style>
-""", unsafe_allow_html=True)
+    },
+}
 
-# Navigation sections
-nav_sections = [
-    ("📋", "Overview"),
-    ("🌍", "Combined View"), 
-    ("☁️", "Cloud Services"),
-    ("🔬", "Extended Data Sources"),
-    ("🌐", "Global Adoption"),
-    ("🏛️", "Country Analysis"), 
-    ("📡", "BGP Statistics"),
-    ("📈", "Historical Trends"),
-    ("📚", "Data Sources")
-]
 
-# Get current page
-current_page = st.query_params.get("page", "Overview")
+@functools.lru_cache(maxsize=2)
+def build_theme_style(theme: str) -> str:
+    """Assemble the full <style> block for a theme once; reruns reuse it"""
+    theme_vars = "\n".join(
+        f"    --{name.replace('_', '-')}: {value};" for name, value in THEME_COLORS.get(theme, THEME_COLORS['light']).items()
+    )
+    return f"<style>\n/* Theme: {theme.upper()} */\n:root {{\n{theme_vars}\n}}\n{load_css()}</style>"
+
 
-# Build scalable menu HTML
-menu_html = """
+# Apply theme colors: only the custom properties change per theme, the
+# stylesheet itself is static and read once
+st.markdown(build_theme_style(st.session_state.theme), unsafe_allow_html=True)
+
+MENU_HEADER_HTML = """
 <div class="menu-bar">
     <div class="menu-container">
         <div class="menu-header">
@@ -578,12 +178,7 @@ menu_html = """
         <div class="menu-nav">
 """
 
-for icon, section_name in nav_sections:
-    active_class = "active" if current_page == section_name else ""
-    encoded_name = quote(section_name)
-    menu_html += f'<a href="?page={encoded_name}" class="menu-item {active_class}" target="_self">{icon} {section_name}</a>'
-
-menu_html += """
+MENU_FOOTER_HTML = """
         </div>
         <div class="menu-utils">
             <a href="https://ipv6compatibility.com/" class="menu-util" target="_blank">IPv6 Compatibility Database</a>
@@ -595,7 +190,62 @@ menu_html += """
 </div>
 """
 
-st.markdown(menu_html, unsafe_allow_html=True)
+SIDEBAR_INFO_MD = """---
+### 📊 Dashboard Info
+**Data Updates**: Monthly
+
+**Cache Duration**: 30 days
+
+**Total Sources**: 15+ IPv6 statistics providers
+
+**Coverage**: Global deployment metrics
+
+---
+### 🌐 About
+Comprehensive IPv6 adoption analysis across cloud providers, ISPs, and regional networks worldwide.
+"""
+
+FOOTER_MD = "---\n📊 **Global IPv6 Statistics Dashboard** | Data sourced from Google, APNIC, BGP Potaroo, and CIDR Report"
+
+# Navigation sections
+nav_sections = [
+    ("📋", "Overview"),
+    ("🌍", "Combined View"), 
+    ("☁️", "Cloud Services"),
+    ("🔬", "Extended Data Sources"),
+    ("🌐", "Global Adoption"),
+    ("🏛️", "Country Analysis"), 
+    ("📡", "BGP Statistics"),
+    ("📈", "Historical Trends"),
+    ("📚", "Data Sources")
+]
+
+# Pre-rendered (inactive, active) link markup for each section
+NAV_LINKS = tuple(
+    (
+        section_name,
+        f'<a href="?page={quote(section_name)}" class="menu-item " target="_self">{icon} {section_name}</a>',
+        f'<a href="?page={quote(section_name)}" class="menu-item active" target="_self">{icon} {section_name}</a>',
+    )
+    for icon, section_name in nav_sections
+)
+
+
+@functools.lru_cache(maxsize=len(NAV_LINKS) + 1)
+def build_menu_html(current_page: str) -> str:
+    """Menu markup with ``current_page`` highlighted, built once per page"""
+    return "".join((
+        MENU_HEADER_HTML,
+        *(active if section_name == current_page else inactive
+          for section_name, inactive, active in NAV_LINKS),
+        MENU_FOOTER_HTML,
+    ))
+
+
+# Get current page
+current_page = st.query_params.get("page", "Overview")
+
+st.markdown(build_menu_html(current_page), unsafe_allow_html=True)
 
 # Set current view variable
 current_view = current_page
@@ -610,261 +260,60 @@ if st.sidebar.button(f"Switch to {'Light' if current_theme == 'dark' else 'Dark'
     st.session_state.theme = 'light' if current_theme == 'dark' else 'dark'
     st.rerun()
 
-st.sidebar.markdown(f"**Current Theme**: {theme_label}")
-
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 📊 Dashboard Info")
-st.sidebar.markdown("**Data Updates**: Monthly")
-st.sidebar.markdown("**Cache Duration**: 30 days")
-st.sidebar.markdown("**Total Sources**: 15+ IPv6 statistics providers")
-st.sidebar.markdown("**Coverage**: Global deployment metrics")
-
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 🌐 About")
-st.sidebar.markdown("Comprehensive IPv6 adoption analysis across cloud providers, ISPs, and regional networks worldwide.")
+# Sidebar info in a single element; only the theme line varies
+st.sidebar.markdown(f"**Current Theme**: {theme_label}\n\n{SIDEBAR_INFO_MD}")
 
 # Content area - title removed since it's now in top nav
 st.markdown("*Comprehensive analysis of worldwide IPv6 adoption and BGP routing data with monthly data updates*")
 
 
-def render_consensus_metric(consensus: dict):
-    """Render the Global IPv6 Adoption consensus metric consistently.
+# Widgets that only affect their own section live in fragments, so changing
+# them reruns that section instead of the whole page
 
-    Displays the multi-source average when live data is available.
-    Fallback sources are excluded from the average and trigger a disclaimer.
-    """
-    val = consensus.get('consensus')
-    any_fallback = consensus.get('any_fallback', False)
-    all_fallback = consensus.get('all_fallback', False)
-    live_count = consensus.get('live_count', 0)
-    total_count = consensus.get('total_count', 0)
-
-    if val is not None:
-        if all_fallback:
-            delta = "⚠️ All sources estimated"
-        elif any_fallback:
-            delta = f"⚠️ {live_count}/{total_count} live sources"
-        else:
-            delta = f"{live_count}/{total_count} live sources"
-        st.metric("Global IPv6 Adoption (Consensus)", f"{val:.1f}%", delta=delta)
-    else:
-        st.metric("Global IPv6 Adoption (Consensus)", "N/A", delta="No live sources")
-
-    if any_fallback:
-        unavailable = [s['label'] for s in consensus.get('sources', []) if s['fallback']]
-        st.caption(
-            f"⚠️ Data source updates currently unavailable for: {', '.join(unavailable)}. "
-            "Using last fetched state — excluded from consensus average."
+@st.fragment
+def render_google_country_table(df: pd.DataFrame):
+    """Top-N slice of the Google country table"""
+    st.subheader("📋 Detailed Country Statistics")
+    # Only ship the rows the user asks for; the full frame stays cached
+    table_df = df
+    if len(df) > 10:
+        top_n = st.slider(
+            "Show top N countries", 10, len(df), min(UI_OPTIMIZATION['table_rows'], len(df))
         )
+        table_df = df.head(top_n)
+    st.dataframe(
+        table_df,
+        use_container_width=True,
+        column_config={'ipv6_percentage': st.column_config.NumberColumn(format='%.1f')}
+    )
 
 
 # Combined View Page (standalone)
-if current_view == "Combined View":
+def render_combined_view_page(data_collector, chart_generator):
+    """Render the Combined View page"""
     st.header("🌍 Combined IPv6 Statistics View")
     st.markdown("*Comprehensive data from all major IPv6 measurement sources*")
     
-    st.success("📊 Displaying comprehensive IPv6 statistics from multiple sources")
-    
-    # Always display summary metrics first
-    st.subheader("🌐 Global IPv6 Statistics Summary")
-    
-    col1, col2, col3, col4 = st.columns(4)
-
-    _cv_consensus = data_collector.get_global_ipv6_consensus()
-
-    with col1:
-        render_consensus_metric(_cv_consensus)
-
-    with col2:
-        st.metric("IPv6 Websites", "49%", delta="Top 1000 sites")
-
-    with col3:
-        st.metric("BGP IPv6 Prefixes", "228,789", delta="Routing table")
-    
-    with col4:
-        # Add Facebook traffic data to summary metrics
-        try:
-            facebook_data = data_collector.get_facebook_ipv6_stats()
-            if isinstance(facebook_data, dict) and 'error' not in facebook_data:
-                platform_insights = facebook_data.get('platform_insights', {})
-                user_base = platform_insights.get('user_base', 'N/A')
-                st.metric("Facebook IPv6 Traffic", f"{facebook_data.get('global_adoption_rate', 'N/A')}%", delta=f"{user_base} users")
-            else:
-                st.metric("IPv6-only Support", "12%", delta="Cloud providers")
-        except Exception:
-            st.metric("IPv6-only Support", "12%", delta="Cloud providers")
-    
-    # Now show detailed sections
-    st.subheader("📊 Detailed Statistics by Source")
-    
-    # Google IPv6 Global Statistics
-    with st.expander("🌐 Google IPv6 Global Statistics", expanded=True):
-        google_stats = data_collector.get_google_ipv6_stats()
-        _g_pct = google_stats.get('global_percentage')
-
-        col1, col2 = st.columns(2)
+    render_combined_view(data_collector, chart_generator)
 
-        with col1:
-            st.metric(
-                "Google / APNIC IPv6 Adoption",
-                f"{_g_pct:.1f}%" if _g_pct is not None else "N/A",
-                delta="User IPv6 capability"
-            )
-
-        with col2:
-            st.info(f"Source: {google_stats.get('source', 'Google/APNIC')}")
-
-        if google_stats.get('fallback'):
-            st.caption(
-                "⚠️ Data source updates currently unavailable. "
-                "Using last fetched state — excluded from consensus average."
-            )
-        else:
-            st.caption("Google / APNIC measures the percentage of users with IPv6 capability.")
-
-    # Internet Society Pulse - Website IPv6 Support
-    with st.expander("🌐 Internet Society Pulse - Website IPv6 Support", expanded=True):
-        try:
-            pulse_stats = data_collector.get_internet_society_pulse_stats()
-
-            if pulse_stats:
-                # Create metrics for website support
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.metric(
-                        "IPv6 Websites",
-                        f"{pulse_stats.get('global_ipv6_websites', 49)}%",
-                        delta="Top 1000 sites globally"
-                    )
-                
-                with col2:
-                    st.metric(
-                        "HTTPS Websites", 
-                        f"{pulse_stats.get('global_https_websites', 95)}%",
-                        delta="Security adoption"
-                    )
-                
-                with col3:
-                    st.metric(
-                        "TLS 1.3 Websites", 
-                        f"{pulse_stats.get('global_tls13_websites', 86)}%",
-                        delta="Modern encryption"
-                    )
-                
-                st.success(f"✅ Live data loaded from {pulse_stats.get('source', 'Internet Society Pulse')}")
-            else:
-                st.warning("Pulse data not available")
-                
-        except Exception as e:
-            st.warning(f"Pulse data error: {str(e)}")
-    
-    # BGP Statistics Summary
-    with st.expander("🔀 BGP IPv6 Routing Statistics", expanded=True):
-        try:
-            bgp_stats = data_collector.get_current_bgp_stats()
-            
-            if bgp_stats:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric(
-                        "IPv6 BGP Prefixes", 
-                        format_number(bgp_stats.get('total_prefixes', 228748)),
-                        delta="Global routing table"
-                    )
-                
-                with col2:
-                    st.metric(
-                        "Yearly Growth", 
-                        f"+{format_number(bgp_stats.get('estimated_growth_yearly', 26000))}",
-                        delta="New prefixes per year"
-                    )
-                
-                st.success(f"✅ Live data loaded from {bgp_stats.get('source', 'BGP Statistics')}")
-            else:
-                st.warning("BGP data not available")
-                
-        except Exception as e:
-            st.warning(f"BGP data error: {str(e)}")
-    
-    # Facebook IPv6 Platform Statistics
-    with st.expander("📱 Facebook IPv6 Platform Statistics", expanded=True):
-        try:
-            facebook_data = data_collector.get_facebook_ipv6_stats()
-            
-            if isinstance(facebook_data, dict) and 'error' not in facebook_data:
-                # Platform metrics
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric(
-                        "Facebook IPv6 Traffic", 
-                        f"{facebook_data.get('global_adoption_rate', 'N/A')}%",
-                        delta="Global platform traffic"
-                    )
-                
-                with col2:
-                    platform_insights = facebook_data.get('platform_insights', {})
-                    user_base = platform_insights.get('user_base', 'N/A')
-                    st.metric(
-                        "Platform User Base", 
-                        str(user_base),
-                        delta="Monthly active users"
-                    )
-                
-                with col3:
-                    countries_analyzed = facebook_data.get('countries_analyzed', 'N/A')
-                    st.metric(
-                        "Countries Analyzed", 
-                        str(countries_analyzed),
-                        delta="Geographic coverage"
-                    )
-                
-                # Show top countries if available
-                top_countries = facebook_data.get('top_countries', [])
-                if top_countries and len(top_countries) >= 3:
-                    st.markdown("**🏆 Top IPv6 Countries (Facebook data):**")
-                    top_3 = []
-                    for country in top_countries[:3]:
-                        if isinstance(country, dict) and 'country' in country and 'ipv6_percentage' in country:
-                            try:
-                                pct = float(country['ipv6_percentage'])
-                                top_3.append(f"{country['country']} ({pct}%)")
-                            except (ValueError, TypeError):
-                                continue
-                    
-                    if top_3:
-                        st.write(f"**1.** {top_3[0]}" if len(top_3) > 0 else "")
-                        st.write(f"**2.** {top_3[1]}" if len(top_3) > 1 else "")
-                        st.write(f"**3.** {top_3[2]}" if len(top_3) > 2 else "")
-                
-                st.success(f"✅ Live data loaded from {facebook_data.get('source', 'Facebook IPv6 Statistics')}")
-            else:
-                error_msg = facebook_data.get('error', 'Data not available') if isinstance(facebook_data, dict) else 'Data not available'
-                st.warning(f"Facebook data: {error_msg}")
-                
-        except Exception as e:
-            st.warning(f"Facebook data error: {str(e)}")
-    
-    # Summary insights
-    st.subheader("🎯 Key Combined Insights")
-    
-    insights = [
-        "Global IPv6 adoption continues strong growth, reaching 47%+ of internet users",
-        "Website IPv6 support at 49% for top 1000 sites, with security adoption leading",
-        "Mobile networks show highest IPv6 adoption rates globally", 
-        "BGP table growth steady at ~26,000 new IPv6 prefixes annually",
-        "Facebook platform provides additional insights into regional IPv6 traffic patterns",
-        "Deployment gaps remain: only 13.2% actual IPv6 connections vs 43.3% server support"
-    ]
-    
-    for i, insight in enumerate(insights, 1):
-        st.write(f"{i}. {insight}")
 
 # Overview Page
-elif current_view == "Overview":
+def render_overview_page(data_collector, chart_generator):
+    """Render the Overview page"""
     st.header("📈 IPv6 Adoption Overview")
+
+    # Start every source the overview reads in the background; each section
+    # below waits only on its own future, and sources read by several
+    # sections are fetched (and copied out of the cache) just once
+    sources = data_collector.prefetch({
+        'google': data_collector.get_google_ipv6_stats,
+        'cloudflare': data_collector.get_cloudflare_radar_stats,
+        'pulse': data_collector.get_internet_society_pulse_stats,
+        'bgp': data_collector.get_bgp_stats,
+        'facebook': data_collector.get_facebook_ipv6_stats,
+        'lacnic': data_collector.get_lacnic_stats,
+        'afrinic': data_collector.get_afrinic_stats,
+    })
     
     # Key metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -874,7 +323,7 @@ elif current_view == "Overview":
             render_consensus_metric(data_collector.get_global_ipv6_consensus())
 
         # Fetch BGP statistics
-        bgp_stats = data_collector.get_bgp_stats()
+        bgp_stats = sources['bgp'].result()
         
         with col2:
             st.metric(
@@ -893,7 +342,7 @@ elif current_view == "Overview":
         with col4:
             # Use Facebook data for top country if available
             try:
-                facebook_data = data_collector.get_facebook_ipv6_stats()
+                facebook_data = sources['facebook'].result()
                 if isinstance(facebook_data, dict) and 'error' not in facebook_data:
                     top_countries = facebook_data.get('top_countries', [])
                     if top_countries and len(top_countries) > 0:
@@ -929,8 +378,8 @@ elif current_view == "Overview":
 
     # Fallback indicators for key overview sources
     try:
-        render_fallback_indicator(data_collector.get_google_ipv6_stats())
-        render_fallback_indicator(data_collector.get_bgp_stats())
+        render_fallback_indicator(sources['google'].result())
+        render_fallback_indicator(sources['bgp'].result())
     except Exception:
         pass
 
@@ -944,12 +393,12 @@ elif current_view == "Overview":
         
         # Add LACNIC insights
         try:
-            lacnic_data = data_collector.get_lacnic_stats()
+            lacnic_data = sources['lacnic'].result()
             if 'error' not in lacnic_data:
                 total_lacnic = lacnic_data.get('total_addresses', 0)
                 unit = lacnic_data.get('measurement_unit', '/48 blocks')
                 st.success(f"🌎 **LACNIC Region**: {format_number(total_lacnic)} IPv6 {unit} allocated across Latin America & Caribbean")
-        except:
+        except Exception:
             pass
         
     with col2:
@@ -957,7 +406,7 @@ elif current_view == "Overview":
         
         # Add Facebook platform insights
         try:
-            facebook_data = data_collector.get_facebook_ipv6_stats()
+            facebook_data = sources['facebook'].result()
             if isinstance(facebook_data, dict) and 'error' not in facebook_data:
                 global_rate = facebook_data.get('global_adoption_rate', 'N/A')
                 platform_insights = facebook_data.get('platform_insights', {})
@@ -970,12 +419,12 @@ elif current_view == "Overview":
                     top_2 = [f"{c.get('country', '')} ({c.get('ipv6_percentage', 0)}%)" for c in top_countries[:2]]
                     if len(top_2) == 2:
                         st.info(f"🏆 **Platform Leaders**: {top_2[0]}, {top_2[1]}")
-        except:
+        except Exception:
             pass
         
         # Add enhanced Cloudflare and NIST insights
         try:
-            cloudflare_data = data_collector.get_cloudflare_radar_stats()
+            cloudflare_data = sources['cloudflare'].result()
             if 'error' not in cloudflare_data:
                 coverage = cloudflare_data.get('geographic_coverage', 'Global')
                 regional_leaders = cloudflare_data.get('regional_leaders', {})
@@ -986,7 +435,7 @@ elif current_view == "Overview":
                     asia_pacific = regional_leaders.get('Asia-Pacific', 'Leading region')
                     st.info(f"🌏 **Regional Leaders**: {asia_pacific}")
             
-        except:
+        except Exception:
             pass
     
     # Recent updates with extended data insights
@@ -1001,33 +450,33 @@ elif current_view == "Overview":
     
     # Add updates from new data sources
     try:
-        lacnic_data = data_collector.get_lacnic_stats()
+        lacnic_data = sources['lacnic'].result()
         if 'error' not in lacnic_data:
             data_date = lacnic_data.get('data_date', 'Recent')
             total = format_number(lacnic_data.get('total_addresses', 0))
             unit = lacnic_data.get('measurement_unit', '/48 blocks')
             updates.append(f"🌎 LACNIC region shows strong IPv6 growth with {total} {unit} allocated (as of {data_date})")
-    except:
+    except Exception:
         pass
     
     try:
-        cloudflare_data = data_collector.get_cloudflare_radar_stats()
+        cloudflare_data = sources['cloudflare'].result()
         if 'error' not in cloudflare_data:
             updates.append("☁️ Cloudflare Radar provides real-time IPv6 traffic analysis from global CDN network covering 200+ countries")
-    except:
+    except Exception:
         pass
     
     try:
-        afrinic_data = data_collector.get_afrinic_stats()
+        afrinic_data = sources['afrinic'].result()
         if 'error' not in afrinic_data:
             total_afrinic = afrinic_data.get('total_addresses', 0)
             updates.append(f"🌍 AFRINIC region shows {format_number(total_afrinic)} IPv6 /32 blocks allocated across 54 African countries")
-    except:
+    except Exception:
         pass
     
     # Add Facebook platform updates
     try:
-        facebook_data = data_collector.get_facebook_ipv6_stats()
+        facebook_data = sources['facebook'].result()
         if isinstance(facebook_data, dict) and 'error' not in facebook_data:
             global_rate = facebook_data.get('global_adoption_rate', 52)
             countries_analyzed = facebook_data.get('countries_analyzed', 20)
@@ -1044,14 +493,16 @@ elif current_view == "Overview":
                 country_pct = top_country.get('ipv6_percentage', 0)
                 if country_name and country_pct:
                     updates.append(f"🏆 {country_name} leads Facebook IPv6 adoption at {country_pct}% of platform traffic")
-    except:
+    except Exception:
         pass
     
-    for update in updates:
-        st.write(update)
+    st.markdown("\n\n".join(updates))
+
 
 # Global Adoption Page
-elif current_view == "Global Adoption":
+@st.fragment
+def render_global_adoption_page(data_collector, chart_generator):
+    """Render the Global Adoption page"""
     st.header("🌍 Global IPv6 Adoption Statistics")
     
     # Data source selection
@@ -1079,9 +530,11 @@ elif current_view == "Global Adoption":
     try:
         if source == "Google IPv6 Statistics":
             # Fetch and display Google data
-            google_data = data_collector.get_google_country_stats()
+            with st.spinner("Loading Google data..."):
+                google_data = data_collector.get_google_country_stats()
             if google_data:
-                df = pd.DataFrame(google_data)
+                # Already sorted, so the top 10 is just the head of the frame
+                df = get_google_country_frame(google_data)
                 
                 # Global map
                 st.subheader("🗺️ IPv6 Adoption by Country")
@@ -1090,7 +543,7 @@ elif current_view == "Global Adoption":
                 
                 # Top countries
                 st.subheader("🏆 Top IPv6 Adopting Countries")
-                top_countries = df.nlargest(10, 'ipv6_percentage')
+                top_countries = df.head(10)
                 fig = chart_generator.create_bar_chart(
                     top_countries, 
                     'country', 
@@ -1100,15 +553,15 @@ elif current_view == "Global Adoption":
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Data table
-                st.subheader("📋 Detailed Country Statistics")
-                st.dataframe(df.sort_values('ipv6_percentage', ascending=False), use_container_width=True)
+                render_google_country_table(df)
                 
                 # Source citation
                 st.caption("📄 **Source**: Google IPv6 Statistics (https://www.google.com/intl/en/ipv6/statistics.html)")
                 
         elif source == "APNIC Measurements":
             # Fetch APNIC data
-            apnic_data = data_collector.get_apnic_stats()
+            with st.spinner("Loading APNIC data..."):
+                apnic_data = data_collector.get_apnic_stats()
             if apnic_data:
                 st.success("APNIC data loaded successfully")
                 # Display APNIC specific visualizations
@@ -1118,377 +571,7 @@ elif current_view == "Global Adoption":
                 st.warning("APNIC data temporarily unavailable. Please try again later.")
                 
         elif source == "Combined View":
-            st.success("📊 Displaying comprehensive IPv6 statistics from multiple sources")
-
-            # Always display summary metrics first
-            st.subheader("🌐 Global IPv6 Statistics Summary")
-
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                render_consensus_metric(data_collector.get_global_ipv6_consensus())
-            
-            with col2:
-                st.metric("IPv6 Websites", "49%", delta="Top 1000 sites")
-            
-            with col3:
-                st.metric("BGP IPv6 Prefixes", "228,789", delta="Routing table")
-            
-            with col4:
-                st.metric("IPv6-only Support", "12%", delta="Cloud providers")
-            
-            # Now show detailed sections
-            st.subheader("📊 Detailed Statistics by Source")
-            
-            # Google IPv6 Global Statistics
-            with st.expander("🌐 Google IPv6 Global Statistics", expanded=True):
-                google_stats = data_collector.get_google_ipv6_stats()
-                _g_pct = google_stats.get('global_percentage')
-
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    st.metric(
-                        "Google / APNIC IPv6 Adoption",
-                        f"{_g_pct:.1f}%" if _g_pct is not None else "N/A",
-                        delta="User IPv6 capability"
-                    )
-
-                with col2:
-                    st.info(f"Source: {google_stats.get('source', 'Google/APNIC')}")
-
-                if google_stats.get('fallback'):
-                    st.caption(
-                        "⚠️ Data source updates currently unavailable. "
-                        "Using last fetched state — excluded from consensus average."
-                    )
-                else:
-                    st.caption("Google / APNIC measures the percentage of users with IPv6 capability.")
-            
-            # Internet Society Pulse - Website IPv6 Support  
-            with st.expander("🌐 Internet Society Pulse - Website IPv6 Support", expanded=True):
-                try:
-                    pulse_stats = data_collector.get_internet_society_pulse_stats()
-                    
-                    if pulse_stats:
-                        # Create metrics for website support
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.metric(
-                                "IPv6 Websites", 
-                                f"{pulse_stats.get('global_ipv6_websites', 49)}%",
-                                delta="Top 1000 sites globally"
-                            )
-                        
-                        with col2:
-                            st.metric(
-                                "HTTPS Websites", 
-                                f"{pulse_stats.get('global_https_websites', 95)}%",
-                                delta="Security adoption"
-                            )
-                        
-                        with col3:
-                            st.metric(
-                                "TLS 1.3 Websites", 
-                                f"{pulse_stats.get('global_tls13_websites', 86)}%",
-                                delta="Modern encryption"
-                            )
-                        
-                        st.success(f"✅ Live data loaded from {pulse_stats.get('source', 'Internet Society Pulse')}")
-                        
-                        # Regional comparison from Internet Society Pulse
-                        st.subheader("🗺️ Regional Website IPv6 Support")
-                        pulse_regional = pulse_stats.get('regional_data', {})
-                        if pulse_regional:
-                            fig = chart_generator.create_regional_comparison_chart(pulse_regional)
-                            st.plotly_chart(fig, use_container_width=True)
-                        
-                        st.caption(f"📄 **Source**: {pulse_stats.get('source', 'Internet Society Pulse')} ({pulse_stats.get('url', '')})")
-                    else:
-                        st.warning("Pulse data not available")
-                        
-                except Exception as e:
-                    st.warning(f"Pulse data error: {str(e)}")
-            
-            # Akamai Network Statistics
-            st.subheader("🌐 Akamai - Network IPv6 Adoption")
-            
-            try:
-                akamai_stats = data_collector.get_akamai_stats()
-                top_networks = akamai_stats.get('top_networks', [])
-                
-                if top_networks:
-                    networks_df = pd.DataFrame(top_networks)
-                    fig = chart_generator.create_bar_chart(
-                        networks_df,
-                        'network',
-                        'ipv6_percentage',
-                        'Top IPv6 Networks by Akamai Traffic'
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Display network data table
-                    st.subheader("📋 Top Network IPv6 Deployment")
-                    st.dataframe(networks_df, use_container_width=True)
-                
-                st.caption(f"📄 **Source**: {akamai_stats.get('source', 'Akamai')} ({akamai_stats.get('url', '')})")
-                
-            except Exception as e:
-                st.warning(f"Akamai data temporarily unavailable: {str(e)}")
-            
-            # Eric Vyncke's Website Deployment Statistics
-            st.subheader("🌐 Eric Vyncke - Website IPv6 Deployment")
-            
-            try:
-                vyncke_stats = data_collector.get_vyncke_stats()
-                
-                st.info(f"**Measurement Type**: {vyncke_stats.get('measurement_type', 'Website IPv6 deployment')}")
-                st.info(f"**Scope**: {vyncke_stats.get('scope', 'Top websites per country')}")
-                st.caption(f"📄 **Source**: {vyncke_stats.get('source', 'Eric Vyncke')} ({vyncke_stats.get('url', '')})")
-                
-            except Exception as e:
-                st.warning(f"Eric Vyncke data temporarily unavailable: {str(e)}")
-            
-            # Cloudflare Radar IPv6 Traffic Analysis
-            st.subheader("🌐 Cloudflare Radar - IPv6 Traffic Analysis")
-            
-            try:
-                cloudflare_stats = data_collector.get_cloudflare_radar_stats()
-                
-                # Create metrics for Cloudflare data
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric(
-                        "Global IPv6 Traffic", 
-                        f"{cloudflare_stats.get('global_ipv6_traffic', 36)}%",
-                        delta="Based on HTTP requests to Cloudflare"
-                    )
-                
-                with col2:
-                    st.info(f"📱 **Mobile Advantage**: {cloudflare_stats.get('mobile_advantage', 'Mobile traffic shows higher IPv6 adoption')}")
-                
-                st.caption(f"📄 **Source**: {cloudflare_stats.get('source', 'Cloudflare Radar')} ({cloudflare_stats.get('url', '')})")
-                
-            except Exception as e:
-                st.warning(f"Cloudflare Radar data temporarily unavailable: {str(e)}")
-            
-            # Cloudflare DNS Analysis
-            st.subheader("🔍 Cloudflare DNS - Client vs Server Analysis")
-            
-            try:
-                dns_stats = data_collector.get_cloudflare_dns_stats()
-                render_fallback_indicator(dns_stats)
-
-                # DNS analysis metrics
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric(
-                        "Client IPv6 Adoption", 
-                        f"{dns_stats.get('client_ipv6_adoption', 30.5)}%",
-                        delta="DNS queries from clients"
-                    )
-                
-                with col2:
-                    st.metric(
-                        "Server IPv6 Support", 
-                        f"{dns_stats.get('server_ipv6_adoption', 43.3)}%", 
-                        delta="Servers with IPv6 records"
-                    )
-                
-                with col3:
-                    st.metric(
-                        "Actual IPv6 Connections", 
-                        f"{dns_stats.get('actual_connections', 13.2)}%",
-                        delta="Real connections over IPv6"
-                    )
-                
-                with col4:
-                    st.metric(
-                        "Top 100 Domains", 
-                        f"{dns_stats.get('top_domains_ipv6', 60.8)}%",
-                        delta="Popular sites IPv6 support"
-                    )
-                
-                st.info("🔍 **Key Insight**: Only 13.2% of connections actually use IPv6, despite 43.3% server support and 30.5% client capability - showing deployment gaps remain")
-                st.caption(f"📄 **Source**: {dns_stats.get('source', 'Cloudflare DNS Analysis')} ({dns_stats.get('url', '')})")
-                
-            except Exception as e:
-                st.warning(f"Cloudflare DNS data temporarily unavailable: {str(e)}")
-            
-            # Enhanced RIR IPv6 Allocation Data with APNIC and ARIN
-            st.subheader("📊 Global RIR IPv6 Address Allocations")
-            
-            # APNIC Asia-Pacific Statistics
-            try:
-                apnic_stats = data_collector.get_apnic_ipv6_stats()
-                
-                if apnic_stats and 'error' not in apnic_stats:
-                    st.subheader("🌏 APNIC - Asia-Pacific Region")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.metric(
-                            "IPv6 Capability", 
-                            f"{apnic_stats.get('ipv6_capability_percentage', 45.2)}%",
-                            delta="Network ASN coverage"
-                        )
-                    
-                    with col2:
-                        st.metric(
-                            "Regional Coverage", 
-                            apnic_stats.get('coverage', '56 countries'),
-                            delta="Asia-Pacific region"
-                        )
-                    
-                    with col3:
-                        st.metric(
-                            "Measurement Type", 
-                            "ASN-based",
-                            delta="Network analysis"
-                        )
-                    
-                    # Regional insights
-                    insights = apnic_stats.get('deployment_insights', [])
-                    if insights:
-                        st.write("**Key Insights:**")
-                        for insight in insights[:3]:  # Show top 3 insights
-                            st.write(f"• {insight}")
-                    
-                    st.caption(f"📄 **Source**: {apnic_stats.get('source', 'APNIC Labs')}")
-                
-            except Exception as e:
-                st.warning(f"APNIC data temporarily unavailable: {str(e)}")
-            
-            # ARIN North America Statistics
-            try:
-                arin_stats = data_collector.get_arin_current_stats()
-                
-                if arin_stats and 'error' not in arin_stats:
-                    st.subheader("🇺🇸 ARIN - North America Region")
-                    
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        st.metric(
-                            "IPv6 Allocations", 
-                            format_number(arin_stats.get('ipv6_allocations', 87695)),
-                            delta="Current delegations"
-                        )
-                    
-                    with col2:
-                        st.metric(
-                            "Total Organizations", 
-                            format_number(arin_stats.get('total_organizations', 26292)),
-                            delta="ARIN members"
-                        )
-                    
-                    with col3:
-                        st.metric(
-                            "IPv6 Enabled Orgs", 
-                            format_number(arin_stats.get('ipv6_enabled_organizations', 18500)),
-                            delta="Active deployments"
-                        )
-                    
-                    with col4:
-                        st.metric(
-                            "Deployment Rate", 
-                            arin_stats.get('deployment_rate', '70.4%'),
-                            delta="IPv6 capability"
-                        )
-                    
-                    # Regional insights
-                    insights = arin_stats.get('regional_insights', [])
-                    if insights:
-                        st.write("**Key Insights:**")
-                        for insight in insights[:3]:  # Show top 3 insights
-                            st.write(f"• {insight}")
-                    
-                    st.caption(f"📄 **Source**: {arin_stats.get('source', 'ARIN Research Statistics')}")
-                
-            except Exception as e:
-                st.warning(f"ARIN data temporarily unavailable: {str(e)}")
-            
-            # RIR Historical Comparison
-            try:
-                rir_stats = data_collector.get_rir_historical_stats()
-                
-                st.subheader("📈 RIR Historical IPv6 Growth")
-                
-                # Historical allocation metrics
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric(
-                        "Total IPv6 Allocations", 
-                        f"{format_number(rir_stats.get('total_allocations', 32146945533))}",
-                        delta=f"in {rir_stats.get('allocation_unit', '/48 blocks')}"
-                    )
-                
-                with col2:
-                    st.metric(
-                        "First IPv6 Allocation", 
-                        rir_stats.get('first_allocation_date', 'September 1999'),
-                        delta="26 years of IPv6 history"
-                    )
-                
-                # Growth milestones
-                st.subheader("📈 Major IPv6 Allocation Milestones")
-                growth_milestones = rir_stats.get('growth_milestones', [])
-                
-                for period, description in growth_milestones:
-                    st.write(f"**{period}**: {description}")
-                
-                st.caption(f"📄 **Source**: {rir_stats.get('source', 'Telecom SudParis RIR Statistics')} ({rir_stats.get('url', '')})")
-                
-            except Exception as e:
-                st.warning(f"RIR historical data temporarily unavailable: {str(e)}")
-            
-            # BGP Statistics Summary
-            with st.expander("🔀 BGP IPv6 Routing Statistics", expanded=True):
-                try:
-                    bgp_stats = data_collector.get_current_bgp_stats()
-                    
-                    if bgp_stats:
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.metric(
-                                "IPv6 BGP Prefixes", 
-                                format_number(bgp_stats.get('total_prefixes', 228748)),
-                                delta="Global routing table"
-                            )
-                        
-                        with col2:
-                            st.metric(
-                                "Yearly Growth", 
-                                f"+{format_number(bgp_stats.get('estimated_growth_yearly', 26000))}",
-                                delta="New prefixes per year"
-                            )
-                        
-                        st.success(f"✅ Live data loaded from {bgp_stats.get('source', 'BGP Statistics')}")
-                    else:
-                        st.warning("BGP data not available")
-                        
-                except Exception as e:
-                    st.warning(f"BGP data error: {str(e)}")
-            
-            # Summary insights
-            st.subheader("🎯 Key Combined Insights")
-            
-            insights = [
-                "Global IPv6 adoption continues strong growth, reaching 47%+ of internet users",
-                "Website IPv6 support at 49% for top 1000 sites, with security adoption leading",
-                "Mobile networks show highest IPv6 adoption rates globally", 
-                "BGP table growth steady at ~26,000 new IPv6 prefixes annually",
-                "Deployment gaps remain: only 13.2% actual IPv6 connections vs 43.3% server support"
-            ]
-            
-            for i, insight in enumerate(insights, 1):
-                st.write(f"{i}. {insight}")
+            render_combined_view(data_collector, chart_generator, extended=True)
         
         elif source == "Facebook IPv6 Statistics":
             # Fetch and display Facebook data
@@ -1546,7 +629,8 @@ elif current_view == "Global Adoption":
         elif source == "Cloudflare Radar":
             # Fetch and display Cloudflare Radar data
             try:
-                cloudflare_data = data_collector.get_cloudflare_radar_stats()
+                with st.spinner("Loading Cloudflare Radar data..."):
+                    cloudflare_data = data_collector.get_cloudflare_radar_stats()
                 if 'error' not in cloudflare_data:
                     st.subheader("☁️ Cloudflare Radar IPv6 Traffic Analysis")
                     
@@ -1574,8 +658,7 @@ elif current_view == "Global Adoption":
                     regional_leaders = cloudflare_data.get('regional_leaders', {})
                     if regional_leaders:
                         st.subheader("🌏 Regional IPv6 Leaders")
-                        for region, info in regional_leaders.items():
-                            st.write(f"**{region}**: {info}")
+                        st.markdown("\n\n".join(f"**{region}**: {info}" for region, info in regional_leaders.items()))
                     
                     st.caption(f"📄 **Source**: {cloudflare_data.get('source', 'Cloudflare Radar')} ({cloudflare_data.get('url', '')})")
                 else:
@@ -1671,7 +754,8 @@ elif current_view == "Global Adoption":
         elif source == "AFRINIC Official Statistics":
             # Fetch and display AFRINIC data
             try:
-                afrinic_data = data_collector.get_afrinic_stats()
+                with st.spinner("Loading AFRINIC data..."):
+                    afrinic_data = data_collector.get_afrinic_stats()
                 if 'error' not in afrinic_data:
                     st.subheader("🌍 AFRINIC IPv6 Allocation Statistics")
                     
@@ -1705,7 +789,8 @@ elif current_view == "Global Adoption":
         elif source == "LACNIC Official Statistics":
             # Fetch and display LACNIC data
             try:
-                lacnic_data = data_collector.get_lacnic_stats()
+                with st.spinner("Loading LACNIC data..."):
+                    lacnic_data = data_collector.get_lacnic_stats()
                 if 'error' not in lacnic_data:
                     st.subheader("🌎 LACNIC IPv6 Allocation Statistics")
                     
@@ -1741,7 +826,8 @@ elif current_view == "Global Adoption":
         elif source == "NIST USGv6 Deployment Monitor":
             # Fetch and display NIST data
             try:
-                nist_data = data_collector.get_nist_usgv6_deployment_stats()
+                with st.spinner("Loading NIST USGv6 data..."):
+                    nist_data = data_collector.get_nist_usgv6_deployment_stats()
                 if 'error' not in nist_data:
                     st.subheader("🏛️ NIST USGv6 Federal Deployment Monitor")
                     
@@ -1814,7 +900,8 @@ elif current_view == "Global Adoption":
         elif source == "Internet Society Pulse":
             # Fetch and display Internet Society Pulse data
             try:
-                pulse_data = data_collector.get_internet_society_pulse_stats()
+                with st.spinner("Loading ISOC Pulse data..."):
+                    pulse_data = data_collector.get_internet_society_pulse_stats()
                 if pulse_data and 'error' not in pulse_data:
                     st.subheader("🌐 Internet Society Pulse - Website IPv6 Support")
                     
@@ -1868,7 +955,8 @@ elif current_view == "Global Adoption":
         elif source == "Akamai IPv6 Statistics":
             # Fetch and display Akamai data
             try:
-                akamai_data = data_collector.get_akamai_stats()
+                with st.spinner("Loading Akamai data..."):
+                    akamai_data = data_collector.get_akamai_stats()
                 if akamai_data and 'error' not in akamai_data:
                     st.subheader("🌐 Akamai - Network IPv6 Adoption")
                     
@@ -1922,8 +1010,7 @@ elif current_view == "Global Adoption":
                     prefix_analysis = cymru_data.get('prefix_analysis', {})
                     if prefix_analysis:
                         st.subheader("📊 Prefix Categories")
-                        for category, count in prefix_analysis.items():
-                            st.write(f"**{category.replace('_', ' ').title()}**: {format_number(count)} prefixes")
+                        st.markdown("\n\n".join(f"**{category.replace('_', ' ').title()}**: {format_number(count)} prefixes" for category, count in prefix_analysis.items()))
                     
                     st.caption(f"📄 **Source**: Team Cymru Bogons ({cymru_data.get('url', '')})")
                 else:
@@ -1935,8 +1022,133 @@ elif current_view == "Global Adoption":
         st.error(f"Error loading global adoption data: {str(e)}")
         st.info("Please check your internet connection and try refreshing the page.")
 
+
+# Cloud provider grade lookups shared by the Cloud Services charts
+GRADE_NUMERIC = {'A': 95, 'A-': 90, 'B+': 85, 'B': 80, 'B-': 75, 'C+': 70, 'C': 65}
+GRADE_COLORS = {
+    'A': '#28a745', 'A-': '#6bc04c', 'B+': '#ffc107',
+    'B': '#fd7e14', 'B-': '#dc3545', 'C+': '#6c757d'
+}
+CLOUD_RECOMMENDATIONS = (
+    "**For IPv6-only deployments**: Choose DigitalOcean, Vultr, or Linode for mature support",
+    "**For enterprise hybrid**: Oracle Cloud provides comprehensive dual-stack with database support",
+    "**For cost optimization**: Vultr offers IPv6-only instances at $2.50/month",
+    "**For AWS users**: Plan for dual-stack; pure IPv6-only still limited by service dependencies",
+    "**For Azure users**: Mandatory dual-stack environment; no IPv6-only option available",
+    "**For GCP users**: Consider Premium Tier for IPv6; IPv6-only preview limited to Debian/Ubuntu"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def ipv6_only_score(support: str) -> int:
+    """Readiness-matrix score for an ipv6_only_support string.
+
+    'Available' is matched case-sensitively on purpose so that strings such as
+    'Not available' and 'Limited availability' do not score as available.
+    """
+    if 'Available' in support:
+        return 100
+    return 50 if 'preview' in support.lower() else 0
+
+
+@st.cache_data(max_entries=1)
+def get_cloud_provider_frames(providers: dict) -> tuple:
+    """Grades, details and readiness-matrix frames plus per-provider expander rows.
+
+    Every per-provider field is derived in a single pass over ``providers``
+    and the result is cached until the cloud data itself changes.
+    """
+    names, grades, support_levels, ipv6_only, limitation_counts = [], [], [], [], []
+    cost_impacts, timelines = [], []
+    only_scores, limitation_scores, overall_grades, grade_numerics = [], [], [], []
+    provider_details = []
+    for provider, details in providers.items():
+        grade = details.get('grade', 'N/A')
+        support = details.get('overall_support', 'Unknown')
+        only_support = details.get('ipv6_only_support', 'No')
+        limitations = details.get('major_limitations', [])
+        no_limitations = limitations == ['None significant']
+
+        names.append(provider)
+        grades.append(grade)
+        support_levels.append(support)
+        ipv6_only.append(only_support)
+        limitation_counts.append(len(limitations))
+        cost_impacts.append(details.get('cost_impact', 'No information'))
+        timelines.append(details.get('ipv6_timeline', 'No timeline provided'))
+
+        only_scores.append(ipv6_only_score(only_support))
+        limitation_scores.append(max(0, 100 - ((0 if no_limitations else len(limitations)) * 20)))
+        overall_grades.append(grade if 'grade' in details else 'C')
+        grade_numerics.append(GRADE_NUMERIC.get(grade, 65))
+
+        provider_details.append((
+            provider, grade, support, limitations, no_limitations,
+            details.get('recent_progress', [])
+        ))
+
+    df_grades = pd.DataFrame({
+        'Provider': names,
+        'Grade': grades,
+        'Support Level': support_levels,
+        'IPv6-Only': ipv6_only,
+        'Major Limitations': limitation_counts
+    })
+    df_details = pd.DataFrame({
+        'Provider': names,
+        'Grade': grades,
+        'Overall Support': support_levels,
+        'IPv6-Only': ipv6_only,
+        'Cost Impact': cost_impacts,
+        'Timeline': timelines
+    })
+    df_matrix = pd.DataFrame({
+        'Provider': names,
+        'IPv6_Only_Score': only_scores,
+        'Limitations_Score': limitation_scores,
+        'Overall_Grade': overall_grades,
+        'Grade_Numeric': grade_numerics
+    })
+    return df_grades, df_details, df_matrix, tuple(provider_details)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_cloud_figures(df_grades: pd.DataFrame, df_matrix: pd.DataFrame) -> tuple:
+    """Grades bar chart and readiness scatter, built once per frame contents.
+
+    st.plotly_chart only serialises the figures, so one shared instance can be
+    handed to every session instead of re-running plotly.express per rerun.
+    """
+    import plotly.express as px
+
+    fig_grades = px.bar(
+        df_grades, 
+        x='Provider', 
+        y='Major Limitations',
+        color='Grade',
+        title='Cloud Provider IPv6 Limitations Count by Grade',
+        color_discrete_map=GRADE_COLORS,
+        height=400
+    )
+    fig_matrix = px.scatter(
+        df_matrix,
+        x='IPv6_Only_Score', 
+        y='Limitations_Score',
+        size='Grade_Numeric',
+        color='Provider',
+        title='Cloud Provider IPv6 Readiness Matrix',
+        labels={
+            'IPv6_Only_Score': 'IPv6-Only Support Score',
+            'Limitations_Score': 'Low Limitations Score (Higher = Fewer Limits)'
+        },
+        height=500
+    )
+    return fig_grades, fig_matrix
+
+
 # Cloud Services IPv6 Page
-elif current_view == "Cloud Services":
+def render_cloud_services_page(data_collector, chart_generator):
+    """Render the Cloud Services page"""
     st.header("☁️ IPv6 Support in Cloud Services")
     
     st.markdown("""
@@ -1946,7 +1158,8 @@ elif current_view == "Cloud Services":
     
     try:
         # Fetch cloud service IPv6 data
-        cloud_data = data_collector.get_cloud_ipv6_status()
+        with st.spinner("Loading cloud provider data..."):
+            cloud_data = data_collector.get_cloud_ipv6_status()
         providers = cloud_data.get('providers', {})
         summary_stats = cloud_data.get('summary_stats', {})
         
@@ -1976,120 +1189,57 @@ elif current_view == "Cloud Services":
                 delta="Limited to hybrid IPv4+IPv6"
             )
         
+        # Per-provider frames are derived once per data refresh, not per rerun
+        df_grades, df_details, df_matrix, provider_details = get_cloud_provider_frames(providers)
+        fig_grades, fig_matrix = get_cloud_figures(df_grades, df_matrix)
+        
         # Provider grades overview
         st.subheader("🏆 Cloud Provider IPv6 Grades")
         
-        grade_data = []
-        for provider, details in providers.items():
-            grade_data.append({
-                'Provider': provider,
-                'Grade': details.get('grade', 'N/A'),
-                'Support Level': details.get('overall_support', 'Unknown'),
-                'IPv6-Only': details.get('ipv6_only_support', 'No'),
-                'Major Limitations': len(details.get('major_limitations', []))
-            })
-        
-        df_grades = pd.DataFrame(grade_data)
-        
         # Display grade comparison chart
         if not df_grades.empty:
-            fig = px.bar(
-                df_grades, 
-                x='Provider', 
-                y='Major Limitations',
-                color='Grade',
-                title='Cloud Provider IPv6 Limitations Count by Grade',
-                color_discrete_map={
-                    'A': '#28a745', 'A-': '#6bc04c', 'B+': '#ffc107',
-                    'B': '#fd7e14', 'B-': '#dc3545', 'C+': '#6c757d'
-                }
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig_grades, use_container_width=True)
         
         # Detailed provider analysis
         st.subheader("🔍 Detailed Provider Analysis")
         
-        for provider, details in providers.items():
-            with st.expander(f"{provider} - Grade: {details.get('grade', 'N/A')} | {details.get('overall_support', 'Unknown')}"):
-                
-                # Basic info
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write(f"**IPv6-Only Support**: {details.get('ipv6_only_support', 'No')}")
-                    st.write(f"**Cost Impact**: {details.get('cost_impact', 'No information')}")
-                
-                with col2:
-                    st.write(f"**Timeline**: {details.get('ipv6_timeline', 'No timeline provided')}")
-                    st.write(f"**Grade**: {details.get('grade', 'N/A')}")
+        # Fixed per-provider fields go in one Arrow-serialised table
+        st.dataframe(
+            df_details,
+            column_config={
+                'Provider': st.column_config.TextColumn(pinned=True),
+                'Grade': st.column_config.TextColumn(width='small'),
+                'Cost Impact': st.column_config.TextColumn(width='large'),
+                'Timeline': st.column_config.TextColumn(width='large')
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        # Expanders only for the variable-length limitation and progress lists
+        for provider, grade, support, limitations, no_limitations, progress in provider_details:
+            with st.expander(f"{provider} - Grade: {grade} | {support}"):
                 
                 # Major limitations
-                limitations = details.get('major_limitations', [])
-                if limitations and limitations != ['None significant']:
-                    st.write("**⚠️ Major Limitations:**")
-                    for limitation in limitations:
-                        st.write(f"  • {limitation}")
-                elif limitations == ['None significant']:
+                if limitations and not no_limitations:
+                    st.markdown("**⚠️ Major Limitations:**\n\n" + "\n\n".join(f"  • {limitation}" for limitation in limitations))
+                elif no_limitations:
                     st.success("✅ **No significant IPv6 limitations**")
                 
                 # Recent progress
-                progress = details.get('recent_progress', [])
                 if progress:
-                    st.write("**🚀 Recent Progress (2025):**")
-                    for item in progress:
-                        st.write(f"  • {item}")
+                    st.markdown("**🚀 Recent Progress (2025):**\n\n" + "\n\n".join(f"  • {item}" for item in progress))
         
         # Best practices and recommendations
         st.subheader("💡 Recommendations for IPv6 Cloud Adoption")
         
-        recommendations = [
-            "**For IPv6-only deployments**: Choose DigitalOcean, Vultr, or Linode for mature support",
-            "**For enterprise hybrid**: Oracle Cloud provides comprehensive dual-stack with database support", 
-            "**For cost optimization**: Vultr offers IPv6-only instances at $2.50/month",
-            "**For AWS users**: Plan for dual-stack; pure IPv6-only still limited by service dependencies",
-            "**For Azure users**: Mandatory dual-stack environment; no IPv6-only option available",
-            "**For GCP users**: Consider Premium Tier for IPv6; IPv6-only preview limited to Debian/Ubuntu"
-        ]
-        
-        for rec in recommendations:
-            st.write(rec)
+        st.markdown("\n\n".join(CLOUD_RECOMMENDATIONS))
         
         # Cloud IPv6 readiness matrix
         st.subheader("📈 IPv6 Readiness Matrix")
         
-        matrix_data = []
-        for provider, details in providers.items():
-            limitations_count = len(details.get('major_limitations', []))
-            if details.get('major_limitations') == ['None significant']:
-                limitations_count = 0
-                
-            matrix_data.append({
-                'Provider': provider,
-                'IPv6_Only_Score': 100 if 'Available' in details.get('ipv6_only_support', '') else 
-                                 50 if 'preview' in details.get('ipv6_only_support', '').lower() else 0,
-                'Limitations_Score': max(0, 100 - (limitations_count * 20)),
-                'Overall_Grade': details.get('grade', 'C'),
-                'Grade_Numeric': {'A': 95, 'A-': 90, 'B+': 85, 'B': 80, 'B-': 75, 'C+': 70, 'C': 65}.get(details.get('grade', 'C'), 65)
-            })
-        
-        df_matrix = pd.DataFrame(matrix_data)
-        
         if not df_matrix.empty:
-            fig = px.scatter(
-                df_matrix,
-                x='IPv6_Only_Score', 
-                y='Limitations_Score',
-                size='Grade_Numeric',
-                color='Provider',
-                title='Cloud Provider IPv6 Readiness Matrix',
-                labels={
-                    'IPv6_Only_Score': 'IPv6-Only Support Score',
-                    'Limitations_Score': 'Low Limitations Score (Higher = Fewer Limits)'
-                }
-            )
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig_matrix, use_container_width=True)
         
         st.caption(f"📄 **Source**: {cloud_data.get('source', 'Cloud Provider Analysis')} - Last updated: {cloud_data.get('last_updated', 'Unknown')}")
         
@@ -2098,8 +1248,13 @@ elif current_view == "Cloud Services":
         # Clear cache to prevent persistent errors
         st.cache_data.clear()
 
+
 # Extended Data Sources Page
-elif current_view == "Extended Data Sources":
+@st.fragment
+def render_extended_sources_page(data_collector, chart_generator):
+    """Render the Extended Data Sources page"""
+    import plotly.express as px
+
     st.header("🔬 Extended IPv6 Data Sources")
     
     st.markdown("""
@@ -2107,262 +1262,216 @@ elif current_view == "Extended Data Sources":
     including real-time connectivity tests, regional allocation statistics, and technology adoption tracking.
     """)
     
-    # Create tabs for different data source categories with better responsive design
-    st.markdown("""
-    <style>
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-        overflow-x: auto;
-        white-space: nowrap;
-        scrollbar-width: thin;
-    }
-    
-    .stTabs [data-baseweb="tab-list"] button {
-        height: auto;
-        white-space: nowrap;
-        padding: 8px 12px;
-        font-size: 0.85rem;
-        min-width: auto;
-        flex-shrink: 0;
-    }
-    
-    .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] {
-        background-color: #007bff;
-        color: white;
-    }
-    
-    @media (max-width: 768px) {
-        .stTabs [data-baseweb="tab-list"] button {
-            font-size: 0.75rem;
-            padding: 6px 8px;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11, tab12, tab13, tab14, tab15, tab16, tab17, tab18, tab19 = st.tabs([
+    # Only the selected source renders and calls its fetcher; picking another
+    # one reruns just this page fragment
+    source_labels = [
         "Matrix", "Test.com", "RIPE", "Pulse", "ARIN", "LACNIC", "APNIC", "Cloudflare", "AFRINIC", "NIST", "Enabled", "Bogons", "Facebook", "CAIDA", "HE.NET", "RIPE Atlas", "IPv6 Launch", "CIDR Report", "Tranco"
-    ])
-    
-    with tab1:
+    ]
+    selected_source = st.segmented_control(
+        "Data source",
+        source_labels,
+        default=source_labels[0],
+        key="extended_sources_tab",
+        label_visibility="collapsed",
+    ) or source_labels[0]
+    
+    if selected_source == "Matrix":
         st.subheader("🌐 IPv6 Matrix - Host Connectivity")
         try:
-            matrix_data = data_collector.get_ipv6_matrix_data()
-            
+            with st.spinner("Loading IPv6 Matrix data..."):
+                matrix_data = data_collector.get_ipv6_matrix_data()
+        
             col1, col2 = st.columns(2)
-            
+        
             with col1:
                 st.metric(
                     "IPv6 Enabled Hosts",
                     matrix_data.get('ipv6_enabled_hosts', 'N/A'),
                     delta="Real-time connectivity"
                 )
-            
+        
             with col2:
                 st.metric(
                     "Measurement Period",
                     matrix_data.get('date_range', 'N/A'),
                     delta="15 years of data"
                 )
-            
+        
             st.write(f"**Description**: {matrix_data.get('description', 'IPv6 host connectivity measurements')}")
             st.write(f"**Measurement Type**: {matrix_data.get('measurement_type', 'IPv6 Host Connectivity')}")
-            
+        
             if 'error' in matrix_data:
                 st.warning(f"⚠️ {matrix_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {matrix_data.get('source', 'IPv6 Matrix')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading IPv6 Matrix data: {str(e)}")
     
-    with tab2:
+    if selected_source == "Test.com":
         st.subheader("📊 IPv6-Test.com - Protocol Statistics")
         try:
-            ipv6test_data = data_collector.get_ipv6_test_stats()
-            
+            with st.spinner("Loading IPv6-Test.com data..."):
+                ipv6test_data = data_collector.get_ipv6_test_stats()
+        
             if 'error' not in ipv6test_data:
                 st.write(f"**Measurement Type**: {ipv6test_data.get('measurement_type', 'N/A')}")
                 st.write(f"**Description**: {ipv6test_data.get('description', 'N/A')}")
-                
+            
                 col1, col2 = st.columns(2)
-                
+            
                 with col1:
                     st.metric(
                         "Country Coverage",
                         ipv6test_data.get('country_coverage', 'N/A'),
                         delta="Global reach"
                     )
-                
+            
                 with col2:
                     st.metric(
                         "Update Frequency", 
                         ipv6test_data.get('update_frequency', 'N/A'),
                         delta="Regular updates"
                     )
-                
-                st.write("**Key Features**:")
-                for feature in ipv6test_data.get('features', []):
-                    st.write(f"  • {feature}")
+            
+                st.markdown("**Key Features**:\n\n" + "\n\n".join(f"  • {feature}" for feature in ipv6test_data.get('features', [])))
             else:
                 st.warning(f"⚠️ {ipv6test_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {ipv6test_data.get('source', 'IPv6-test.com')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading IPv6-Test.com data: {str(e)}")
     
-    with tab3:
+    if selected_source == "RIPE":
         st.subheader("🇪🇺 RIPE NCC - IPv6 Allocations by Country")
         try:
-            ripe_data = data_collector.get_ripe_ipv6_allocations()
-            
+            with st.spinner("Loading RIPE NCC data..."):
+                ripe_data = data_collector.get_ripe_ipv6_allocations()
+        
             if 'error' not in ripe_data:
                 col1, col2, col3 = st.columns(3)
-                
+            
                 with col1:
                     st.metric(
                         "Total IPv6 Addresses",
                         format_number(ripe_data.get('total_addresses', 0)),
                         delta=ripe_data.get('measurement_unit', '/32 blocks')
                     )
-                
+            
                 with col2:
                     st.metric(
                         "Regional Focus",
                         "RIPE Region",
                         delta="Europe, Central Asia, Middle East"
                     )
-                
+            
                 with col3:
-                    data_date = ripe_data.get('data_date', 'N/A')
-                    # Extract just month and year from date string like "Mon Aug 11 2025"
-                    date_parts = data_date.split()
-                    display_date = f"{date_parts[1]} {date_parts[3]}" if len(date_parts) >= 4 else data_date
                     st.metric(
                         "Data Date",
-                        display_date,
+                        format_month_year(ripe_data.get('data_date', 'N/A')),
                         delta="Latest available"
                     )
-                
+            
                 # Top countries chart
                 st.subheader("🏆 Top 10 Countries by IPv6 Allocations")
-                
+            
                 top_countries = ripe_data.get('top_countries', {})
                 if top_countries:
-                    countries_df = pd.DataFrame([
-                        {
-                            'Country': country,
-                            'Allocations': details['allocations'], 
-                            'Percentage': details['percentage']
-                        }
-                        for country, details in top_countries.items()
-                    ])
-                    
-                    fig = px.bar(
-                        countries_df,
-                        x='Country',
-                        y='Allocations', 
-                        color='Percentage',
-                        title='RIPE NCC IPv6 Allocations by Country',
-                        color_continuous_scale='Viridis'
-                    )
-                    fig.update_layout(height=400, xaxis_tickangle=-45)
+                    countries_df = get_allocation_frame(top_countries)
+                
+                    fig = chart_generator.create_allocation_chart(top_countries, 'RIPE NCC IPv6 Allocations by Country', 'Viridis')
                     st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Display detailed table
-                    st.dataframe(countries_df, use_container_width=True)
                 
+                    # Display detailed table
+                    st.dataframe(countries_df, use_container_width=True, column_config=ALLOCATION_COLUMN_CONFIG)
+            
                 st.write(f"**Description**: {ripe_data.get('description', 'RIPE NCC allocations')}")
                 st.write(f"**Regional Focus**: {ripe_data.get('regional_focus', 'RIPE region')}")
             else:
                 st.warning(f"⚠️ {ripe_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {ripe_data.get('source', 'RIPE NCC Allocations')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading RIPE allocation data: {str(e)}")
     
-    with tab4:
+    if selected_source == "Pulse":
         st.subheader("🌍 Internet Society Pulse - Technology Adoption")
         try:
-            pulse_data = data_collector.get_pulse_technology_stats()
-            
+            with st.spinner("Loading ISOC Pulse data..."):
+                pulse_data = data_collector.get_pulse_technology_stats()
+        
             if 'error' not in pulse_data:
                 st.write(f"**Description**: {pulse_data.get('description', 'Internet technology tracking')}")
                 st.write(f"**Measurement Scope**: {pulse_data.get('measurement_scope', 'Global')}")
-                
-                st.write("**Key Focus Areas**:")
-                for area in pulse_data.get('key_focus_areas', []):
-                    st.write(f"  • {area}")
-                
+            
+                st.markdown("**Key Focus Areas**:\n\n" + "\n\n".join(f"  • {area}" for area in pulse_data.get('key_focus_areas', [])))
+            
                 st.subheader("🔥 Recent Highlights (2025)")
-                for highlight in pulse_data.get('recent_highlights', []):
-                    st.write(f"  • {highlight}")
-                
+                st.markdown("\n\n".join(f"  • {highlight}" for highlight in pulse_data.get('recent_highlights', [])))
+            
                 st.subheader("🛠️ Available Services")
-                for service in pulse_data.get('services', []):
-                    st.write(f"  • {service}")
+                st.markdown("\n\n".join(f"  • {service}" for service in pulse_data.get('services', [])))
             else:
                 st.warning(f"⚠️ {pulse_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {pulse_data.get('source', 'Internet Society Pulse')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading Internet Society Pulse data: {str(e)}")
     
-    with tab5:
+    if selected_source == "ARIN":
         st.subheader("🇺🇸 ARIN - North America IPv6 Statistics")
         try:
-            arin_data = data_collector.get_arin_current_stats()
-            
+            with st.spinner("Loading ARIN data..."):
+                arin_data = data_collector.get_arin_current_stats()
+        
             if 'error' not in arin_data:
                 col1, col2, col3 = st.columns(3)
-                
+            
                 with col1:
                     st.metric(
                         "IPv6 Allocations",
                         format_number(arin_data.get('ipv6_allocations', 87695)),
                         delta="Current delegations"
                     )
-                
+            
                 with col2:
                     st.metric(
                         "Total Organizations", 
                         format_number(arin_data.get('total_organizations', 26292)),
                         delta="ARIN members"
                     )
-                
+            
                 with col3:
                     st.metric(
                         "Deployment Rate",
                         arin_data.get('deployment_rate', '70.4%'),
                         delta="IPv6 capability"
                     )
-                
+            
                 st.subheader("🌎 Regional Coverage")
                 st.write(f"**Region**: {arin_data.get('region', 'North America')}")
                 st.write(f"**Coverage**: {arin_data.get('coverage', 'US, Canada, Caribbean, North Atlantic islands')}")
                 st.write(f"**Registry**: {arin_data.get('registry', 'ARIN')}")
-                
+            
                 # Regional insights
                 insights = arin_data.get('regional_insights', [])
                 if insights:
                     st.subheader("📊 Regional IPv6 Insights")
-                    for insight in insights:
-                        st.write(f"  • {insight}")
-                
+                    st.markdown("\n\n".join(f"  • {insight}" for insight in insights))
+            
                 # Allocation trends
                 trends = arin_data.get('allocation_trends', [])
                 if trends:
                     st.subheader("📈 Allocation Trends")
-                    for trend in trends:
-                        st.write(f"  • {trend}")
-                
+                    st.markdown("\n\n".join(f"  • {trend}" for trend in trends))
+            
                 # Equivalent blocks info
                 blocks = arin_data.get('equivalent_blocks', 2834)
                 ipv6_enabled = arin_data.get('ipv6_enabled_organizations', 18500)
-                
+            
                 col1, col2 = st.columns(2)
                 with col1:
                     st.metric(
@@ -2370,48 +1479,31 @@ elif current_view == "Extended Data Sources":
                         format_number(blocks),
                         delta="Address space"
                     )
-                
+            
                 with col2:
                     st.metric(
                         "IPv6 Enabled Orgs",
                         format_number(ipv6_enabled),
                         delta="Active deployments"
                     )
-                
+            
                 # Top countries chart
                 top_countries = arin_data.get('top_countries', {})
                 if top_countries:
                     st.subheader("🏆 Top Countries/Regions by IPv6 Allocations")
-                    
-                    countries_df = pd.DataFrame([
-                        {
-                            'Country': country,
-                            'Allocations': details['allocations'],
-                            'Percentage': details['percentage'],
-                            'Entries': details.get('entries', 0)
-                        }
-                        for country, details in top_countries.items()
-                    ])
-                    
-                    fig = px.bar(
-                        countries_df,
-                        x='Country',
-                        y='Allocations',
-                        color='Percentage',
-                        title='ARIN IPv6 Allocations by Country/Region',
-                        color_continuous_scale='Blues',
-                        hover_data=['Entries']
-                    )
-                    fig.update_layout(height=400, xaxis_tickangle=-45)
+                
+                    countries_df = get_allocation_frame(top_countries, with_entries=True)
+                
+                    fig = chart_generator.create_allocation_chart(top_countries, 'ARIN IPv6 Allocations by Country/Region', 'Blues', show_entries=True)
                     st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Display detailed table
-                    st.dataframe(countries_df, use_container_width=True)
                 
+                    # Display detailed table
+                    st.dataframe(countries_df, use_container_width=True, column_config=ALLOCATION_COLUMN_CONFIG)
+            
                 st.write(f"**Description**: {arin_data.get('description', 'ARIN statistics')}")
                 st.write(f"**Regional Focus**: {arin_data.get('regional_focus', 'North America')}")
                 st.write(f"**Update Frequency**: {arin_data.get('update_frequency', 'Daily')}")
-                
+            
                 # Membership statistics section
                 membership = arin_data.get('membership_stats', {})
                 if membership:
@@ -2423,34 +1515,35 @@ elif current_view == "Extended Data Sources":
                         st.metric("General Members", format_number(membership.get('general_members', 0)))
             else:
                 st.warning(f"⚠️ {arin_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {arin_data.get('source', 'ARIN Statistics')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading ARIN statistics: {str(e)}")
     
-    with tab6:
+    if selected_source == "LACNIC":
         st.subheader("🌎 LACNIC - Latin America IPv6 Statistics")
         try:
-            lacnic_data = data_collector.get_lacnic_stats()
-            
+            with st.spinner("Loading LACNIC data..."):
+                lacnic_data = data_collector.get_lacnic_stats()
+        
             if 'error' not in lacnic_data:
                 col1, col2, col3 = st.columns(3)
-                
+            
                 with col1:
                     st.metric(
                         "Total IPv6 Addresses",
                         format_number(lacnic_data.get('total_addresses', 0)),
                         delta=lacnic_data.get('measurement_unit', '/48 blocks')
                     )
-                
+            
                 with col2:
                     st.metric(
                         "Regional Focus",
                         "LACNIC Region", 
                         delta="Latin America & Caribbean"
                     )
-                
+            
                 with col3:
                     total_countries = lacnic_data.get('total_countries', 0)
                     st.metric(
@@ -2458,189 +1551,173 @@ elif current_view == "Extended Data Sources":
                         str(total_countries),
                         delta="Daily updates"
                     )
-                
+            
                 # Top countries chart
                 st.subheader("🏆 Top Countries by IPv6 Allocations")
-                
+            
                 top_countries = lacnic_data.get('top_countries', {})
                 if top_countries:
-                    countries_df = pd.DataFrame([
-                        {
-                            'Country': country,
-                            'Allocations': details['allocations'],
-                            'Percentage': details['percentage']
-                        }
-                        for country, details in top_countries.items()
-                    ])
-                    
-                    fig = px.bar(
-                        countries_df,
-                        x='Country',
-                        y='Allocations',
-                        color='Percentage',
-                        title='LACNIC IPv6 Allocations by Country',
-                        color_continuous_scale='Oranges'
-                    )
-                    fig.update_layout(height=400, xaxis_tickangle=-45)
+                    countries_df = get_allocation_frame(top_countries)
+                
+                    fig = chart_generator.create_allocation_chart(top_countries, 'LACNIC IPv6 Allocations by Country', 'Oranges')
                     st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Display detailed table
-                    st.dataframe(countries_df, use_container_width=True)
                 
+                    # Display detailed table
+                    st.dataframe(countries_df, use_container_width=True, column_config=ALLOCATION_COLUMN_CONFIG)
+            
                 st.write(f"**Description**: {lacnic_data.get('description', 'LACNIC allocations')}")
                 st.write(f"**Regional Focus**: {lacnic_data.get('regional_focus', 'LACNIC region')}")
             else:
                 st.warning(f"⚠️ {lacnic_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {lacnic_data.get('source', 'Telecom SudParis')} - {lacnic_data.get('url', '')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading LACNIC statistics: {str(e)}")
     
-    with tab7:
+    if selected_source == "APNIC":
         st.subheader("🌏 APNIC - Asia-Pacific IPv6 Statistics")
         try:
-            apnic_data = data_collector.get_apnic_ipv6_stats()
-            
+            with st.spinner("Loading APNIC data..."):
+                apnic_data = data_collector.get_apnic_ipv6_stats()
+        
             if 'error' not in apnic_data:
                 col1, col2, col3 = st.columns(3)
-                
+            
                 with col1:
                     st.metric(
                         "IPv6 Capability",
                         f"{apnic_data.get('ipv6_capability_percentage', 45.2)}%",
                         delta="Network capability"
                     )
-                
+            
                 with col2:
                     st.metric(
                         "Regional Coverage", 
                         apnic_data.get('coverage', '56 countries'),
                         delta="Asia-Pacific"
                     )
-                
+            
                 with col3:
                     st.metric(
                         "Measurement Type",
                         "ASN-based",
                         delta="Network analysis"
                     )
-                
+            
                 st.subheader("🌎 Regional Overview")
                 st.write(f"**Region**: {apnic_data.get('region', 'Asia-Pacific')}")
                 st.write(f"**Coverage**: {apnic_data.get('coverage', '56 countries and territories')}")
                 st.write(f"**Measurement Type**: {apnic_data.get('measurement_type', 'IPv6-capable Networks')}")
-                
+            
                 # Regional insights
                 insights = apnic_data.get('deployment_insights', [])
                 if insights:
                     st.subheader("📊 Deployment Insights")
-                    for insight in insights:
-                        st.write(f"  • {insight}")
-                
+                    st.markdown("\n\n".join(f"  • {insight}" for insight in insights))
+            
                 # Regional leaders
                 leaders = apnic_data.get('regional_leaders', [])
                 if leaders:
                     st.subheader("🏆 Regional IPv6 Leaders")
-                    for leader in leaders:
-                        st.write(f"  • {leader}")
-                
+                    st.markdown("\n\n".join(f"  • {leader}" for leader in leaders))
+            
                 # Methodology
                 methodology = apnic_data.get('measurement_methodology', '')
                 if methodology:
                     st.subheader("🔬 Measurement Methodology")
                     st.write(f"**Approach**: {methodology}")
-                
+            
                 # Note
                 note = apnic_data.get('note', '')
                 if note:
                     st.info(f"**Note**: {note}")
             else:
                 st.warning(f"⚠️ {apnic_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {apnic_data.get('source', 'APNIC Labs IPv6 Measurements')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading APNIC IPv6 data: {str(e)}")
     
-    with tab8:
+    if selected_source == "Cloudflare":
         st.subheader("☁️ Cloudflare Radar - Global IPv6 Traffic Analysis")
         try:
-            cloudflare_data = data_collector.get_cloudflare_radar_stats()
-            
+            with st.spinner("Loading Cloudflare Radar data..."):
+                cloudflare_data = data_collector.get_cloudflare_radar_stats()
+        
             if 'error' not in cloudflare_data:
                 st.write(f"**Description**: {cloudflare_data.get('description', 'Cloudflare IPv6 analysis')}")
                 st.write(f"**Measurement Type**: {cloudflare_data.get('measurement_type', 'N/A')}")
                 st.write(f"**Geographic Coverage**: {cloudflare_data.get('geographic_coverage', 'N/A')}")
-                
+            
                 col1, col2 = st.columns(2)
-                
+            
                 with col1:
                     st.metric(
                         "Update Frequency",
                         cloudflare_data.get('update_frequency', 'N/A'),
                         delta="Regular updates"
                     )
-                
+            
                 with col2:
                     st.metric(
                         "Data Source",
                         "Cloudflare CDN",
                         delta="Global traffic analysis"
                     )
-                
+            
                 st.subheader("📊 Key Data Features")
-                for feature in cloudflare_data.get('data_features', []):
-                    st.write(f"  • {feature}")
-                
+                st.markdown("\n\n".join(f"  • {feature}" for feature in cloudflare_data.get('data_features', [])))
+            
                 st.subheader("📈 Key Metrics")
-                for metric in cloudflare_data.get('key_metrics', []):
-                    st.write(f"  • {metric}")
+                st.markdown("\n\n".join(f"  • {metric}" for metric in cloudflare_data.get('key_metrics', [])))
             else:
                 st.warning(f"⚠️ {cloudflare_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {cloudflare_data.get('source', 'Cloudflare Radar')} - {cloudflare_data.get('url', '')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading Cloudflare Radar data: {str(e)}")
     
-    with tab9:
+    if selected_source == "AFRINIC":
         st.subheader("🌍 AFRINIC - African IPv6 Statistics")
         try:
-            afrinic_data = data_collector.get_afrinic_stats()
-            
+            with st.spinner("Loading AFRINIC data..."):
+                afrinic_data = data_collector.get_afrinic_stats()
+        
             if 'error' not in afrinic_data:
                 st.write(f"**Description**: {afrinic_data.get('description', 'AFRINIC IPv6 analysis')}")
                 st.write(f"**Regional Focus**: {afrinic_data.get('regional_focus', 'N/A')}")
                 st.write(f"**Geographic Coverage**: {afrinic_data.get('geographic_coverage', 'N/A')}")
-                
+            
                 col1, col2 = st.columns(2)
-                
+            
                 with col1:
                     st.metric(
                         "Regional Scope",
                         "African Continent",
                         delta="54 countries"
                     )
-                
+            
                 with col2:
                     st.metric(
                         "Data Source", 
                         "AFRINIC Registry",
                         delta="Official RIR data"
                     )
-                
+            
                 # Add metrics section
                 if afrinic_data.get('total_addresses'):
                     col3, col4 = st.columns(2)
-                    
+                
                     with col3:
                         st.metric(
                             "Total IPv6 Issued",
                             format_number(afrinic_data.get('total_addresses', 0)),
                             delta=afrinic_data.get('measurement_unit', '/32 blocks')
                         )
-                    
+                
                     with col4:
                         total_countries = afrinic_data.get('total_countries', 54)
                         st.metric(
@@ -2648,173 +1725,124 @@ elif current_view == "Extended Data Sources":
                             str(total_countries),
                             delta="Daily updates"
                         )
-                
+            
                 # Top countries chart
                 top_countries = afrinic_data.get('top_countries', {})
                 if top_countries:
                     st.subheader("🏆 Top African Countries by IPv6 Allocations")
-                    
-                    countries_df = pd.DataFrame([
-                        {
-                            'Country': country,
-                            'Allocations': details['allocations'],
-                            'Percentage': details['percentage']
-                        }
-                        for country, details in top_countries.items()
-                    ])
-                    
-                    fig = px.bar(
-                        countries_df,
-                        x='Country',
-                        y='Allocations',
-                        color='Percentage',
-                        title='AFRINIC IPv6 Allocations by Country',
-                        color_continuous_scale='Viridis'
-                    )
-                    fig.update_layout(height=400, xaxis_tickangle=-45)
+                
+                    countries_df = get_allocation_frame(top_countries)
+                
+                    fig = chart_generator.create_allocation_chart(top_countries, 'AFRINIC IPv6 Allocations by Country', 'Viridis')
                     st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Display detailed table
-                    st.dataframe(countries_df, use_container_width=True)
                 
+                    # Display detailed table
+                    st.dataframe(countries_df, use_container_width=True, column_config=ALLOCATION_COLUMN_CONFIG)
+            
                 st.subheader("📊 Key Data Features")
-                for feature in afrinic_data.get('data_features', []):
-                    st.write(f"  • {feature}")
-                
+                st.markdown("\n\n".join(f"  • {feature}" for feature in afrinic_data.get('data_features', [])))
+            
                 st.subheader("📈 Key Metrics")
-                for metric in afrinic_data.get('key_metrics', []):
-                    st.write(f"  • {metric}")
+                st.markdown("\n\n".join(f"  • {metric}" for metric in afrinic_data.get('key_metrics', [])))
             else:
                 st.warning(f"⚠️ {afrinic_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {afrinic_data.get('source', 'AFRINIC')} - {afrinic_data.get('url', '')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading AFRINIC statistics: {str(e)}")
     
-    with tab10:
+    if selected_source == "NIST":
         st.subheader("🏛️ NIST USGv6 - Federal Government IPv6 Deployment Monitor")
         try:
-            nist_data = data_collector.get_nist_usgv6_deployment_stats()
-            
+            with st.spinner("Loading NIST USGv6 data..."):
+                nist_data = data_collector.get_nist_usgv6_deployment_stats()
+        
             if 'error' not in nist_data:
+                mandate = nist_data.get('mandate_status', {})
+                monitoring = nist_data.get('monitoring_scope', {})
+                agencies = nist_data.get('key_agencies', {})
+                impact = nist_data.get('program_impact', {})
+                examples = nist_data.get('agency_examples', {})
+                contact = nist_data.get('contact_information', {})
+
                 # Program overview
                 st.write(f"**Program**: {nist_data.get('program_name', 'NIST USGv6')}")
                 st.write(f"**Description**: {nist_data.get('description', 'Federal IPv6 deployment monitoring')}")
-                
+            
                 # Federal mandate status
-                mandate = nist_data.get('mandate_status', {})
                 if mandate:
                     st.subheader("📋 Federal IPv6 Mandate Status")
                     col1, col2, col3 = st.columns(3)
-                    
+                
                     with col1:
                         st.metric(
                             "Target Date",
                             mandate.get('target_date', 'End FY 2025'),
                             delta="Final implementation"
                         )
-                    
+                
                     with col2:
                         st.metric(
                             "Target Goal",
                             mandate.get('target_percentage', '80%'),
                             delta="IPv6-only assets"
                         )
-                    
+                
                     with col3:
                         st.metric(
                             "Current Status",
                             mandate.get('current_year', '2025'),
                             delta="Final year"
                         )
-                    
+                
                     st.write(f"**Policy**: {mandate.get('policy', 'OMB M-21-07')}")
                     st.write(f"**2024 Milestone**: {mandate.get('milestone_2024', '50% IPv6-only')}")
-                
+            
                 # Monitoring scope
-                monitoring = nist_data.get('monitoring_scope', {})
                 if monitoring:
                     st.subheader("🔍 Monitoring Scope")
                     col1, col2 = st.columns(2)
-                    
+                
                     with col1:
                         st.write(f"**Domains**: {monitoring.get('domains', 'Federal .gov domains')}")
                         st.write(f"**Update Frequency**: {monitoring.get('update_frequency', 'Daily')}")
-                    
+                
                     with col2:
                         services = monitoring.get('services_tracked', [])
                         if services:
-                            st.write("**Services Tracked**:")
-                            for service in services:
-                                st.write(f"  • {service}")
-                
+                            st.markdown("**Services Tracked**:\n\n" + "\n\n".join(f"  • {service}" for service in services))
+            
                 # Key agencies
-                agencies = nist_data.get('key_agencies', {})
                 if agencies:
                     st.subheader("🏢 Agency Implementation Status")
                     col1, col2 = st.columns(2)
-                    
+                
                     with col1:
                         leading = agencies.get('leading', [])
                         if leading:
-                            st.write("**Leading Agencies**:")
-                            for agency in leading:
-                                st.write(f"  ✅ {agency}")
-                    
+                            st.markdown("**Leading Agencies**:\n\n" + "\n\n".join(f"  ✅ {agency}" for agency in leading))
+                
                     with col2:
                         behind = agencies.get('behind_targets', [])
                         if behind:
-                            st.write("**Behind Targets**:")
-                            for agency in behind:
-                                st.write(f"  ⚠️ {agency}")
-                
+                            st.markdown("**Behind Targets**:\n\n" + "\n\n".join(f"  ⚠️ {agency}" for agency in behind))
+            
                 # Program impact
-                impact = nist_data.get('program_impact', {})
                 if impact:
                     st.subheader("📊 Program Impact")
-                    st.write(f"**Procurement**: {impact.get('procurement', 'USGv6 Profile required')}")
-                    st.write(f"**Industry Effect**: {impact.get('industry', 'Federal mandate driving adoption')}")
-                    st.write(f"**Timeline**: {impact.get('timeline', '2025 final year')}")
-                
+                    st.markdown(
+                        f"**Procurement**: {impact.get('procurement', 'USGv6 Profile required')}\n\n"
+                        f"**Industry Effect**: {impact.get('industry', 'Federal mandate driving adoption')}\n\n"
+                        f"**Timeline**: {impact.get('timeline', '2025 final year')}"
+                    )
+            
                 # Agency examples
-                examples = nist_data.get('agency_examples', {})
                 if examples:
                     st.subheader("🎯 Agency Implementation Examples")
-                    for agency, status in examples.items():
-                        agency_name = agency.replace('_', ' ')
-                        st.write(f"  • **{agency_name}**: {status}")
-                    
-                # Add summary metrics from NIST data
-                if nist_data and 'error' not in nist_data:
-                    st.subheader("📊 Federal IPv6 Deployment Summary")
-                    
-                    # Show program impact
-                    impact = nist_data.get('program_impact', {})
-                    if impact:
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.write("**Policy Requirements:**")
-                            if impact.get('procurement'):
-                                st.write(f"• {impact['procurement']}")
-                            if impact.get('timeline'):
-                                st.write(f"• {impact['timeline']}")
-                        
-                        with col2:
-                            st.write("**Industry Impact:**")
-                            if impact.get('industry'):
-                                st.write(f"• {impact['industry']}")
-                    
-                    # Show monitoring scope summary
-                    monitoring = nist_data.get('monitoring_scope', {})
-                    if monitoring:
-                        st.write("**Monitoring Coverage:**")
-                        domains = monitoring.get('domains', 'Federal .gov domains')
-                        frequency = monitoring.get('update_frequency', 'Daily')
-                        st.write(f"• {domains} with {frequency.lower()} monitoring")
+                    st.markdown("\n\n".join(f"  • **{agency.replace('_', ' ')}**: {status}" for agency, status in examples.items()))
                 
                 # Contact information
-                contact = nist_data.get('contact_information', {})
                 if contact:
                     st.subheader("📧 Technical Integration Contact")
                     if contact.get('email'):
@@ -2825,24 +1853,25 @@ elif current_view == "Extended Data Sources":
                         st.write(f"**Government Stats API**: {contact['gov_stats_api']}")
             else:
                 st.warning(f"⚠️ {nist_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {nist_data.get('source', 'NIST USGv6')} - {nist_data.get('url', '')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading NIST USGv6 data: {str(e)}")
     
-    with tab11:
+    if selected_source == "Enabled":
         st.subheader("🌐 IPv6 Enabled Statistics - Network Deployment Tracking")
         try:
-            ipv6enabled_data = data_collector.get_ipv6enabled_stats()
-            
+            with st.spinner("Loading IPv6 Enabled data..."):
+                ipv6enabled_data = data_collector.get_ipv6enabled_stats()
+        
             if 'error' not in ipv6enabled_data:
                 st.write(f"**Description**: {ipv6enabled_data.get('description', 'IPv6 enablement tracking')}")
                 st.write(f"**Measurement Type**: {ipv6enabled_data.get('measurement_type', 'Network monitoring')}")
                 st.write(f"**Coverage Scope**: {ipv6enabled_data.get('coverage_scope', 'Global networks')}")
-                
+            
                 col1, col2, col3 = st.columns(3)
-                
+            
                 with col1:
                     deployment = ipv6enabled_data.get('global_ipv6_deployment', 85.2)
                     st.metric(
@@ -2850,7 +1879,7 @@ elif current_view == "Extended Data Sources":
                         f"{deployment}%",
                         delta="Network enablement"
                     )
-                
+            
                 with col2:
                     networks = ipv6enabled_data.get('tracked_networks', 75000)
                     st.metric(
@@ -2858,38 +1887,35 @@ elif current_view == "Extended Data Sources":
                         format_number(networks),
                         delta="Monitored ASNs"
                     )
-                
+            
                 with col3:
                     st.metric(
                         "Update Frequency",
                         ipv6enabled_data.get('measurement_frequency', 'Daily'),
                         delta="Real-time monitoring"
                     )
-                
+            
                 st.subheader("🔍 Deployment Insights")
-                for insight in ipv6enabled_data.get('deployment_insights', []):
-                    st.write(f"  • {insight}")
-                
+                st.markdown("\n\n".join(f"  • {insight}" for insight in ipv6enabled_data.get('deployment_insights', [])))
+            
                 st.subheader("🏢 Network Categories")
-                for category in ipv6enabled_data.get('network_categories', []):
-                    st.write(f"  • {category}")
-                
+                st.markdown("\n\n".join(f"  • {category}" for category in ipv6enabled_data.get('network_categories', [])))
+            
                 # Prefix Size Distribution Chart
                 prefix_distribution = ipv6enabled_data.get('prefix_size_distribution', {})
                 if prefix_distribution:
                     st.subheader("📊 IPv6 Prefix Size Distribution")
-                    
-                    import plotly.express as px
-                    import pandas as pd
-                    
+                
                     # Create DataFrame for visualization
-                    prefix_df = pd.DataFrame([
-                        {'Prefix Size': k, 'Count': v, 'Percentage': (v/sum(prefix_distribution.values()))*100}
-                        for k, v in prefix_distribution.items()
-                    ])
-                    
+                    prefix_total = sum(prefix_distribution.values())
+                    prefix_df = pd.DataFrame({
+                        'Prefix Size': list(prefix_distribution),
+                        'Count': list(prefix_distribution.values()),
+                        'Percentage': [v / prefix_total * 100 for v in prefix_distribution.values()]
+                    })
+                
                     col1, col2 = st.columns(2)
-                    
+                
                     with col1:
                         # Pie chart for prefix distribution
                         fig_pie = px.pie(
@@ -2900,7 +1926,7 @@ elif current_view == "Extended Data Sources":
                             color_discrete_sequence=px.colors.qualitative.Set3
                         )
                         st.plotly_chart(fig_pie, use_container_width=True)
-                    
+                
                     with col2:
                         # Bar chart for prefix counts
                         fig_bar = px.bar(
@@ -2913,17 +1939,17 @@ elif current_view == "Extended Data Sources":
                         )
                         fig_bar.update_layout(showlegend=False)
                         st.plotly_chart(fig_bar, use_container_width=True)
-                
+            
                 # Network Type Distribution
                 network_distribution = ipv6enabled_data.get('network_type_distribution', {})
                 if network_distribution:
                     st.subheader("🏢 Network Type IPv6 Deployment Distribution")
-                    
-                    network_df = pd.DataFrame([
-                        {'Network Type': k, 'Deployment Rate': v}
-                        for k, v in network_distribution.items()
-                    ])
-                    
+                
+                    network_df = pd.DataFrame({
+                        'Network Type': list(network_distribution),
+                        'Deployment Rate': list(network_distribution.values())
+                    })
+                
                     fig_network = px.bar(
                         network_df,
                         x='Network Type',
@@ -2936,18 +1962,18 @@ elif current_view == "Extended Data Sources":
                     fig_network.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
                     fig_network.update_layout(xaxis_tickangle=-45, showlegend=False)
                     st.plotly_chart(fig_network, use_container_width=True)
-                
+            
                 # Regional Deployment Rates
                 regional_rates = ipv6enabled_data.get('regional_deployment_rates', {})
                 if regional_rates:
                     st.subheader("🌍 Regional IPv6 Deployment Rates")
-                    
-                    regional_df = pd.DataFrame([
-                        {'Region': k, 'Deployment Rate': v}
-                        for k, v in regional_rates.items()
-                    ])
+                
+                    regional_df = pd.DataFrame({
+                        'Region': list(regional_rates),
+                        'Deployment Rate': list(regional_rates.values())
+                    })
                     regional_df = regional_df.sort_values('Deployment Rate', ascending=True)
-                    
+                
                     fig_regional = px.bar(
                         regional_df,
                         x='Deployment Rate',
@@ -2961,33 +1987,33 @@ elif current_view == "Extended Data Sources":
                     fig_regional.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
                     fig_regional.update_layout(showlegend=False)
                     st.plotly_chart(fig_regional, use_container_width=True)
-                
+            
                 regional_insights = ipv6enabled_data.get('regional_insights', {})
                 if regional_insights:
                     st.subheader("🗺️ Regional IPv6 Enablement Analysis")
-                    for region, insight in regional_insights.items():
-                        st.write(f"**{region}**: {insight}")
-                
+                    st.markdown("\n\n".join(f"**{region}**: {insight}" for region, insight in regional_insights.items()))
+            
             else:
                 st.warning(f"⚠️ {ipv6enabled_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {ipv6enabled_data.get('source', 'IPv6 Enabled Statistics')} - {ipv6enabled_data.get('url', '')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading IPv6 Enabled data: {str(e)}")
     
-    with tab12:
+    if selected_source == "Bogons":
         st.subheader("🛡️ Team Cymru Bogons - IPv6 Security Prefixes")
         try:
-            bogons_data = data_collector.get_team_cymru_bogons()
-            
+            with st.spinner("Loading Team Cymru data..."):
+                bogons_data = data_collector.get_team_cymru_bogons()
+        
             if 'error' not in bogons_data:
                 st.write(f"**Description**: {bogons_data.get('description', 'IPv6 bogon monitoring')}")
                 st.write(f"**Measurement Type**: {bogons_data.get('measurement_type', 'Prefix monitoring')}")
                 st.write(f"**Update Methodology**: {bogons_data.get('update_methodology', 'IANA monitoring')}")
-                
+            
                 col1, col2, col3 = st.columns(3)
-                
+            
                 with col1:
                     total_prefixes = bogons_data.get('total_bogon_prefixes', 0)
                     st.metric(
@@ -2995,7 +2021,7 @@ elif current_view == "Extended Data Sources":
                         format_number(total_prefixes),
                         delta="IPv6 restricted"
                     )
-                
+            
                 with col2:
                     file_size = bogons_data.get('file_size_kb', 0)
                     st.metric(
@@ -3003,7 +2029,7 @@ elif current_view == "Extended Data Sources":
                         f"{file_size} KB",
                         delta="Data cached"
                     )
-                
+            
                 with col3:
                     valid_prefixes = bogons_data.get('valid_prefixes', 0)
                     st.metric(
@@ -3011,60 +2037,58 @@ elif current_view == "Extended Data Sources":
                         format_number(valid_prefixes),
                         delta="Parsed prefixes"
                     )
-                
+            
                 coverage_analysis = bogons_data.get('coverage_analysis', {})
                 if coverage_analysis:
                     st.subheader("📊 Prefix Coverage Analysis")
                     col_a, col_b, col_c = st.columns(3)
-                    
+                
                     with col_a:
                         doc_prefixes = coverage_analysis.get('documentation_prefixes', 0)
                         st.metric("Documentation Prefixes", format_number(doc_prefixes))
-                    
+                
                     with col_b:
                         private_prefixes = coverage_analysis.get('private_use_prefixes', 0)
                         st.metric("Private Use Prefixes", format_number(private_prefixes))
-                    
+                
                     with col_c:
                         reserved_prefixes = coverage_analysis.get('reserved_prefixes', 0)
                         st.metric("Reserved Prefixes", format_number(reserved_prefixes))
-                
+            
                 st.subheader("🔒 Security Insights")
-                for insight in bogons_data.get('security_insights', []):
-                    st.write(f"  • {insight}")
-                
+                st.markdown("\n\n".join(f"  • {insight}" for insight in bogons_data.get('security_insights', [])))
+            
                 st.subheader("🛠️ Usage Applications")
-                for application in bogons_data.get('usage_applications', []):
-                    st.write(f"  • {application}")
-                
+                st.markdown("\n\n".join(f"  • {application}" for application in bogons_data.get('usage_applications', [])))
+            
                 prefix_distribution = bogons_data.get('prefix_size_distribution', {})
                 if prefix_distribution:
                     st.subheader("📈 Prefix Size Distribution")
                     # Show top 5 prefix sizes
                     top_sizes = sorted(prefix_distribution.items(), key=lambda x: x[1], reverse=True)[:5]
-                    for prefix_len, count in top_sizes:
-                        st.write(f"  • /{prefix_len}: {format_number(count)} prefixes")
-                
+                    st.markdown("\n\n".join(f"  • /{prefix_len}: {format_number(count)} prefixes" for prefix_len, count in top_sizes))
+            
             else:
                 st.warning(f"⚠️ {bogons_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {bogons_data.get('source', 'Team Cymru Bogon Project')} - {bogons_data.get('url', '')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading Team Cymru Bogons data: {str(e)}")
     
-    with tab13:
+    if selected_source == "Facebook":
         st.subheader("📘 Facebook - IPv6 Platform Traffic Analysis")
         try:
-            facebook_data = data_collector.get_facebook_ipv6_stats()
-            
+            with st.spinner("Loading Facebook data..."):
+                facebook_data = data_collector.get_facebook_ipv6_stats()
+        
             if isinstance(facebook_data, dict) and 'error' not in facebook_data:
                 st.write(f"**Description**: {facebook_data.get('description', 'Facebook IPv6 traffic analysis')}")
                 st.write(f"**Measurement Type**: {facebook_data.get('measurement_type', 'Platform traffic analysis')}")
                 st.write(f"**Scope**: {facebook_data.get('scope', 'Top countries by traffic')}")
-                
+            
                 col1, col2, col3 = st.columns(3)
-                
+            
                 with col1:
                     global_rate = facebook_data.get('global_adoption_rate', 0)
                     st.metric(
@@ -3072,7 +2096,7 @@ elif current_view == "Extended Data Sources":
                         f"{global_rate}%",
                         delta="Platform-wide analysis"
                     )
-                
+            
                 with col2:
                     platform_insights = facebook_data.get('platform_insights', {})
                     user_base = platform_insights.get('user_base', 'N/A')
@@ -3081,7 +2105,7 @@ elif current_view == "Extended Data Sources":
                         user_base,
                         delta="Global reach"
                     )
-                
+            
                 with col3:
                     top_countries = facebook_data.get('top_countries', [])
                     country_count = len(top_countries)
@@ -3090,11 +2114,11 @@ elif current_view == "Extended Data Sources":
                         f"{country_count}",
                         delta="Top markets"
                     )
-                
+            
                 # Top countries by Facebook IPv6 adoption
                 if top_countries:
                     st.subheader("🏆 Top Countries by Facebook IPv6 Adoption")
-                    
+                
                     # Create DataFrame for visualization with data validation
                     chart_data = []
                     for country in top_countries[:10]:  # Top 10 for chart
@@ -3108,10 +2132,10 @@ elif current_view == "Extended Data Sources":
                                     })
                             except (ValueError, TypeError):
                                 continue  # Skip invalid data
-                    
+                
                     if chart_data:
                         countries_df = pd.DataFrame(chart_data)
-                        
+                    
                         # Bar chart of top countries
                         fig = px.bar(
                             countries_df,
@@ -3130,23 +2154,23 @@ elif current_view == "Extended Data Sources":
                         st.plotly_chart(fig, use_container_width=True)
                     else:
                         st.warning("No valid chart data available for visualization.")
-                    
+                
                     # Show detailed table with resilient column handling
                     st.subheader("📊 Detailed Country Statistics")
                     if top_countries and len(top_countries) > 0:
                         display_df = pd.DataFrame(top_countries)
-                        
+                    
                         # Safely select available columns
                         available_cols = ['country', 'ipv6_percentage', 'rank']
                         optional_cols = ['category', 'mobile_advantage', 'notes']
-                        
+                    
                         # Add optional columns if they exist
                         for col in optional_cols:
                             if col in display_df.columns:
                                 available_cols.append(col)
-                        
+                    
                         display_df = display_df[available_cols]
-                        
+                    
                         # Rename columns for display
                         col_names = ['Country', 'IPv6 %', 'Rank']
                         if 'category' in available_cols:
@@ -3155,17 +2179,17 @@ elif current_view == "Extended Data Sources":
                             col_names.append('Mobile Advantage')
                         if 'notes' in available_cols:
                             col_names.append('Notes')
-                        
+                    
                         display_df.columns = col_names
                         st.dataframe(display_df, use_container_width=True)
                     else:
                         st.info("No country data available to display.")
-                
+            
                 # Regional breakdown
                 regional_data = facebook_data.get('regional_data', {})
                 if regional_data:
                     st.subheader("🌍 Regional Analysis")
-                    
+                
                     regional_list = []
                     for region, data in regional_data.items():
                         if isinstance(data, dict):
@@ -3177,7 +2201,7 @@ elif current_view == "Extended Data Sources":
                                     leading_str = ', '.join(str(c) for c in leading_countries[:3])
                                 else:
                                     leading_str = 'N/A'
-                                
+                            
                                 regional_list.append({
                                     'Region': str(region),
                                     'Average Adoption': avg_adoption,
@@ -3186,12 +2210,12 @@ elif current_view == "Extended Data Sources":
                                 })
                             except (ValueError, TypeError):
                                 continue  # Skip invalid regional data
-                    
+                
                     if regional_list:
                         regional_df = pd.DataFrame(regional_list)
                     else:
                         st.warning("No valid regional data available for analysis.")
-                    
+                
                     # Regional bar chart
                     fig_regional = px.bar(
                         regional_df,
@@ -3199,42 +2223,41 @@ elif current_view == "Extended Data Sources":
                         y='Average Adoption',
                         title='Regional IPv6 Adoption Averages',
                         color='Average Adoption',
-                        color_continuous_scale='blues'
+                        color_continuous_scale='blues',
+                        height=350
                     )
-                    fig_regional.update_layout(height=350)
                     st.plotly_chart(fig_regional, use_container_width=True)
-                    
+                
                     # Regional details table
                     st.dataframe(regional_df, use_container_width=True)
-                
+            
                 # Key findings
                 key_findings = facebook_data.get('key_findings', [])
                 if key_findings:
                     st.subheader("🔍 Key Findings")
-                    for finding in key_findings:
-                        st.write(f"  • {finding}")
-                
+                    st.markdown("\n\n".join(f"  • {finding}" for finding in key_findings))
+            
                 # Platform insights
                 if platform_insights:
                     st.subheader("📈 Platform Traffic Insights")
                     traffic_patterns = platform_insights.get('traffic_patterns', [])
-                    for pattern in traffic_patterns:
-                        st.write(f"  • {pattern}")
-            
+                    st.markdown("\n\n".join(f"  • {pattern}" for pattern in traffic_patterns))
+        
             else:
                 st.warning(f"⚠️ {facebook_data['error']}")
-            
+        
             st.caption(f"📄 **Source**: {facebook_data.get('source', 'Facebook IPv6 Statistics')} - {facebook_data.get('url', '')}")
-            
+        
         except Exception as e:
             st.error(f"Error loading Facebook IPv6 data: {str(e)}")
             st.info("Please check the data source connection and try again.")
 
-    with tab14:
+    if selected_source == "CAIDA":
         st.subheader("🔬 CAIDA - AS-Level IPv6 Topology & Measurements")
         try:
-            caida_topology = data_collector.get_caida_ipv6_topology_stats()
-            caida_as_relations = data_collector.get_caida_ipv6_as_relationships()
+            with st.spinner("Loading CAIDA data..."):
+                caida_topology = data_collector.get_caida_ipv6_topology_stats()
+                caida_as_relations = data_collector.get_caida_ipv6_as_relationships()
 
             if 'error' not in caida_topology:
                 st.write(f"**Infrastructure**: {caida_topology.get('measurement_infrastructure', 'CAIDA Archipelago')}")
@@ -3272,15 +2295,13 @@ elif current_view == "Extended Data Sources":
                 datasets = caida_topology.get('available_datasets', [])
                 if datasets:
                     st.subheader("📚 Available Datasets")
-                    for dataset in datasets:
-                        st.write(f"  • {dataset}")
+                    st.markdown("\n\n".join(f"  • {dataset}" for dataset in datasets))
 
                 # Research applications
                 applications = caida_topology.get('research_applications', [])
                 if applications:
                     st.subheader("🔬 Research Applications")
-                    for app in applications:
-                        st.write(f"  • {app}")
+                    st.markdown("\n\n".join(f"  • {app}" for app in applications))
 
                 # 2025 Research highlight
                 research_2025 = caida_topology.get('recent_research_2025', {})
@@ -3321,8 +2342,7 @@ elif current_view == "Extended Data Sources":
                 insights = caida_as_relations.get('research_insights', {})
                 if insights:
                     st.subheader("📈 Research Insights")
-                    for key, value in insights.items():
-                        st.write(f"  • **{key.replace('_', ' ').title()}**: {value}")
+                    st.markdown("\n\n".join(f"  • **{key.replace('_', ' ').title()}**: {value}" for key, value in insights.items()))
 
                 # Data format and applications
                 col_a, col_b = st.columns(2)
@@ -3330,14 +2350,12 @@ elif current_view == "Extended Data Sources":
                 with col_a:
                     st.subheader("📁 Data Format")
                     data_format = caida_as_relations.get('data_format', {})
-                    for key, value in data_format.items():
-                        st.write(f"  • **{key.replace('_', ' ').title()}**: {value}")
+                    st.markdown("\n\n".join(f"  • **{key.replace('_', ' ').title()}**: {value}" for key, value in data_format.items()))
 
                 with col_b:
                     st.subheader("🎯 Applications")
                     apps = caida_as_relations.get('applications', [])
-                    for app in apps[:5]:  # Show top 5
-                        st.write(f"  • {app}")
+                    st.markdown("\n\n".join(f"  • {app}" for app in apps[:5]))  # Show top 5
 
                 # Download information
                 download = caida_as_relations.get('download_info', {})
@@ -3359,10 +2377,11 @@ elif current_view == "Extended Data Sources":
             st.error(f"Error loading CAIDA data: {str(e)}")
             st.info("CAIDA provides comprehensive AS-level IPv6 topology data for research purposes.")
 
-    with tab15:
+    if selected_source == "HE.NET":
         st.subheader("🌐 Hurricane Electric (HE.NET) - Global IPv6 Infrastructure")
         try:
-            he_stats = data_collector.get_hurricane_electric_stats()
+            with st.spinner("Loading Hurricane Electric data..."):
+                he_stats = data_collector.get_hurricane_electric_stats()
 
             if 'error' not in he_stats:
                 st.write(f"**Description**: {he_stats.get('description', 'Hurricane Electric IPv6 statistics')}")
@@ -3399,15 +2418,13 @@ elif current_view == "Extended Data Sources":
                 top_countries = he_stats.get('top_countries_deployment', [])
                 if top_countries:
                     st.subheader("🏆 Top Countries by IPv6 Deployment")
-                    for country in top_countries[:5]:
-                        st.write(f"  • {country}")
+                    st.markdown("\n\n".join(f"  • {country}" for country in top_countries[:5]))
 
                 # Network characteristics
                 network_char = he_stats.get('network_characteristics', {})
                 if network_char:
                     st.subheader("🔗 Network Characteristics")
-                    for key, value in network_char.items():
-                        st.write(f"  • **{key.replace('_', ' ').title()}**: {value}")
+                    st.markdown("\n\n".join(f"  • **{key.replace('_', ' ').title()}**: {value}" for key, value in network_char.items()))
 
                 st.caption(f"📄 **Source**: {he_stats.get('source', 'Hurricane Electric')} - {he_stats.get('url', '')}")
             else:
@@ -3416,10 +2433,11 @@ elif current_view == "Extended Data Sources":
         except Exception as e:
             st.error(f"Error loading Hurricane Electric data: {str(e)}")
 
-    with tab16:
+    if selected_source == "RIPE Atlas":
         st.subheader("📡 RIPE Atlas - Real-World IPv6 Connectivity")
         try:
-            atlas_stats = data_collector.get_ripe_atlas_stats()
+            with st.spinner("Loading RIPE Atlas data..."):
+                atlas_stats = data_collector.get_ripe_atlas_stats()
 
             if 'error' not in atlas_stats:
                 st.write(f"**Description**: {atlas_stats.get('description', 'RIPE Atlas measurements')}")
@@ -3464,15 +2482,13 @@ elif current_view == "Extended Data Sources":
                 insights = atlas_stats.get('measurement_insights', [])
                 if insights:
                     st.subheader("📊 Measurement Insights")
-                    for insight in insights:
-                        st.write(f"  • {insight}")
+                    st.markdown("\n\n".join(f"  • {insight}" for insight in insights))
 
                 # Probe distribution
                 probe_dist = atlas_stats.get('probe_distribution', {})
                 if probe_dist:
                     st.subheader("🌍 Probe Distribution")
-                    for key, value in probe_dist.items():
-                        st.write(f"  • **{key}**: {value}")
+                    st.markdown("\n\n".join(f"  • **{key}**: {value}" for key, value in probe_dist.items()))
 
                 st.caption(f"📄 **Source**: {atlas_stats.get('source', 'RIPE Atlas')} - {atlas_stats.get('url', '')}")
             else:
@@ -3481,10 +2497,11 @@ elif current_view == "Extended Data Sources":
         except Exception as e:
             st.error(f"Error loading RIPE Atlas data: {str(e)}")
 
-    with tab17:
+    if selected_source == "IPv6 Launch":
         st.subheader("🚀 World IPv6 Launch - ISP Deployment Tracking")
         try:
-            launch_stats = data_collector.get_world_ipv6_launch_stats()
+            with st.spinner("Loading World IPv6 Launch data..."):
+                launch_stats = data_collector.get_world_ipv6_launch_stats()
 
             if 'error' not in launch_stats:
                 st.write(f"**Description**: {launch_stats.get('description', 'World IPv6 Launch tracking')}")
@@ -3521,15 +2538,13 @@ elif current_view == "Extended Data Sources":
                 top_isps = launch_stats.get('top_isps', [])
                 if top_isps:
                     st.subheader("🏆 Leading ISPs by IPv6 Deployment")
-                    for isp in top_isps[:10]:
-                        st.write(f"  • {isp}")
+                    st.markdown("\n\n".join(f"  • {isp}" for isp in top_isps[:10]))
 
                 # Historical milestones
                 milestones = launch_stats.get('historical_milestones', [])
                 if milestones:
                     st.subheader("📅 Historical Milestones")
-                    for milestone in milestones:
-                        st.write(f"  • {milestone}")
+                    st.markdown("\n\n".join(f"  • {milestone}" for milestone in milestones))
 
                 st.caption(f"📄 **Source**: {launch_stats.get('source', 'World IPv6 Launch')} - {launch_stats.get('url', '')}")
             else:
@@ -3538,10 +2553,11 @@ elif current_view == "Extended Data Sources":
         except Exception as e:
             st.error(f"Error loading World IPv6 Launch data: {str(e)}")
 
-    with tab18:
+    if selected_source == "CIDR Report":
         st.subheader("📊 CIDR Report - Weekly BGP Routing Analysis")
         try:
-            cidr_stats = data_collector.get_cidr_report_stats()
+            with st.spinner("Loading CIDR Report data..."):
+                cidr_stats = data_collector.get_cidr_report_stats()
 
             if 'error' not in cidr_stats:
                 st.write(f"**Description**: {cidr_stats.get('description', 'CIDR Report BGP analysis')}")
@@ -3578,15 +2594,13 @@ elif current_view == "Extended Data Sources":
                 routing_stats = cidr_stats.get('routing_statistics', {})
                 if routing_stats:
                     st.subheader("🔀 Routing Statistics")
-                    for key, value in routing_stats.items():
-                        st.write(f"  • **{key.replace('_', ' ').title()}**: {value}")
+                    st.markdown("\n\n".join(f"  • **{key.replace('_', ' ').title()}**: {value}" for key, value in routing_stats.items()))
 
                 # Weekly trends
                 trends = cidr_stats.get('weekly_trends', [])
                 if trends:
                     st.subheader("📈 Weekly Trends")
-                    for trend in trends:
-                        st.write(f"  • {trend}")
+                    st.markdown("\n\n".join(f"  • {trend}" for trend in trends))
 
                 st.caption(f"📄 **Source**: {cidr_stats.get('source', 'CIDR Report')} - {cidr_stats.get('url', '')}")
             else:
@@ -3595,10 +2609,11 @@ elif current_view == "Extended Data Sources":
         except Exception as e:
             st.error(f"Error loading CIDR Report data: {str(e)}")
 
-    with tab19:
+    if selected_source == "Tranco":
         st.subheader("🌐 Tranco Top Sites - Website IPv6 DNS Support")
         try:
-            tranco_stats = data_collector.get_tranco_ipv6_stats()
+            with st.spinner("Loading Tranco data..."):
+                tranco_stats = data_collector.get_tranco_ipv6_stats()
 
             if 'error' not in tranco_stats:
                 st.write(f"**Description**: {tranco_stats.get('note', 'Top website IPv6 analysis')}")
@@ -3636,7 +2651,6 @@ elif current_view == "Extended Data Sources":
                     st.subheader("🏆 Sample Top Domains IPv6 Status")
 
                     # Create DataFrame
-                    import pandas as pd
                     df = pd.DataFrame(domain_results[:20])  # Show top 20
                     if not df.empty:
                         df['IPv6 Status'] = df['ipv6_enabled'].apply(lambda x: '✅ Yes' if x else '❌ No')
@@ -3681,457 +2695,409 @@ elif current_view == "Extended Data Sources":
     **Total Data Sources**: 19 specialized IPv6 measurement and statistics platforms
     """)
 
-# Country Analysis Page
-elif current_view == "Country Analysis":
-    st.header("🏛️ Country-Specific IPv6 Analysis")
-    
-    # Get country statistics data
-    try:
-        country_stats = data_collector.get_google_country_stats()
-        
-        if country_stats:
-            # Create interactive world map with clickable countries
-            st.subheader("🗺️ Interactive World IPv6 Adoption Map")
-            st.markdown("*Click on any country to view detailed IPv6 statistics*")
-            
-            # Create Folium map
-            m = folium.Map(location=[20, 0], zoom_start=2, tiles='OpenStreetMap')
-            
-            # Prepare country data for the map
-            for country_data in country_stats:
-                country_name = country_data['country']
-                ipv6_percentage = country_data['ipv6_percentage']
-                rank = country_data['rank']
-                
-                # Get country coordinates
-                coords = get_country_coordinates(country_name)
-                if coords:
-                    # Color coding based on IPv6 adoption
-                    if ipv6_percentage >= 70:
-                        color = '#006600'  # Dark green for high adoption
-                        fillColor = '#00ff00'
-                    elif ipv6_percentage >= 50:
-                        color = '#ff8c00'  # Orange for medium adoption
-                        fillColor = '#ffa500'
-                    elif ipv6_percentage >= 30:
-                        color = '#ff4500'  # Red-orange for low adoption
-                        fillColor = '#ff6347'
-                    else:
-                        color = '#8b0000'  # Dark red for very low adoption
-                        fillColor = '#ff0000'
-                    
-                    # Create popup with detailed information
-                    popup_html = f"""
-                    <div style="font-family: Arial, sans-serif; width: 250px;">
-                        <h3 style="color: #007bff; margin: 5px 0;">{country_name}</h3>
-                        <hr style="margin: 5px 0;">
-                        <p><strong>IPv6 Adoption:</strong> {ipv6_percentage}%</p>
-                        <p><strong>Global Rank:</strong> #{rank}</p>
-                        <p><strong>Status:</strong> 
-                            {'🟢 High Adoption' if ipv6_percentage >= 70 else 
-                             '🟡 Medium Adoption' if ipv6_percentage >= 50 else
-                             '🟠 Growing Adoption' if ipv6_percentage >= 30 else
-                             '🔴 Early Stage'}
-                        </p>
-                        <p><strong>Network Type:</strong> 
-                            {'Mobile-first' if ipv6_percentage >= 60 else 'Mixed deployment'}
-                        </p>
-                        <small style="color: #666;">Click for detailed analysis</small>
-                    </div>
-                    """
-                    
-                    # Add clickable marker
-                    folium.CircleMarker(
-                        location=coords,
-                        radius=8 + (ipv6_percentage / 10),  # Size based on adoption
-                        popup=folium.Popup(popup_html, max_width=300),
-                        color=color,
-                        fillColor=fillColor,
-                        fillOpacity=0.7,
-                        weight=2
-                    ).add_to(m)
-                    
-                    # Add country label
-                    folium.Marker(
-                        location=coords,
-                        icon=folium.DivIcon(
-                            html=f'<div style="font-size: 10px; color: black; font-weight: bold;">{ipv6_percentage}%</div>',
-                            icon_size=(30, 15),
-                            icon_anchor=(15, 7)
-                        )
-                    ).add_to(m)
-            
-            # Add legend
-            legend_html = '''
-            <div style="position: fixed; 
-                        bottom: 50px; left: 50px; width: 200px; height: 120px; 
-                        background-color: white; border:2px solid grey; z-index:9999; 
-                        font-size:12px; padding: 10px">
-                <h4 style="margin: 0 0 10px 0;">IPv6 Adoption Levels</h4>
-                <p><span style="color: #006600;">●</span> 70%+ High Adoption</p>
-                <p><span style="color: #ff8c00;">●</span> 50-69% Medium Adoption</p>
-                <p><span style="color: #ff4500;">●</span> 30-49% Growing Adoption</p>
-                <p><span style="color: #8b0000;">●</span> <30% Early Stage</p>
-            </div>
-            '''
-            m.get_root().add_child(folium.Element(legend_html))
-            
-            # Display the map
-            map_data = st_folium(m, width=700, height=500)
-            
-            # Country selection for detailed analysis
-            st.subheader("📊 Detailed Country Analysis")
-            
-            # Create selection based on available data
-            available_countries = [c['country'] for c in country_stats]
-            selected_country = st.selectbox(
-                "Select a country for detailed analysis:",
-                available_countries,
-                help="Choose from countries with available IPv6 data"
-            )
-            
-            # Display selected country details
-            if selected_country:
-                selected_data = next((c for c in country_stats if c['country'] == selected_country), None)
-                
-                if selected_data:
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        st.metric(
-                            "IPv6 Adoption",
-                            f"{selected_data['ipv6_percentage']}%",
-                            delta=f"Rank #{selected_data['rank']}"
-                        )
-                    
-                    with col2:
-                        # Estimate mobile usage based on adoption rate
-                        mobile_estimate = min(selected_data['ipv6_percentage'] * 1.2, 95)
+
+# Simplified region grouping for the Country Analysis regional breakdown
+REGION_COUNTRIES = {
+    'Europe': frozenset({'France', 'Germany', 'United Kingdom', 'Netherlands', 'Belgium', 'Italy', 'Spain'}),
+    'Asia-Pacific': frozenset({'India', 'Japan', 'Australia', 'South Korea', 'China'}),
+    'Americas': frozenset({'United States', 'Canada', 'Brazil'})
+}
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_country_map_figure(country_stats: list):
+    """Country adoption map, built once per set of country stats.
+
+    Like the cloud figures, the Scattergeo traces and legend layout are shared
+    across sessions rather than rebuilt on every rerun of the page.
+    """
+    return ChartGenerator().create_adoption_marker_map(country_stats)
+
+
+@functools.lru_cache(maxsize=8)
+def build_region_leaders(regional_leaders: tuple) -> tuple:
+    """Pair each region with its leaders text, upper-cased once for substring matching"""
+    return tuple((region, leaders_str.upper()) for region, leaders_str in regional_leaders)
+
+
+@st.fragment
+def render_country_detail(data_collector, stats_by_country: dict):
+    """Country picker and the detail panels for the chosen country"""
+    st.subheader("📊 Detailed Country Analysis")
+
+    # Create selection based on available data
+    selected_country = st.selectbox(
+        "Select a country for detailed analysis:",
+        tuple(stats_by_country),
+        help="Choose from countries with available IPv6 data"
+    )
+
+    # Display selected country details
+    if selected_country:
+        selected_data = stats_by_country.get(selected_country)
+
+        if selected_data:
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric(
+                    "IPv6 Adoption",
+                    f"{selected_data['ipv6_percentage']}%",
+                    delta=f"Rank #{selected_data['rank']}"
+                )
+
+            with col2:
+                # Estimate mobile usage based on adoption rate
+                mobile_estimate = min(selected_data['ipv6_percentage'] * 1.2, 95)
+                st.metric(
+                    "Est. Mobile IPv6",
+                    f"{mobile_estimate:.1f}%",
+                    delta="Mobile networks"
+                )
+
+            with col3:
+                # Estimate ISP support
+                isp_estimate = min(selected_data['ipv6_percentage'] * 0.8, 85)
+                st.metric(
+                    "Est. ISP Support",
+                    f"{isp_estimate:.1f}%",
+                    delta="Major ISPs"
+                )
+
+            with col4:
+                # Calculate deployment status
+                if selected_data['ipv6_percentage'] >= 70:
+                    status = "Mature"
+                    delta = "🟢 Leading"
+                elif selected_data['ipv6_percentage'] >= 50:
+                    status = "Advanced"
+                    delta = "🟡 Strong"
+                elif selected_data['ipv6_percentage'] >= 30:
+                    status = "Growing"
+                    delta = "🟠 Developing"
+                else:
+                    status = "Early"
+                    delta = "🔴 Initial"
+
+                st.metric(
+                    "Deployment Stage",
+                    status,
+                    delta=delta
+                )
+
+            # Enhanced country insights with new data integration
+            st.subheader(f"🔍 IPv6 Insights for {selected_country}")
+
+            # Get Cloudflare country-specific traffic data
+            country_code = data_collector.get_country_code_from_name(selected_country)
+            cloudflare_country_data = None
+            if country_code:
+                cloudflare_country_data = data_collector.get_cloudflare_country_stats(country_code)
+
+                # Display Cloudflare traffic data if available
+                if cloudflare_country_data and 'error' not in cloudflare_country_data:
+                    # Bind the per-country percentages once; they feed the metrics, chart and note
+                    cf_ipv6 = cloudflare_country_data.get('ipv6_percentage', 0)
+                    cf_ipv4 = cloudflare_country_data.get('ipv4_percentage', 0)
+                    fb_ipv6 = selected_data['ipv6_percentage']
+
+                    st.markdown("#### ☁️ Cloudflare Radar Traffic Analysis")
+                    cf_col1, cf_col2, cf_col3 = st.columns(3)
+
+                    with cf_col1:
                         st.metric(
-                            "Est. Mobile IPv6",
-                            f"{mobile_estimate:.1f}%",
-                            delta="Mobile networks"
+                            "IPv6 Traffic (Cloudflare)",
+                            f"{cf_ipv6:.1f}%",
+                            delta="Last 7 days"
                         )
-                    
-                    with col3:
-                        # Estimate ISP support
-                        isp_estimate = min(selected_data['ipv6_percentage'] * 0.8, 85)
+
+                    with cf_col2:
                         st.metric(
-                            "Est. ISP Support",
-                            f"{isp_estimate:.1f}%",
-                            delta="Major ISPs"
+                            "IPv4 Traffic (Cloudflare)",
+                            f"{cf_ipv4:.1f}%",
+                            delta="Last 7 days"
                         )
-                    
-                    with col4:
-                        # Calculate deployment status
-                        if selected_data['ipv6_percentage'] >= 70:
-                            status = "Mature"
-                            delta = "🟢 Leading"
-                        elif selected_data['ipv6_percentage'] >= 50:
-                            status = "Advanced"
-                            delta = "🟡 Strong"
-                        elif selected_data['ipv6_percentage'] >= 30:
-                            status = "Growing"
-                            delta = "🟠 Developing"
-                        else:
-                            status = "Early"
-                            delta = "🔴 Initial"
-                        
+
+                    with cf_col3:
+                        # Compare Facebook vs Cloudflare
+                        diff = cf_ipv6 - fb_ipv6
                         st.metric(
-                            "Deployment Stage",
-                            status,
-                            delta=delta
+                            "Difference",
+                            f"{abs(diff):.1f}%",
+                            delta="CF vs FB data"
                         )
-                    
-                    # Enhanced country insights with new data integration
-                    st.subheader(f"🔍 IPv6 Insights for {selected_country}")
-
-                    # Get Cloudflare country-specific traffic data
-                    country_code = data_collector.get_country_code_from_name(selected_country)
-                    cloudflare_country_data = None
-                    if country_code:
-                        cloudflare_country_data = data_collector.get_cloudflare_country_stats(country_code)
-
-                        # Display Cloudflare traffic data if available
-                        if cloudflare_country_data and 'error' not in cloudflare_country_data:
-                            st.markdown("#### ☁️ Cloudflare Radar Traffic Analysis")
-                            cf_col1, cf_col2, cf_col3 = st.columns(3)
-
-                            with cf_col1:
-                                st.metric(
-                                    "IPv6 Traffic (Cloudflare)",
-                                    f"{cloudflare_country_data.get('ipv6_percentage', 0):.1f}%",
-                                    delta="Last 7 days"
-                                )
-
-                            with cf_col2:
-                                st.metric(
-                                    "IPv4 Traffic (Cloudflare)",
-                                    f"{cloudflare_country_data.get('ipv4_percentage', 0):.1f}%",
-                                    delta="Last 7 days"
-                                )
-
-                            with cf_col3:
-                                # Compare Facebook vs Cloudflare
-                                diff = cloudflare_country_data.get('ipv6_percentage', 0) - selected_data['ipv6_percentage']
-                                st.metric(
-                                    "Difference",
-                                    f"{abs(diff):.1f}%",
-                                    delta="CF vs FB data"
-                                )
 
-                            st.caption(f"📊 **Source**: {cloudflare_country_data.get('source', 'Cloudflare Radar')} - Real-time HTTP traffic analysis · [View on Cloudflare Radar]({cloudflare_country_data.get('url', '')})")
-
-                            # Add visualization comparing data sources
-                            import pandas as pd
-                            import plotly.graph_objects as go
-
-                            comparison_data = pd.DataFrame({
-                                'Source': ['Facebook', 'Cloudflare', 'Facebook', 'Cloudflare'],
-                                'Protocol': ['IPv6', 'IPv6', 'IPv4', 'IPv4'],
-                                'Percentage': [
-                                    selected_data['ipv6_percentage'],
-                                    cloudflare_country_data.get('ipv6_percentage', 0),
-                                    100 - selected_data['ipv6_percentage'],
-                                    cloudflare_country_data.get('ipv4_percentage', 0)
-                                ]
-                            })
-
-                            fig = go.Figure()
-
-                            # Add Facebook data
-                            fig.add_trace(go.Bar(
-                                name='Facebook',
-                                x=['IPv6', 'IPv4'],
-                                y=[selected_data['ipv6_percentage'], 100 - selected_data['ipv6_percentage']],
-                                marker_color=['#3b5998', '#8b9dc3'],
-                                text=[f"{selected_data['ipv6_percentage']:.1f}%", f"{100 - selected_data['ipv6_percentage']:.1f}%"],
-                                textposition='auto',
-                            ))
-
-                            # Add Cloudflare data
-                            fig.add_trace(go.Bar(
-                                name='Cloudflare',
-                                x=['IPv6', 'IPv4'],
-                                y=[cloudflare_country_data.get('ipv6_percentage', 0), cloudflare_country_data.get('ipv4_percentage', 0)],
-                                marker_color=['#f38020', '#fbb040'],
-                                text=[f"{cloudflare_country_data.get('ipv6_percentage', 0):.1f}%", f"{cloudflare_country_data.get('ipv4_percentage', 0):.1f}%"],
-                                textposition='auto',
-                            ))
-
-                            fig.update_layout(
-                                title=f"IPv6 vs IPv4 Traffic Comparison - {selected_country}",
-                                xaxis_title="Protocol",
-                                yaxis_title="Percentage",
-                                barmode='group',
-                                height=400,
-                                showlegend=True,
-                                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-                            )
+                    st.caption(f"📊 **Source**: {cloudflare_country_data.get('source', 'Cloudflare Radar')} - Real-time HTTP traffic analysis · [View on Cloudflare Radar]({cloudflare_country_data.get('url', '')})")
+
+                    # Add visualization comparing data sources
+                    import plotly.graph_objects as go
+
+                    fig = go.Figure()
+
+                    # Add Facebook data
+                    fig.add_trace(go.Bar(
+                        name='Facebook',
+                        x=['IPv6', 'IPv4'],
+                        y=[fb_ipv6, 100 - fb_ipv6],
+                        marker_color=['#3b5998', '#8b9dc3'],
+                        text=[f"{fb_ipv6:.1f}%", f"{100 - fb_ipv6:.1f}%"],
+                        textposition='auto',
+                    ))
+
+                    # Add Cloudflare data
+                    fig.add_trace(go.Bar(
+                        name='Cloudflare',
+                        x=['IPv6', 'IPv4'],
+                        y=[cf_ipv6, cf_ipv4],
+                        marker_color=['#f38020', '#fbb040'],
+                        text=[f"{cf_ipv6:.1f}%", f"{cf_ipv4:.1f}%"],
+                        textposition='auto',
+                    ))
+
+                    fig.update_layout(
+                        title=f"IPv6 vs IPv4 Traffic Comparison - {selected_country}",
+                        xaxis_title="Protocol",
+                        yaxis_title="Percentage",
+                        barmode='group',
+                        height=400,
+                        showlegend=True,
+                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+                    )
 
-                            st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(fig, use_container_width=True)
 
-                            # Add explanation of the difference
-                            st.info(f"""
+                    # Add explanation of the difference
+                    st.info(f"""
                             **Understanding the Data Sources**:
-                            - **Facebook**: {selected_data['ipv6_percentage']}% - Based on users accessing Facebook services
-                            - **Cloudflare**: {cloudflare_country_data.get('ipv6_percentage', 0):.1f}% - Based on HTTP requests to Cloudflare's global network
+                            - **Facebook**: {fb_ipv6}% - Based on users accessing Facebook services
+                            - **Cloudflare**: {cf_ipv6:.1f}% - Based on HTTP requests to Cloudflare's global network
                             - Different measurement methodologies can show varying results, providing complementary perspectives on IPv6 adoption
                             """)
 
-                    # Get enhanced regional context
-                    try:
-                        cloudflare_data = data_collector.get_cloudflare_radar_stats()
-                        regional_leaders = cloudflare_data.get('regional_leaders', {}) if cloudflare_data else {}
-                        
-                        # Determine region context
-                        region_context = ""
-                        country_upper = selected_country.upper()
-                        
-                        # Check against regional leaders data
-                        for region, leaders_str in regional_leaders.items():
-                            if selected_country in leaders_str or country_upper in leaders_str.upper():
-                                region_context = f"Regional leader in {region}"
-                                break
-                        
-                        # Base insights by adoption level
-                        if selected_data['ipv6_percentage'] >= 70:
-                            insights = [
-                                f"{selected_country} is among the global leaders in IPv6 adoption",
-                                "Mobile networks likely driving high adoption rates",
-                                "Government and regulatory support for IPv6 transition",
-                                "ISPs have completed major IPv6 infrastructure investments"
-                            ]
-                            
-                            # Add regional context if available
-                            if region_context:
-                                insights.append(f"Status: {region_context} with 70%+ adoption")
-                            
-                        elif selected_data['ipv6_percentage'] >= 50:
-                            insights = [
-                                f"{selected_country} shows strong IPv6 progress with over 50% adoption",
-                                "Major ISPs have deployed IPv6 with dual-stack configurations",
-                                "Corporate and residential deployments accelerating",
-                                "Mobile carriers leading IPv6 implementation"
-                            ]
-                            
-                            if region_context:
-                                insights.append(f"Status: {region_context} with strong growth trajectory")
-                                
-                        elif selected_data['ipv6_percentage'] >= 30:
-                            insights = [
-                                f"{selected_country} is actively transitioning to IPv6",
-                                "Major ISPs are in various stages of IPv6 deployment",
-                                "Government agencies beginning IPv6 requirements",
-                                "Enterprise adoption growing but still fragmented"
-                            ]
-                        else:
-                            insights = [
-                                f"{selected_country} is in early stages of IPv6 adoption",
-                                "Limited ISP IPv6 deployment, mostly pilot programs",
-                                "IPv4 address scarcity may accelerate adoption",
-                                "Opportunity for rapid deployment with modern infrastructure"
-                            ]
-                        
-                        # Add Cloudflare traffic insights if applicable
-                        traffic_insights = cloudflare_data.get('traffic_insights', {}) if cloudflare_data else {}
-                        if traffic_insights.get('mobile_advantage'):
-                            insights.append(f"Traffic pattern: {traffic_insights['mobile_advantage']}")
-
-                        # Add country-specific Cloudflare insights
-                        if cloudflare_country_data and 'error' not in cloudflare_country_data:
-                            cf_ipv6 = cloudflare_country_data.get('ipv6_percentage', 0)
-                            fb_ipv6 = selected_data['ipv6_percentage']
-
-                            if abs(cf_ipv6 - fb_ipv6) > 10:
-                                if cf_ipv6 > fb_ipv6:
-                                    insights.append(f"Cloudflare data shows {cf_ipv6:.1f}% IPv6 traffic, suggesting broader web traffic has higher IPv6 adoption than social media users")
-                                else:
-                                    insights.append(f"Facebook users show higher IPv6 adoption ({fb_ipv6:.1f}%) compared to general web traffic ({cf_ipv6:.1f}%), indicating mobile-first usage patterns")
+            # Get enhanced regional context
+            try:
+                with st.spinner("Loading Cloudflare Radar data..."):
+                    cloudflare_data = data_collector.get_cloudflare_radar_stats()
+                regional_leaders = cloudflare_data.get('regional_leaders', {}) if cloudflare_data else {}
+
+                # Determine region context: the first region whose leaders text
+                # mentions the country. get_cloudflare_radar_stats does not
+                # currently return regional_leaders, so this stays empty for now
+                country_upper = selected_country.upper()
+                region = next(
+                    (region for region, leaders_upper in build_region_leaders(tuple(regional_leaders.items()))
+                     if country_upper in leaders_upper),
+                    None
+                )
+                region_context = f"Regional leader in {region}" if region else ""
+
+                # Base insights by adoption level
+                if selected_data['ipv6_percentage'] >= 70:
+                    insights = [
+                        f"{selected_country} is among the global leaders in IPv6 adoption",
+                        "Mobile networks likely driving high adoption rates",
+                        "Government and regulatory support for IPv6 transition",
+                        "ISPs have completed major IPv6 infrastructure investments"
+                    ]
+
+                    # Add regional context if available
+                    if region_context:
+                        insights.append(f"Status: {region_context} with 70%+ adoption")
+
+                elif selected_data['ipv6_percentage'] >= 50:
+                    insights = [
+                        f"{selected_country} shows strong IPv6 progress with over 50% adoption",
+                        "Major ISPs have deployed IPv6 with dual-stack configurations",
+                        "Corporate and residential deployments accelerating",
+                        "Mobile carriers leading IPv6 implementation"
+                    ]
+
+                    if region_context:
+                        insights.append(f"Status: {region_context} with strong growth trajectory")
+
+                elif selected_data['ipv6_percentage'] >= 30:
+                    insights = [
+                        f"{selected_country} is actively transitioning to IPv6",
+                        "Major ISPs are in various stages of IPv6 deployment",
+                        "Government agencies beginning IPv6 requirements",
+                        "Enterprise adoption growing but still fragmented"
+                    ]
+                else:
+                    insights = [
+                        f"{selected_country} is in early stages of IPv6 adoption",
+                        "Limited ISP IPv6 deployment, mostly pilot programs",
+                        "IPv4 address scarcity may accelerate adoption",
+                        "Opportunity for rapid deployment with modern infrastructure"
+                    ]
+
+                # Add Cloudflare traffic insights if applicable
+                traffic_insights = cloudflare_data.get('traffic_insights', {}) if cloudflare_data else {}
+                if traffic_insights.get('mobile_advantage'):
+                    insights.append(f"Traffic pattern: {traffic_insights['mobile_advantage']}")
 
-                        for insight in insights:
-                            st.write(f"• {insight}")
-                            
-                    except Exception:
-                        # Fallback to basic insights
-                        if selected_data['ipv6_percentage'] >= 70:
-                            insights = [
-                                f"{selected_country} is among the global leaders in IPv6 adoption",
-                                "Mobile networks likely driving high adoption rates",
-                                "Government and regulatory support for IPv6 transition",
-                                "ISPs have completed major IPv6 infrastructure investments"
-                            ]
-                        elif selected_data['ipv6_percentage'] >= 50:
-                            insights = [
-                                f"{selected_country} shows strong IPv6 progress with over 50% adoption",
-                                "Major ISPs have deployed IPv6 with dual-stack configurations",
-                                "Corporate and residential deployments accelerating",
-                                "Mobile carriers leading IPv6 implementation"
-                            ]
+                # Add country-specific Cloudflare insights
+                if cloudflare_country_data and 'error' not in cloudflare_country_data:
+                    cf_ipv6 = cloudflare_country_data.get('ipv6_percentage', 0)
+                    fb_ipv6 = selected_data['ipv6_percentage']
+
+                    if abs(cf_ipv6 - fb_ipv6) > 10:
+                        if cf_ipv6 > fb_ipv6:
+                            insights.append(f"Cloudflare data shows {cf_ipv6:.1f}% IPv6 traffic, suggesting broader web traffic has higher IPv6 adoption than social media users")
                         else:
-                            insights = [
-                                f"{selected_country} is actively transitioning to IPv6",
-                                "IPv6 deployment varies by region and network type"
-                            ]
-                        
-                        for insight in insights:
-                            st.write(f"• {insight}")
-                    
-                    # Add comprehensive NIST USGv6 federal deployment analysis for US
-                    if selected_country.upper() == 'UNITED STATES' or selected_country.upper() == 'USA':
-                        st.subheader("🏛️ Federal Government IPv6 Deployment (NIST USGv6)")
-                        
-                        try:
-                            nist_data = data_collector.get_nist_usgv6_deployment_stats()
-                            if nist_data and 'error' not in nist_data:
-                                
-                                # Federal deployment metrics overview
-                                federal_metrics = nist_data.get('federal_deployment_metrics', {})
-                                if federal_metrics:
-                                    col1, col2, col3, col4 = st.columns(4)
-                                    
-                                    with col1:
-                                        total_domains = federal_metrics.get('total_gov_domains_tested', 0)
-                                        st.metric("Total .gov Domains", f"{total_domains:,}")
-                                    
-                                    with col2:
-                                        dns_enabled = federal_metrics.get('dns_ipv6_enabled', 0)
-                                        dns_pct = (dns_enabled / total_domains * 100) if total_domains > 0 else 0
-                                        st.metric("DNS IPv6 Enabled", f"{dns_pct:.1f}%", f"{dns_enabled:,} domains")
-                                    
-                                    with col3:
-                                        web_enabled = federal_metrics.get('web_ipv6_enabled', 0)
-                                        web_pct = (web_enabled / total_domains * 100) if total_domains > 0 else 0
-                                        st.metric("Web IPv6 Enabled", f"{web_pct:.1f}%", f"{web_enabled:,} domains")
-                                    
-                                    with col4:
-                                        full_support = federal_metrics.get('full_ipv6_support', 0)
-                                        full_pct = (full_support / total_domains * 100) if total_domains > 0 else 0
-                                        st.metric("Full IPv6 Support", f"{full_pct:.1f}%", f"{full_support:,} domains")
-                                
-                                # Federal agency performance chart
-                                agency_data = nist_data.get('agency_performance_breakdown', {})
-                                if agency_data:
-                                    st.subheader("📊 Federal Agency IPv6 Performance")
-                                    fig_agency = chart_generator.create_nist_federal_agency_chart(agency_data)
-                                    st.plotly_chart(fig_agency, use_container_width=True)
-                                
-                                # Service breakdown visualization
-                                service_data = nist_data.get('service_specific_analysis', {})
-                                if service_data:
-                                    col1, col2 = st.columns(2)
-                                    
-                                    with col1:
-                                        st.subheader("🔧 Service Deployment Breakdown")
-                                        fig_services = chart_generator.create_nist_service_breakdown_chart(service_data)
-                                        st.plotly_chart(fig_services, use_container_width=True)
-                                    
-                                    with col2:
-                                        st.subheader("📈 Federal Compliance Timeline")
-                                        timeline_data = nist_data.get('compliance_timeline', {})
-                                        if timeline_data:
-                                            fig_timeline = chart_generator.create_nist_compliance_timeline_chart(timeline_data)
-                                            st.plotly_chart(fig_timeline, use_container_width=True)
-                                
-                                # Geographic distribution of federal deployment
-                                geo_data = nist_data.get('geographic_federal_distribution', {})
-                                if geo_data:
-                                    st.subheader("🗺️ Geographic Distribution of Federal IPv6 Deployment")
-                                    fig_geo = chart_generator.create_nist_geographic_distribution_chart(geo_data)
-                                    st.plotly_chart(fig_geo, use_container_width=True)
-                                    
-                                # Federal mandate progress
-                                mandate_status = nist_data.get('mandate_status', {})
-                                if mandate_status:
-                                    st.warning(f"**Federal Mandate Status**: Target {mandate_status.get('target_percentage', '80%')} IPv6-only by {mandate_status.get('target_date', 'End of FY 2025')} (OMB M-21-07)")
-                                    
-                                    # Current progress assessment
-                                    current_adoption = service_data.get('combined_score', 40.0) if service_data else 40.0
-                                    target_pct = int(mandate_status.get('target_percentage', '80').replace('%', ''))
-                                    progress = (current_adoption / target_pct) * 100
-                                    
-                                    st.progress(progress/100)
-                                    st.write(f"**Progress**: {current_adoption:.1f}% of {target_pct}% target ({progress:.1f}% complete)")
-                                    
-                                    if progress < 70:
-                                        st.error("⚠️ Federal agencies are significantly behind schedule for the 2025 IPv6-only mandate")
-                                    elif progress < 90:
-                                        st.warning("⏰ Federal agencies need to accelerate deployment to meet 2025 targets")
-                                    else:
-                                        st.success("✅ Federal agencies are on track to meet 2025 IPv6-only mandate")
-                                
-                                st.caption("📊 **Data Source**: NIST USGv6 Deployment Monitor - Real-time federal government IPv6 deployment tracking")
-                                
-                        except Exception as e:
-                            st.info("🏛️ **Federal IPv6 Analysis**: Comprehensive NIST USGv6 deployment data available - showing federal government IPv6 progress toward 80% mandate by 2025")
-                    
-                    # Technical details
-                    with st.expander("🔧 Technical Implementation Details", expanded=False):
-                        st.write(f"**Estimated Network Details for {selected_country}:**")
-                        st.write(f"• **Dual-Stack Deployment**: {min(selected_data['ipv6_percentage'] * 0.7, 80):.1f}% of traffic")
-                        st.write(f"• **IPv6-Only Networks**: {max(selected_data['ipv6_percentage'] - 60, 0):.1f}% of new deployments")
-                        st.write(f"• **Enterprise Adoption**: {min(selected_data['ipv6_percentage'] * 0.6, 70):.1f}% of large organizations")
-                        st.write(f"• **Residential Support**: {min(selected_data['ipv6_percentage'] * 0.9, 90):.1f}% of households with capable ISPs")
+                            insights.append(f"Facebook users show higher IPv6 adoption ({fb_ipv6:.1f}%) compared to general web traffic ({cf_ipv6:.1f}%), indicating mobile-first usage patterns")
+
+                st.markdown("\n\n".join(f"• {insight}" for insight in insights))
+
+            except Exception:
+                # Fallback to basic insights
+                if selected_data['ipv6_percentage'] >= 70:
+                    insights = [
+                        f"{selected_country} is among the global leaders in IPv6 adoption",
+                        "Mobile networks likely driving high adoption rates",
+                        "Government and regulatory support for IPv6 transition",
+                        "ISPs have completed major IPv6 infrastructure investments"
+                    ]
+                elif selected_data['ipv6_percentage'] >= 50:
+                    insights = [
+                        f"{selected_country} shows strong IPv6 progress with over 50% adoption",
+                        "Major ISPs have deployed IPv6 with dual-stack configurations",
+                        "Corporate and residential deployments accelerating",
+                        "Mobile carriers leading IPv6 implementation"
+                    ]
+                else:
+                    insights = [
+                        f"{selected_country} is actively transitioning to IPv6",
+                        "IPv6 deployment varies by region and network type"
+                    ]
+
+                st.markdown("\n\n".join(f"• {insight}" for insight in insights))
+
+            # Add comprehensive NIST USGv6 federal deployment analysis for US
+            if selected_country.upper() == 'UNITED STATES' or selected_country.upper() == 'USA':
+                st.subheader("🏛️ Federal Government IPv6 Deployment (NIST USGv6)")
+
+                try:
+                    with st.spinner("Loading NIST USGv6 data..."):
+                        nist_data = data_collector.get_nist_usgv6_deployment_stats()
+                    if nist_data and 'error' not in nist_data:
+
+                        # Federal deployment metrics overview
+                        federal_metrics = nist_data.get('federal_deployment_metrics', {})
+                        if federal_metrics:
+                            col1, col2, col3, col4 = st.columns(4)
+
+                            with col1:
+                                total_domains = federal_metrics.get('total_gov_domains_tested', 0)
+                                st.metric("Total .gov Domains", f"{total_domains:,}")
+
+                            with col2:
+                                dns_enabled = federal_metrics.get('dns_ipv6_enabled', 0)
+                                dns_pct = (dns_enabled / total_domains * 100) if total_domains > 0 else 0
+                                st.metric("DNS IPv6 Enabled", f"{dns_pct:.1f}%", f"{dns_enabled:,} domains")
+
+                            with col3:
+                                web_enabled = federal_metrics.get('web_ipv6_enabled', 0)
+                                web_pct = (web_enabled / total_domains * 100) if total_domains > 0 else 0
+                                st.metric("Web IPv6 Enabled", f"{web_pct:.1f}%", f"{web_enabled:,} domains")
+
+                            with col4:
+                                full_support = federal_metrics.get('full_ipv6_support', 0)
+                                full_pct = (full_support / total_domains * 100) if total_domains > 0 else 0
+                                st.metric("Full IPv6 Support", f"{full_pct:.1f}%", f"{full_support:,} domains")
+
+                        # Federal agency performance chart
+                        agency_data = nist_data.get('agency_performance_breakdown', {})
+                        if agency_data:
+                            st.subheader("📊 Federal Agency IPv6 Performance")
+                            fig_agency = chart_generator.create_nist_federal_agency_chart(agency_data)
+                            st.plotly_chart(fig_agency, use_container_width=True)
+
+                        # Service breakdown visualization
+                        service_data = nist_data.get('service_specific_analysis', {})
+                        if service_data:
+                            col1, col2 = st.columns(2)
+
+                            with col1:
+                                st.subheader("🔧 Service Deployment Breakdown")
+                                fig_services = chart_generator.create_nist_service_breakdown_chart(service_data)
+                                st.plotly_chart(fig_services, use_container_width=True)
+
+                            with col2:
+                                st.subheader("📈 Federal Compliance Timeline")
+                                timeline_data = nist_data.get('compliance_timeline', {})
+                                if timeline_data:
+                                    fig_timeline = chart_generator.create_nist_compliance_timeline_chart(timeline_data)
+                                    st.plotly_chart(fig_timeline, use_container_width=True)
+
+                        # Geographic distribution of federal deployment
+                        geo_data = nist_data.get('geographic_federal_distribution', {})
+                        if geo_data:
+                            st.subheader("🗺️ Geographic Distribution of Federal IPv6 Deployment")
+                            fig_geo = chart_generator.create_nist_geographic_distribution_chart(geo_data)
+                            st.plotly_chart(fig_geo, use_container_width=True)
+
+                        # Federal mandate progress
+                        mandate_status = nist_data.get('mandate_status', {})
+                        if mandate_status:
+                            st.warning(f"**Federal Mandate Status**: Target {mandate_status.get('target_percentage', '80%')} IPv6-only by {mandate_status.get('target_date', 'End of FY 2025')} (OMB M-21-07)")
+
+                            # Current progress assessment
+                            current_adoption = service_data.get('combined_score', 40.0) if service_data else 40.0
+                            target_pct = int(mandate_status.get('target_percentage', '80').replace('%', ''))
+                            progress = (current_adoption / target_pct) * 100
+
+                            st.progress(progress/100)
+                            st.write(f"**Progress**: {current_adoption:.1f}% of {target_pct}% target ({progress:.1f}% complete)")
+
+                            if progress < 70:
+                                st.error("⚠️ Federal agencies are significantly behind schedule for the 2025 IPv6-only mandate")
+                            elif progress < 90:
+                                st.warning("⏰ Federal agencies need to accelerate deployment to meet 2025 targets")
+                            else:
+                                st.success("✅ Federal agencies are on track to meet 2025 IPv6-only mandate")
+
+                        st.caption("📊 **Data Source**: NIST USGv6 Deployment Monitor - Real-time federal government IPv6 deployment tracking")
+
+                except Exception as e:
+                    st.info("🏛️ **Federal IPv6 Analysis**: Comprehensive NIST USGv6 deployment data available - showing federal government IPv6 progress toward 80% mandate by 2025")
+
+            # Technical details
+            with st.expander("🔧 Technical Implementation Details", expanded=False):
+                st.markdown(
+                    f"**Estimated Network Details for {selected_country}:**\n\n"
+                    f"• **Dual-Stack Deployment**: {min(selected_data['ipv6_percentage'] * 0.7, 80):.1f}% of traffic\n\n"
+                    f"• **IPv6-Only Networks**: {max(selected_data['ipv6_percentage'] - 60, 0):.1f}% of new deployments\n\n"
+                    f"• **Enterprise Adoption**: {min(selected_data['ipv6_percentage'] * 0.6, 70):.1f}% of large organizations\n\n"
+                    f"• **Residential Support**: {min(selected_data['ipv6_percentage'] * 0.9, 90):.1f}% of households with capable ISPs"
+                )
+
+
+# Country Analysis Page
+def render_country_analysis_page(data_collector, chart_generator):
+    """Render the Country Analysis page"""
+    st.header("🏛️ Country-Specific IPv6 Analysis")
+    
+    # Get country statistics data
+    try:
+        with st.spinner("Loading Google data..."):
+            country_stats = data_collector.get_google_country_stats()
+        
+        if country_stats:
+            # Create interactive world map with clickable countries
+            st.subheader("🗺️ Interactive World IPv6 Adoption Map")
+            st.markdown("*Hover over any country to view its IPv6 statistics*")
+            
+            # One Scattergeo trace per adoption band instead of two Leaflet
+            # objects per country; the figure is reused until the stats change
+            fig = get_country_map_figure(country_stats)
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Country selection for detailed analysis; a fragment, so picking
+            # a country reruns only this section, not the world map above.
+            # The lookup is built here, so fragment reruns reuse it as-is
+            render_country_detail(
+                data_collector, {c['country']: c for c in country_stats}
+            )
             
             # Top performers summary
             st.subheader("🏆 Global IPv6 Leaders")
@@ -4142,27 +3108,16 @@ elif current_view == "Country Analysis":
             col1, col2 = st.columns(2)
             
             with col1:
-                st.write("**Top 5 Countries:**")
-                for i, country in enumerate(top_countries[:5], 1):
-                    st.write(f"{i}. **{country['country']}** - {country['ipv6_percentage']}%")
+                st.markdown("**Top 5 Countries:**\n\n" + "\n\n".join(f"{i}. **{country['country']}** - {country['ipv6_percentage']}%" for i, country in enumerate(top_countries[:5], 1)))
             
             with col2:
-                st.write("**Countries 6-10:**")
-                for i, country in enumerate(top_countries[5:10], 6):
-                    st.write(f"{i}. **{country['country']}** - {country['ipv6_percentage']}%")
+                st.markdown("**Countries 6-10:**\n\n" + "\n\n".join(f"{i}. **{country['country']}** - {country['ipv6_percentage']}%" for i, country in enumerate(top_countries[5:10], 6)))
             
             # Regional analysis
             st.subheader("🌍 Regional Breakdown")
             
-            # Group countries by region (simplified)
-            regions = {
-                'Europe': ['France', 'Germany', 'United Kingdom', 'Netherlands', 'Belgium', 'Italy', 'Spain'],
-                'Asia-Pacific': ['India', 'Japan', 'Australia', 'South Korea', 'China'],
-                'Americas': ['United States', 'Canada', 'Brazil']
-            }
-            
             region_stats = {}
-            for region, countries in regions.items():
+            for region, countries in REGION_COUNTRIES.items():
                 region_countries = [c for c in country_stats if c['country'] in countries]
                 if region_countries:
                     avg_adoption = sum(c['ipv6_percentage'] for c in region_countries) / len(region_countries)
@@ -4185,13 +3140,29 @@ elif current_view == "Country Analysis":
         st.error(f"Error loading country analysis: {str(e)}")
         st.info("Please check the data sources and try again.")
 
+
 # BGP Statistics Page
-elif current_view == "BGP Statistics":
+def render_bgp_statistics_page(data_collector, chart_generator):
+    """Render the BGP Statistics page"""
+    import plotly.express as px
+
     st.header("🔀 IPv6 BGP Routing Statistics")
+
+    # Start every BGP source in the background so each section below paints
+    # as soon as its own data is ready
+    data_collector.prefetch({
+        'current': data_collector.get_current_bgp_stats,
+        'historical': data_collector.get_bgp_historical_data,
+        'prefix_dist': data_collector.get_prefix_size_distribution,
+        'top_asns': data_collector.get_top_asns_by_prefixes,
+        'cisco_6lab': data_collector.get_cisco_6lab_stats,
+        'routeviews': data_collector.get_routeviews_bgp_stats,
+    })
     
     try:
         # Current BGP table size
-        bgp_current = data_collector.get_current_bgp_stats()
+        with st.spinner("Loading current BGP table data..."):
+            bgp_current = data_collector.get_current_bgp_stats()
         
         col1, col2, col3 = st.columns(3)
         
@@ -4220,7 +3191,8 @@ elif current_view == "BGP Statistics":
 
         # BGP growth chart
         st.subheader("📊 IPv6 BGP Table Growth")
-        bgp_historical = data_collector.get_bgp_historical_data()
+        with st.spinner("Loading BGP history data..."):
+            bgp_historical = data_collector.get_bgp_historical_data()
         
         if bgp_historical:
             fig = chart_generator.create_bgp_growth_chart(bgp_historical)
@@ -4228,7 +3200,8 @@ elif current_view == "BGP Statistics":
         
         # Prefix size distribution
         st.subheader("📏 IPv6 Prefix Size Distribution")
-        prefix_dist = data_collector.get_prefix_size_distribution()
+        with st.spinner("Loading prefix size distribution data..."):
+            prefix_dist = data_collector.get_prefix_size_distribution()
         
         if prefix_dist:
             fig = chart_generator.create_prefix_distribution_chart(prefix_dist)
@@ -4236,7 +3209,8 @@ elif current_view == "BGP Statistics":
         
         # Top ASNs by prefix count
         st.subheader("🏢 Top Autonomous Systems by IPv6 Prefixes")
-        top_asns = data_collector.get_top_asns_by_prefixes()
+        with st.spinner("Loading top ASNs data..."):
+            top_asns = data_collector.get_top_asns_by_prefixes()
         
         if top_asns:
             fig = chart_generator.create_top_asns_chart(top_asns)
@@ -4246,7 +3220,8 @@ elif current_view == "BGP Statistics":
         st.subheader("🌍 Cisco 6lab - Regional & Global IPv6 User Adoption")
 
         try:
-            cisco_stats = data_collector.get_cisco_6lab_stats()
+            with st.spinner("Loading Cisco 6lab data..."):
+                cisco_stats = data_collector.get_cisco_6lab_stats()
             regional_data = cisco_stats.get('regional_data', {})
 
             if regional_data:
@@ -4294,7 +3269,6 @@ elif current_view == "BGP Statistics":
                     st.markdown("#### 🏆 Top 10 Countries by IPv6 User Adoption")
 
                     # Create dataframe for top countries
-                    import pandas as pd
                     top_df = pd.DataFrame(top_countries)
                     top_df['Rank'] = range(1, len(top_df) + 1)
                     top_df = top_df[['Rank', 'country', 'ipv6_percentage', 'country_code']]
@@ -4315,10 +3289,8 @@ elif current_view == "BGP Statistics":
         )
 
         try:
-            import plotly.express as px
-            import pandas as _pd_bgp
-
-            rv_stats = data_collector.get_routeviews_bgp_stats()
+            with st.spinner("Loading RouteViews data..."):
+                rv_stats = data_collector.get_routeviews_bgp_stats()
 
             rv_col1, rv_col2, rv_col3 = st.columns(3)
             with rv_col1:
@@ -4343,7 +3315,7 @@ elif current_view == "BGP Statistics":
             # Per-RIR IPv6 peer counts
             rir_peers = rv_stats.get('rir_ipv6_peers', {})
             if any(rir_peers.values()):
-                rir_df = _pd_bgp.DataFrame([
+                rir_df = pd.DataFrame([
                     {'RIR': k.upper().replace('RIPENCC', 'RIPE NCC'), 'IPv6 Peers': v}
                     for k, v in sorted(rir_peers.items(), key=lambda x: -x[1])
                 ])
@@ -4352,16 +3324,17 @@ elif current_view == "BGP Statistics":
                     title=f'IPv6 BGP Peers by RIR — Routeviews snapshot {rv_stats.get("rir_snapshot_date", "")}',
                     color='IPv6 Peers', color_continuous_scale='Blues',
                     text='IPv6 Peers',
+                    height=350
                 )
                 fig_rir.update_traces(textposition='outside')
-                fig_rir.update_layout(height=350, showlegend=False)
+                fig_rir.update_layout(showlegend=False)
                 st.plotly_chart(fig_rir, use_container_width=True)
 
             # Per-collector table
             cstats = rv_stats.get('collector_stats', [])
             if cstats:
                 with st.expander(f"Per-Collector IPv6 Prefix Counts ({len(cstats)} collectors)"):
-                    cdf = _pd_bgp.DataFrame(cstats)
+                    cdf = pd.DataFrame(cstats)
                     display_cols = [c for c in
                         ['collector', 'date', 'ipv6_prefix_count', 'ipv4_prefix_count', 'ipv6_peer_count']
                         if c in cdf.columns]
@@ -4381,8 +3354,29 @@ elif current_view == "BGP Statistics":
     except Exception as e:
         st.error(f"Error loading BGP statistics: {str(e)}")
 
+
+# Historical Trends milestones; live Cloudflare/NIST entries are appended to the base set
+BASE_MILESTONES = (
+    ("2024 Q4", "Global adoption reached 45% (Google statistics)"),
+    ("2025 Q1", "US crossed 50% threshold"),
+    ("2025 Q2", "Mobile IPv6 usage exceeded 80% in developed countries"),
+    ("2025 Q3", "France achieved 80% adoption rate"),
+)
+FALLBACK_MILESTONES = (
+    ("2024 Q4", "Global adoption reached 45%"),
+    ("2025 Q1", "US crossed 50% threshold"),
+    ("2025 Q2", "Mobile IPv6 usage exceeded 80% in developed countries"),
+    ("2025 Q3", "France achieved 80% adoption rate"),
+    ("2025 End", "Federal mandate target: 80% IPv6-only (OMB M-21-07)"),
+)
+
+
 # Historical Trends Page  
-elif current_view == "Historical Trends":
+@st.fragment
+def render_historical_trends_page(data_collector, chart_generator):
+    """Render the Historical Trends page"""
+    import plotly.express as px
+
     st.header("📈 Historical IPv6 Adoption Trends")
     
     # Time range selector
@@ -4435,32 +3429,29 @@ elif current_view == "Historical Trends":
                         labels={'allocations': 'IPv6 Allocations', 'year': 'Year'},
                         text='allocations',
                         color='allocations',
-                        color_continuous_scale='Blues'
+                        color_continuous_scale='Blues',
+                        height=400
                     )
                     fig.update_traces(texttemplate='%{text}', textposition='outside')
-                    fig.update_layout(height=400)
                     st.plotly_chart(fig, use_container_width=True)
                     
                     # Growth trends
                     growth_trends = arin_historical.get('growth_trends', {})
                     if growth_trends:
                         st.subheader("📈 ARIN Growth Trends by Period")
-                        for period, description in growth_trends.items():
-                            st.write(f"**{period}**: {description}")
+                        st.markdown("\n\n".join(f"**{period}**: {description}" for period, description in growth_trends.items()))
                     
                     # Deployment phases
                     phases = arin_historical.get('deployment_phases', [])
                     if phases:
                         st.subheader("🚀 IPv6 Deployment Phases")
-                        for phase in phases:
-                            st.write(f"• {phase}")
+                        st.markdown("\n\n".join(f"• {phase}" for phase in phases))
                     
                     # Key drivers
                     drivers = arin_historical.get('key_drivers', [])
                     if drivers:
                         st.subheader("🎯 Key Deployment Drivers")
-                        for driver in drivers:
-                            st.write(f"• {driver}")
+                        st.markdown("\n\n".join(f"• {driver}" for driver in drivers))
         except Exception:
             pass
         
@@ -4549,10 +3540,10 @@ elif current_view == "Historical Trends":
                                     labels={'adoption': 'Average IPv6 Adoption %', 'region': 'Region'},
                                     color='adoption',
                                     color_continuous_scale='viridis',
-                                    text='adoption'
+                                    text='adoption',
+                                    height=350
                                 )
                                 fig_regional.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-                                fig_regional.update_layout(height=350)
                                 st.plotly_chart(fig_regional, use_container_width=True)
                                 
                                 # Regional insights
@@ -4569,8 +3560,7 @@ elif current_view == "Historical Trends":
                             st.subheader("📈 Platform Traffic Insights")
                             traffic_patterns = platform_insights.get('traffic_patterns', [])
                             if traffic_patterns:
-                                for pattern in traffic_patterns[:3]:  # Show top 3 patterns
-                                    st.write(f"• {pattern}")
+                                st.markdown("\n\n".join(f"• {pattern}" for pattern in traffic_patterns[:3]))  # Show top 3 patterns
                         
                         # Opt-in experimental simulated trend
                         st.subheader("🧪 Experimental Analysis")
@@ -4584,14 +3574,13 @@ elif current_view == "Historical Trends":
                             st.warning("⚠️ **Simulated Data**: The following chart shows modeled historical progression, not measured data.")
                             
                             # Parse time range for proper date handling
-                            import datetime
-                            current_year = datetime.datetime.now().year
+                            current_year = datetime.now().year
                             
                             # Map time range to years
                             if time_range == "Last 6 Months":
                                 months = 6
-                                start_date = datetime.datetime.now() - datetime.timedelta(days=6*30)
-                                periods = [start_date + datetime.timedelta(days=30*i) for i in range(7)]
+                                start_date = datetime.now() - timedelta(days=6*30)
+                                periods = [start_date + timedelta(days=30*i) for i in range(7)]
                                 x_values = [p.strftime('%Y-%m') for p in periods]
                             elif time_range == "Last Year":
                                 years = list(range(current_year - 1, current_year + 1))
@@ -4631,10 +3620,10 @@ elif current_view == "Historical Trends":
                                         title=f'Facebook Platform IPv6 Adoption - Simulated Trend ({time_range})',
                                         labels={'adoption': 'IPv6 Adoption % (Simulated)', 'period': 'Time Period'},
                                         markers=True,
-                                        line_shape='spline'
+                                        line_shape='spline',
+                                        height=400
                                     )
                                     fig_sim.update_traces(line_color='orange', line_dash='dash')
-                                    fig_sim.update_layout(height=400)
                                     st.plotly_chart(fig_sim, use_container_width=True)
                                     
                                     st.caption("⚠️ **Simulated (not measured)**: Chart shows modeled progression based on typical S-curve adoption patterns")
@@ -4663,16 +3652,12 @@ elif current_view == "Historical Trends":
         
         try:
             # Get enhanced data for milestones
-            cloudflare_data = data_collector.get_cloudflare_radar_stats()
-            nist_data = data_collector.get_nist_usgv6_deployment_stats()
+            with st.spinner("Loading milestone data..."):
+                cloudflare_data = data_collector.get_cloudflare_radar_stats()
+                nist_data = data_collector.get_nist_usgv6_deployment_stats()
             
             # Base milestones
-            milestones = [
-                ("2024 Q4", "Global adoption reached 45% (Google statistics)"),
-                ("2025 Q1", "US crossed 50% threshold"),
-                ("2025 Q2", "Mobile IPv6 usage exceeded 80% in developed countries"),
-                ("2025 Q3", "France achieved 80% adoption rate"),
-            ]
+            milestones = list(BASE_MILESTONES)
             
             # Add enhanced milestones from new data
             if cloudflare_data and 'error' not in cloudflare_data:
@@ -4696,21 +3681,11 @@ elif current_view == "Historical Trends":
                     milestones.append(("2024 End", f"Federal milestone: {milestone_2024}"))
             
             # Display all milestones
-            for date, milestone in milestones:
-                st.write(f"**{date}**: {milestone}")
+            st.markdown("\n\n".join(f"**{date}**: {milestone}" for date, milestone in milestones))
                 
         except Exception:
             # Fallback milestones
-            milestones = [
-                ("2024 Q4", "Global adoption reached 45%"),
-                ("2025 Q1", "US crossed 50% threshold"),
-                ("2025 Q2", "Mobile IPv6 usage exceeded 80% in developed countries"),
-                ("2025 Q3", "France achieved 80% adoption rate"),
-                ("2025 End", "Federal mandate target: 80% IPv6-only (OMB M-21-07)"),
-            ]
-            
-            for date, milestone in milestones:
-                st.write(f"**{date}**: {milestone}")
+            st.markdown("\n\n".join(f"**{date}**: {milestone}" for date, milestone in FALLBACK_MILESTONES))
         
         # Add comprehensive insights section
         st.subheader("🔍 Advanced Deployment Analysis")
@@ -4721,21 +3696,25 @@ elif current_view == "Historical Trends":
             
             with col1:
                 st.write("**Global Traffic Insights:**")
-                cloudflare_data = data_collector.get_cloudflare_radar_stats()
+                with st.spinner("Loading Cloudflare Radar data..."):
+                    cloudflare_data = data_collector.get_cloudflare_radar_stats()
                 if cloudflare_data and 'error' not in cloudflare_data:
                     insights = cloudflare_data.get('key_metrics', [])
-                    for insight in insights[:3]:  # Show first 3 insights
-                        st.write(f"• {insight}")
+                    st.markdown("\n\n".join(f"• {insight}" for insight in insights[:3]))  # Show first 3 insights
                         
             with col2:
                 st.write("**Federal Implementation:**")
-                nist_data = data_collector.get_nist_usgv6_deployment_stats()
+                with st.spinner("Loading NIST USGv6 data..."):
+                    nist_data = data_collector.get_nist_usgv6_deployment_stats()
                 if nist_data and 'error' not in nist_data:
                     agencies = nist_data.get('key_agencies', {})
+                    agency_lines = []
                     if agencies.get('leading'):
-                        st.write("• Leading agencies: " + ", ".join(agencies['leading'][:2]))
+                        agency_lines.append("• Leading agencies: " + ", ".join(agencies['leading'][:2]))
                     if agencies.get('behind_targets'):
-                        st.write("• Behind schedule: " + ", ".join(agencies['behind_targets'][:2]))
+                        agency_lines.append("• Behind schedule: " + ", ".join(agencies['behind_targets'][:2]))
+                    if agency_lines:
+                        st.markdown("\n\n".join(agency_lines))
         
         except Exception:
             pass
@@ -4743,8 +3722,32 @@ elif current_view == "Historical Trends":
     except Exception as e:
         st.error(f"Error loading historical trends: {str(e)}")
 
+
+@st.cache_data(ttl=86400, show_spinner=False)  # Matches the 24h TTL of the daily fetchers
+def get_refresh_timestamp() -> str:
+    """UTC start of the current data cache window, formatted once per window"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+# Static methodology copy for the Data Sources page
+DATA_METHODOLOGY_MD = """
+**Data Collection**: All statistics are fetched directly from official APIs and data feeds. 
+No synthetic or estimated data is used.
+
+**Update Schedule**: The dashboard automatically refreshes data according to each source's 
+update frequency, typically daily for BGP data and real-time for adoption statistics.
+
+**Data Quality**: All sources are cross-referenced where possible to ensure accuracy. 
+Any discrepancies or data unavailability are clearly indicated.
+
+**Caching**: Data is cached appropriately to balance real-time accuracy with performance, 
+with cache durations matching source update frequencies.
+"""
+
+
 # Data Sources Page
-elif current_view == "Data Sources":
+def render_data_sources_page(data_collector, chart_generator):
+    """Render the Data Sources page"""
     st.header("📚 Data Sources & Attribution")
     
     st.markdown("""
@@ -4755,167 +3758,43 @@ elif current_view == "Data Sources":
     # Primary sources
     st.subheader("🔍 Primary Data Sources")
     
-    sources = [
-        {
-            "name": "Internet Society Pulse",
-            "url": "https://pulse.internetsociety.org/technologies",
-            "description": "Comprehensive technology adoption measurements including IPv6, HTTPS, TLS 1.3, and DNSSEC across top 1000 websites globally",
-            "data_types": ["Global website IPv6 support", "Regional breakdowns", "Technology adoption trends", "DNSSEC and TLS statistics"],
-            "update_frequency": "Weekly"
-        },
-        {
-            "name": "World IPv6 Launch",
-            "url": "http://www.worldipv6launch.org/measurements/",
-            "description": "Network operator IPv6 deployment measurements from participating ISPs and network providers worldwide",
-            "data_types": ["ISP deployment percentages", "Network operator rankings", "Traffic volume analysis"],
-            "update_frequency": "Weekly"
-        },
-        {
-            "name": "Akamai IPv6 Statistics",
-            "url": "http://www.akamai.com/ipv6/",
-            "description": "IPv6 adoption visualization based on Akamai's global CDN traffic analysis",
-            "data_types": ["Country-level IPv6 traffic", "Network provider statistics", "Real-time adoption rates"],
-            "update_frequency": "Daily"
-        },
-        {
-            "name": "Eric Vyncke IPv6 Status",
-            "url": "https://www.vyncke.org/ipv6status/",
-            "description": "IPv6 deployment status tracking for top websites per country and TLD analysis",
-            "data_types": ["Website IPv6 deployment by country", "Top-level domain analysis", "Regional deployment maps"],
-            "update_frequency": "Daily"
-        },
-        {
-            "name": "BGP Stuff",
-            "url": "https://bgpstuff.net/totals",
-            "description": "Real-time BGP routing table statistics with current IPv4 and IPv6 prefix counts",
-            "data_types": ["Real-time IPv6 prefix count", "IPv4 prefix count", "Routing table totals"],
-            "update_frequency": "Real-time"
-        },
-        {
-            "name": "Cisco 6lab",
-            "url": "https://6lab.cisco.com",
-            "data_url": "https://6lab-stats.com/6lab-stats/",
-            "description": "Comprehensive IPv6 user adoption statistics by Regional Internet Registry (RIR) based on Google and APNIC measurements, providing daily updated country-level IPv6 user percentages across 200+ countries",
-            "data_types": ["RIR-level user adoption", "Country-level IPv6 percentages", "Regional adoption rates", "Global user statistics"],
-            "update_frequency": "Daily"
-        },
-        {
-            "name": "Google IPv6 Statistics",
-            "url": "https://www.google.com/intl/en/ipv6/statistics.html",
-            "description": "Real-time global IPv6 adoption rates collected from Google services traffic analysis",
-            "data_types": ["Country-level adoption rates", "Historical trends", "Global percentages"],
-            "update_frequency": "Daily"
-        },
-        {
-            "name": "APNIC IPv6 Measurement Maps",
-            "url": "https://stats.labs.apnic.net/ipv6/",
-            "description": "IPv6 capability measurements across different networks and regions",
-            "data_types": ["Network-level IPv6 capability", "Regional statistics", "ISP analysis"],
-            "update_frequency": "Real-time"
-        },
-        {
-            "name": "Cloudflare Radar IPv6 Report",
-            "url": "https://radar.cloudflare.com/adoption-and-usage#traffic-characteristics",
-            "description": "Global IPv6 adoption analysis based on traffic to Cloudflare's network with country-level insights and mobile traffic data",
-            "data_types": ["HTTP traffic IPv6 percentage", "Country-level adoption", "Mobile vs desktop comparison", "Geographic visualization"],
-            "update_frequency": "Monthly"
-        },
-        {
-            "name": "Cloudflare DNS Analysis",
-            "url": "https://blog.cloudflare.com/ipv6-from-dns-pov/", 
-            "description": "DNS-based IPv6 adoption analysis from 1.1.1.1 resolver showing client-side vs server-side IPv6 deployment gaps",
-            "data_types": ["DNS query analysis", "Client vs server adoption", "Connection success rates", "Top domain IPv6 support"],
-            "update_frequency": "Research-based analysis"
-        },
-        {
-            "name": "Telecom SudParis RIR Statistics",
-            "url": "https://www-public.telecom-sudparis.eu/~maigron/rir-stats/rir-delegations/world/world-ipv6-by-number.html",
-            "description": "Historical IPv6 address allocation statistics from Regional Internet Registries with detailed timeline from 1999-2025",
-            "data_types": ["IPv6 address allocations in /48 blocks", "Historical growth timeline", "RIR-level allocation data", "Long-term trends"],
-            "update_frequency": "Monthly"
-        },
-        {
-            "name": "IPv6 Matrix",
-            "url": "https://ipv6matrix.com/",
-            "description": "Real-time IPv6 enabled host connectivity measurements tracking IPv6 deployment status across networks",
-            "data_types": ["IPv6 host connectivity status", "Real-time measurements", "Network IPv6 readiness", "15-year historical data"],
-            "update_frequency": "Real-time"
-        },
-        {
-            "name": "IPv6-Test.com Statistics", 
-            "url": "https://www.ipv6-test.com/stats/",
-            "description": "Monthly statistics on IPv6 protocol usage evolution, address types, and bandwidth analysis from connection tests",
-            "data_types": ["Default protocol evolution", "IPv6 address types analysis", "Bandwidth measurements", "200+ country statistics"],
-            "update_frequency": "Monthly"
-        },
-        {
-            "name": "RIPE NCC IPv6 Allocations",
-            "url": "https://www-public.telecom-sudparis.eu/~maigron/rir-stats/ripe-allocations/ipv6/ripencc-ipv6-by-country.html", 
-            "description": "IPv6 address allocation statistics by country within the RIPE NCC region covering Europe, Central Asia, and Middle East",
-            "data_types": ["Country-level IPv6 allocations", "RIPE region statistics", "/32 block measurements", "182,113 total addresses"],
-            "update_frequency": "Weekly"
-        },
-        {
-            "name": "Internet Society Pulse",
-            "url": "https://pulse.internetsociety.org/",
-            "description": "Curated Internet technology adoption and resilience data including IPv6, HTTPS, and network infrastructure analysis",
-            "data_types": ["Global IPv6 adoption tracking", "Technology resilience analysis", "Internet shutdowns monitoring", "Regional evolution studies"],
-            "update_frequency": "Real-time/Weekly"
-        },
-        {
-            "name": "ARIN Statistics & Research",
-            "url": "https://www.arin.net/reference/research/statistics/",
-            "description": "Comprehensive IPv6 delegation, transfer, and membership statistics for the North American region",
-            "data_types": ["IPv6/IPv4 delegations", "Transfer statistics", "26,292 member organizations", "Inter-RIR transfers"],
-            "update_frequency": "Monthly"
-        }
-    ]
+    catalog = load_source_catalog()
     
-    for source in sources:
-        with st.expander(f"📊 {source['name']}"):
-            st.write(f"**URL**: [{source['url']}]({source['url']})")
-            st.write(f"**Description**: {source['description']}")
-            st.write(f"**Data Types**:")
-            for data_type in source['data_types']:
-                st.write(f"  • {data_type}")
-            st.write(f"**Update Frequency**: {source['update_frequency']}")
+    for title, source_md in catalog['rendered']:
+        with st.expander(title):
+            st.markdown(source_md)
     
     # Additional sources
     st.subheader("📈 Additional Sources")
     
-    additional_sources = [
-        "Internet Society Deploy360 Programme",
-        "Hurricane Electric IPv6 Statistics",
-        "RIPE NCC IPv6 Statistics",
-        "Akamai State of the Internet Reports",
-        "Cisco Visual Networking Index"
-    ]
-    
-    for source in additional_sources:
-        st.write(f"• {source}")
+    st.markdown("\n\n".join(f"• {source}" for source in catalog['additional']))
     
     # Data methodology
     st.subheader("🔬 Data Methodology")
     
-    st.markdown("""
-    **Data Collection**: All statistics are fetched directly from official APIs and data feeds. 
-    No synthetic or estimated data is used.
-    
-    **Update Schedule**: The dashboard automatically refreshes data according to each source's 
-    update frequency, typically daily for BGP data and real-time for adoption statistics.
-    
-    **Data Quality**: All sources are cross-referenced where possible to ensure accuracy. 
-    Any discrepancies or data unavailability are clearly indicated.
-    
-    **Caching**: Data is cached appropriately to balance real-time accuracy with performance, 
-    with cache durations matching source update frequencies.
-    """)
+    st.markdown(DATA_METHODOLOGY_MD)
     
     # Last updated
     st.subheader("🕒 Last Updated")
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    st.write(f"Dashboard last refreshed: **{current_time}**")
+    st.write(f"Dashboard last refreshed: **{get_refresh_timestamp()}**")
+
+
+# Dispatch straight to the active page instead of walking an if/elif chain
+PAGE_RENDERERS = {
+    "Combined View": render_combined_view_page,
+    "Overview": render_overview_page,
+    "Global Adoption": render_global_adoption_page,
+    "Cloud Services": render_cloud_services_page,
+    "Extended Data Sources": render_extended_sources_page,
+    "Country Analysis": render_country_analysis_page,
+    "BGP Statistics": render_bgp_statistics_page,
+    "Historical Trends": render_historical_trends_page,
+    "Data Sources": render_data_sources_page,
+}
+
+page_renderer = PAGE_RENDERERS.get(current_view)
+if page_renderer:
+    page_renderer(data_collector, chart_generator)
 
 # Footer
-st.markdown("---")
-st.markdown("📊 **Global IPv6 Statistics Dashboard** | Data sourced from Google, APNIC, BGP Potaroo, and CIDR Report")
+st.markdown(FOOTER_MD)
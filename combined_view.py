@@ -0,0 +1,367 @@
+"""
+Combined View rendering for IPv6 Dashboard
+Shared by the standalone Combined View page and the Global Adoption source picker
+"""
+import streamlit as st
+import pandas as pd
+from typing import Dict, Any, Optional
+
+from utils import format_number
+from components import render_consensus_metric, render_fallback_indicator, render_metric_row
+
+# Static summary metrics shown beside the live consensus figure
+SUMMARY_METRICS = (
+    {'label': "IPv6 Websites", 'value': "49%", 'delta': "Top 1000 sites"},
+    {'label': "BGP IPv6 Prefixes", 'value': "228,789", 'delta': "Routing table"},
+)
+
+
+_INSIGHTS_HEAD = (
+    "Global IPv6 adoption continues strong growth, reaching 47%+ of internet users",
+    "Website IPv6 support at 49% for top 1000 sites, with security adoption leading",
+    "Mobile networks show highest IPv6 adoption rates globally",
+    "BGP table growth steady at ~26,000 new IPv6 prefixes annually",
+)
+_INSIGHTS_GAPS = "Deployment gaps remain: only 13.2% actual IPv6 connections vs 43.3% server support"
+_INSIGHTS_FACEBOOK = "Facebook platform provides additional insights into regional IPv6 traffic patterns"
+
+# Key insights pre-rendered as single markdown lists
+INSIGHTS_MD = "\n".join(
+    f"{i}. {insight}" for i, insight in enumerate(_INSIGHTS_HEAD + (_INSIGHTS_GAPS,), 1)
+)
+INSIGHTS_WITH_FACEBOOK_MD = "\n".join(
+    f"{i}. {insight}" for i, insight in enumerate(_INSIGHTS_HEAD + (_INSIGHTS_FACEBOOK, _INSIGHTS_GAPS), 1)
+)
+
+
+def _facebook_summary(facebook_data: Any) -> Optional[Dict[str, Any]]:
+    """Summarise the Facebook snapshot entry, or None if it is unusable or malformed"""
+    if not isinstance(facebook_data, dict) or 'error' in facebook_data:
+        return None
+
+    try:
+        # Only list the top countries when there are at least three of them
+        top_countries = facebook_data.get('top_countries', [])
+        top_3 = []
+        if top_countries and len(top_countries) >= 3:
+            for country in top_countries[:3]:
+                if isinstance(country, dict) and 'country' in country and 'ipv6_percentage' in country:
+                    try:
+                        top_3.append(f"{country['country']} ({float(country['ipv6_percentage'])}%)")
+                    except (ValueError, TypeError):
+                        continue
+
+        return {
+            'adoption_rate': facebook_data.get('global_adoption_rate', 'N/A'),
+            'user_base': facebook_data.get('platform_insights', {}).get('user_base', 'N/A'),
+            'countries_analyzed': facebook_data.get('countries_analyzed', 'N/A'),
+            'top_3': top_3,
+            'source': facebook_data.get('source', 'Facebook IPv6 Statistics'),
+        }
+    except Exception:
+        # A malformed payload only hides the Facebook pieces, not the whole view
+        return None
+
+
+def render_combined_view(data_collector, chart_generator, extended: bool = False):
+    """
+    Render the Combined View from a single batched snapshot
+
+    Args:
+        data_collector: DataCollector instance
+        chart_generator: ChartGenerator instance
+        extended: Include the per-source deep dive (Akamai, Vyncke, Cloudflare,
+            RIRs) shown under Global Adoption instead of the Facebook section
+    """
+    with st.spinner("Loading data from all sources..."):
+        snap = data_collector.get_combined_snapshot()
+
+    # Derive everything from the snapshot before emitting any elements
+    facebook = None if extended else _facebook_summary(snap["facebook"])
+    google_stats = snap["google"]
+    _g_pct = google_stats.get('global_percentage')
+    google_source = google_stats.get('source', 'Google/APNIC')
+    google_fallback = google_stats.get('fallback')
+    pulse_stats = snap["pulse"]
+    pulse_source = pulse_stats.get('source', 'Internet Society Pulse')
+    bgp_stats = snap["bgp"]
+
+    st.success("📊 Displaying comprehensive IPv6 statistics from multiple sources")
+
+    # Always display summary metrics first
+    st.subheader("🌐 Global IPv6 Statistics Summary")
+
+    if facebook:
+        last_metric = {'label': "Facebook IPv6 Traffic", 'value': f"{facebook['adoption_rate']}%", 'delta': f"{facebook['user_base']} users"}
+    else:
+        last_metric = {'label': "IPv6-only Support", 'value': "12%", 'delta': "Cloud providers"}
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        render_consensus_metric(snap["consensus"])
+
+    for col, metric in zip((col2, col3, col4), SUMMARY_METRICS + (last_metric,)):
+        col.metric(metric['label'], metric['value'], delta=metric['delta'])
+
+    # Now show detailed sections
+    st.subheader("📊 Detailed Statistics by Source")
+
+    # Google IPv6 Global Statistics
+    with st.expander("🌐 Google IPv6 Global Statistics", expanded=True):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.metric(
+                "Google / APNIC IPv6 Adoption",
+                f"{_g_pct:.1f}%" if _g_pct is not None else "N/A",
+                delta="User IPv6 capability"
+            )
+
+        with col2:
+            st.info(f"Source: {google_source}")
+
+        if google_fallback:
+            st.caption(
+                "⚠️ Data source updates currently unavailable. "
+                "Using last fetched state — excluded from consensus average."
+            )
+        else:
+            st.caption("Google / APNIC measures the percentage of users with IPv6 capability.")
+
+    # Internet Society Pulse - Website IPv6 Support
+    with st.expander("🌐 Internet Society Pulse - Website IPv6 Support", expanded=True):
+        try:
+            if pulse_stats:
+                # Create metrics for website support
+                render_metric_row([
+                    {'label': "IPv6 Websites", 'value': f"{pulse_stats.get('global_ipv6_websites', 49)}%", 'delta': "Top 1000 sites globally"},
+                    {'label': "HTTPS Websites", 'value': f"{pulse_stats.get('global_https_websites', 95)}%", 'delta': "Security adoption"},
+                    {'label': "TLS 1.3 Websites", 'value': f"{pulse_stats.get('global_tls13_websites', 86)}%", 'delta': "Modern encryption"},
+                ])
+
+                st.success(f"✅ Live data loaded from {pulse_source}")
+
+                if extended:
+                    # Regional comparison from Internet Society Pulse
+                    st.subheader("🗺️ Regional Website IPv6 Support")
+                    pulse_regional = pulse_stats.get('regional_data', {})
+                    if pulse_regional:
+                        fig = chart_generator.create_regional_comparison_chart(pulse_regional)
+                        st.plotly_chart(fig, use_container_width=True)
+
+                    st.caption(f"📄 **Source**: {pulse_source} ({pulse_stats.get('url', '')})")
+            else:
+                st.warning("Pulse data not available")
+
+        except Exception as e:
+            st.warning(f"Pulse data error: {str(e)}")
+
+    if extended:
+        _render_extended_sources(snap, chart_generator)
+
+    # BGP Statistics Summary
+    with st.expander("🔀 BGP IPv6 Routing Statistics", expanded=True):
+        try:
+            if bgp_stats:
+                render_metric_row([
+                    {'label': "IPv6 BGP Prefixes", 'value': format_number(bgp_stats.get('total_prefixes', 228748)), 'delta': "Global routing table"},
+                    {'label': "Yearly Growth", 'value': f"+{format_number(bgp_stats.get('estimated_growth_yearly', 26000))}", 'delta': "New prefixes per year"},
+                ])
+
+                st.success(f"✅ Live data loaded from {bgp_stats.get('source', 'BGP Statistics')}")
+            else:
+                st.warning("BGP data not available")
+
+        except Exception as e:
+            st.warning(f"BGP data error: {str(e)}")
+
+    if not extended:
+        # Facebook IPv6 Platform Statistics
+        with st.expander("📱 Facebook IPv6 Platform Statistics", expanded=True):
+            if facebook:
+                # Platform metrics
+                render_metric_row([
+                    {'label': "Facebook IPv6 Traffic", 'value': f"{facebook['adoption_rate']}%", 'delta': "Global platform traffic"},
+                    {'label': "Platform User Base", 'value': str(facebook['user_base']), 'delta': "Monthly active users"},
+                    {'label': "Countries Analyzed", 'value': str(facebook['countries_analyzed']), 'delta': "Geographic coverage"},
+                ])
+
+                # Show top countries if available
+                if facebook['top_3']:
+                    st.markdown("**🏆 Top IPv6 Countries (Facebook data):**\n\n" + "\n\n".join(f"**{i}.** {country}" for i, country in enumerate(facebook['top_3'], 1)))
+
+                st.success(f"✅ Live data loaded from {facebook['source']}")
+            else:
+                facebook_data = snap["facebook"]
+                error_msg = facebook_data.get('error', 'Data not available') if isinstance(facebook_data, dict) else 'Data not available'
+                st.warning(f"Facebook data: {error_msg}")
+
+    # Summary insights
+    st.subheader("🎯 Key Combined Insights")
+
+    st.markdown(INSIGHTS_MD if extended else INSIGHTS_WITH_FACEBOOK_MD)
+
+
+def _render_extended_sources(snap: Dict[str, Any], chart_generator):
+    """Render the Akamai, Vyncke, Cloudflare and RIR sections of the Combined View"""
+    # Akamai Network Statistics
+    st.subheader("🌐 Akamai - Network IPv6 Adoption")
+
+    try:
+        akamai_stats = snap["akamai"]
+        top_networks = akamai_stats.get('top_networks', [])
+
+        if top_networks:
+            networks_df = pd.DataFrame(top_networks)
+            fig = chart_generator.create_bar_chart(
+                networks_df,
+                'network',
+                'ipv6_percentage',
+                'Top IPv6 Networks by Akamai Traffic'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+            # Display network data table
+            st.subheader("📋 Top Network IPv6 Deployment")
+            st.dataframe(networks_df, use_container_width=True)
+
+        st.caption(f"📄 **Source**: {akamai_stats.get('source', 'Akamai')} ({akamai_stats.get('url', '')})")
+
+    except Exception as e:
+        st.warning(f"Akamai data temporarily unavailable: {str(e)}")
+
+    # Eric Vyncke's Website Deployment Statistics
+    st.subheader("🌐 Eric Vyncke - Website IPv6 Deployment")
+
+    try:
+        vyncke_stats = snap["vyncke"]
+
+        st.info(f"**Measurement Type**: {vyncke_stats.get('measurement_type', 'Website IPv6 deployment')}")
+        st.info(f"**Scope**: {vyncke_stats.get('scope', 'Top websites per country')}")
+        st.caption(f"📄 **Source**: {vyncke_stats.get('source', 'Eric Vyncke')} ({vyncke_stats.get('url', '')})")
+
+    except Exception as e:
+        st.warning(f"Eric Vyncke data temporarily unavailable: {str(e)}")
+
+    # Cloudflare Radar IPv6 Traffic Analysis
+    st.subheader("🌐 Cloudflare Radar - IPv6 Traffic Analysis")
+
+    try:
+        cloudflare_stats = snap["cloudflare"]
+
+        # Create metrics for Cloudflare data
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.metric(
+                "Global IPv6 Traffic",
+                f"{cloudflare_stats.get('global_ipv6_traffic', 36)}%",
+                delta="Based on HTTP requests to Cloudflare"
+            )
+
+        with col2:
+            st.info(f"📱 **Mobile Advantage**: {cloudflare_stats.get('mobile_advantage', 'Mobile traffic shows higher IPv6 adoption')}")
+
+        st.caption(f"📄 **Source**: {cloudflare_stats.get('source', 'Cloudflare Radar')} ({cloudflare_stats.get('url', '')})")
+
+    except Exception as e:
+        st.warning(f"Cloudflare Radar data temporarily unavailable: {str(e)}")
+
+    # Cloudflare DNS Analysis
+    st.subheader("🔍 Cloudflare DNS - Client vs Server Analysis")
+
+    try:
+        dns_stats = snap["cloudflare_dns"]
+        render_fallback_indicator(dns_stats)
+
+        # DNS analysis metrics
+        render_metric_row([
+            {'label': "Client IPv6 Adoption", 'value': f"{dns_stats.get('client_ipv6_adoption', 30.5)}%", 'delta': "DNS queries from clients"},
+            {'label': "Server IPv6 Support", 'value': f"{dns_stats.get('server_ipv6_adoption', 43.3)}%", 'delta': "Servers with IPv6 records"},
+            {'label': "Actual IPv6 Connections", 'value': f"{dns_stats.get('actual_connections', 13.2)}%", 'delta': "Real connections over IPv6"},
+            {'label': "Top 100 Domains", 'value': f"{dns_stats.get('top_domains_ipv6', 60.8)}%", 'delta': "Popular sites IPv6 support"},
+        ])
+
+        st.info("🔍 **Key Insight**: Only 13.2% of connections actually use IPv6, despite 43.3% server support and 30.5% client capability - showing deployment gaps remain")
+        st.caption(f"📄 **Source**: {dns_stats.get('source', 'Cloudflare DNS Analysis')} ({dns_stats.get('url', '')})")
+
+    except Exception as e:
+        st.warning(f"Cloudflare DNS data temporarily unavailable: {str(e)}")
+
+    # Enhanced RIR IPv6 Allocation Data with APNIC and ARIN
+    st.subheader("📊 Global RIR IPv6 Address Allocations")
+
+    # APNIC Asia-Pacific Statistics
+    try:
+        apnic_stats = snap["apnic"]
+
+        if apnic_stats and 'error' not in apnic_stats:
+            st.subheader("🌏 APNIC - Asia-Pacific Region")
+
+            render_metric_row([
+                {'label': "IPv6 Capability", 'value': f"{apnic_stats.get('ipv6_capability_percentage', 45.2)}%", 'delta': "Network ASN coverage"},
+                {'label': "Regional Coverage", 'value': apnic_stats.get('coverage', '56 countries'), 'delta': "Asia-Pacific region"},
+                {'label': "Measurement Type", 'value': "ASN-based", 'delta': "Network analysis"},
+            ])
+
+            # Regional insights
+            insights = apnic_stats.get('deployment_insights', [])
+            if isinstance(insights, str):
+                insights = [insights]
+            if insights:
+                st.markdown("**Key Insights:**\n\n" + "\n\n".join(f"• {insight}" for insight in insights[:3]))  # Show top 3 insights
+
+            st.caption(f"📄 **Source**: {apnic_stats.get('source', 'APNIC Labs')}")
+
+    except Exception as e:
+        st.warning(f"APNIC data temporarily unavailable: {str(e)}")
+
+    # ARIN North America Statistics
+    try:
+        arin_stats = snap["arin"]
+
+        if arin_stats and 'error' not in arin_stats:
+            st.subheader("🇺🇸 ARIN - North America Region")
+
+            render_metric_row([
+                {'label': "IPv6 Allocations", 'value': format_number(arin_stats.get('ipv6_allocations', 87695)), 'delta': "Current delegations"},
+                {'label': "Total Organizations", 'value': format_number(arin_stats.get('total_organizations', 26292)), 'delta': "ARIN members"},
+                {'label': "IPv6 Enabled Orgs", 'value': format_number(arin_stats.get('ipv6_enabled_organizations', 18500)), 'delta': "Active deployments"},
+                {'label': "Deployment Rate", 'value': arin_stats.get('deployment_rate', '70.4%'), 'delta': "IPv6 capability"},
+            ])
+
+            # Regional insights
+            insights = arin_stats.get('regional_insights', [])
+            if isinstance(insights, str):
+                insights = [insights]
+            if insights:
+                st.markdown("**Key Insights:**\n\n" + "\n\n".join(f"• {insight}" for insight in insights[:3]))  # Show top 3 insights
+
+            st.caption(f"📄 **Source**: {arin_stats.get('source', 'ARIN Research Statistics')}")
+
+    except Exception as e:
+        st.warning(f"ARIN data temporarily unavailable: {str(e)}")
+
+    # RIR Historical Comparison
+    try:
+        rir_stats = snap["rir_historical"]
+
+        st.subheader("📈 RIR Historical IPv6 Growth")
+
+        # Historical allocation metrics
+        render_metric_row([
+            {'label': "Total IPv6 Allocations", 'value': format_number(rir_stats.get('total_allocations', 32146945533)), 'delta': f"in {rir_stats.get('allocation_unit', '/48 blocks')}"},
+            {'label': "First IPv6 Allocation", 'value': rir_stats.get('first_allocation_date', 'September 1999'), 'delta': "26 years of IPv6 history"},
+        ])
+
+        # Growth milestones
+        st.subheader("📈 Major IPv6 Allocation Milestones")
+        growth_milestones = rir_stats.get('growth_milestones', [])
+
+        st.markdown("\n\n".join(f"**{period}**: {description}" for period, description in growth_milestones))
+
+        st.caption(f"📄 **Source**: {rir_stats.get('source', 'Telecom SudParis RIR Statistics')} ({rir_stats.get('url', '')})")
+
+    except Exception as e:
+        st.warning(f"RIR historical data temporarily unavailable: {str(e)}")
@@ -3,7 +3,6 @@ Reusable UI components for IPv6 Dashboard
 Reduces code duplication and improves maintainability
 """
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
@@ -29,16 +28,14 @@ def render_metric_row(metrics: List[Dict[str, Any]], cols: Optional[int] = None)
     num_cols = cols or len(metrics)
     cols_list = st.columns(num_cols)
 
-    for idx, metric in enumerate(metrics):
-        if idx >= num_cols:
-            break
-        with cols_list[idx]:
-            st.metric(
-                label=metric.get('label', ''),
-                value=metric.get('value', 'N/A'),
-                delta=metric.get('delta'),
-                help=metric.get('help')
-            )
+    # zip() stops at the shorter sequence, so surplus metrics are dropped
+    for col, metric in zip(cols_list, metrics):
+        col.metric(
+            label=metric.get('label', ''),
+            value=metric.get('value', 'N/A'),
+            delta=metric.get('delta'),
+            help=metric.get('help')
+        )
 
 
 def render_data_source_section(
@@ -195,6 +192,7 @@ def create_simple_bar_chart(
         height: Chart height in pixels
     """
     import pandas as pd
+    import plotly.express as px
     df = pd.DataFrame(data)
 
     fig = px.bar(
@@ -290,6 +288,37 @@ def render_fallback_indicator(data: Dict[str, Any]) -> None:
     st.warning(f"**Estimated data** — {detail}")
 
 
+def render_consensus_metric(consensus: dict):
+    """Render the Global IPv6 Adoption consensus metric consistently.
+
+    Displays the multi-source average when live data is available.
+    Fallback sources are excluded from the average and trigger a disclaimer.
+    """
+    val = consensus.get('consensus')
+    any_fallback = consensus.get('any_fallback', False)
+    all_fallback = consensus.get('all_fallback', False)
+    live_count = consensus.get('live_count', 0)
+    total_count = consensus.get('total_count', 0)
+
+    if val is not None:
+        if all_fallback:
+            delta = "⚠️ All sources estimated"
+        elif any_fallback:
+            delta = f"⚠️ {live_count}/{total_count} live sources"
+        else:
+            delta = f"{live_count}/{total_count} live sources"
+        st.metric("Global IPv6 Adoption (Consensus)", f"{val:.1f}%", delta=delta)
+    else:
+        st.metric("Global IPv6 Adoption (Consensus)", "N/A", delta="No live sources")
+
+    if any_fallback:
+        unavailable = [s['label'] for s in consensus.get('sources', []) if s['fallback']]
+        st.caption(
+            f"⚠️ Data source updates currently unavailable for: {', '.join(unavailable)}. "
+            "Using last fetched state — excluded from consensus average."
+        )
+
+
 def render_comparison_metrics(current: float, previous: float, label: str, format_str: str = "%.1f%%"):
     """
     Render comparison metrics with delta
@@ -317,9 +346,7 @@ def render_source_attribution(sources: List[Dict[str, str]]):
     Args:
         sources: List of dicts with 'name' and 'url' keys
     """
-    st.markdown("#### 📚 Data Sources")
-    for source in sources:
-        st.markdown(f"- [{source['name']}]({source['url']})")
+    st.markdown("#### 📚 Data Sources\n\n" + "\n".join(f"- [{source['name']}]({source['url']})" for source in sources))
 
 
 def paginate_data(data: List[Any], page_size: int = 10, page_key: str = "page"):
@@ -1,16 +1,23 @@
 import requests
-import pandas as pd
-import json
 from datetime import datetime, timedelta
 import time
 import streamlit as st
 import trafilatura
 import re
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 import logging
+import concurrent.futures
 import gc  # Garbage collection for memory optimization
 import os
 from dotenv import load_dotenv
+from performance_config import DATA_LOADING
+
+# Optional: persist raw HTTP responses on disk so a restart does not refetch
+# every source at once
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 # Load environment variables from .env file.
 # override=True ensures .env always takes precedence over any pre-existing
@@ -21,11 +28,28 @@ load_dotenv(override=True)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared pool for background cache warming; lives for the whole process
+_FETCH_WORKERS = DATA_LOADING.get('fetch_workers', 8)
+_prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=_FETCH_WORKERS, thread_name_prefix='prefetch')
+
 class DataCollector:
     """Handles data collection from various IPv6 statistics sources"""
     
     def __init__(self):
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Relative cache paths are anchored next to this module, not the
+            # directory streamlit was started from
+            self.session = requests_cache.CachedSession(
+                os.path.join(
+                    os.path.dirname(os.path.abspath(__file__)),
+                    DATA_LOADING.get('http_cache_path', 'ipv6stats_http_cache'),
+                ),
+                expire_after=DATA_LOADING.get('http_cache_expire', 86400),
+                allowable_codes=(200,),
+                stale_if_error=True,  # Serve the last good response during upstream outages
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'IPv6-Dashboard/1.0 (https://ipv6-stats.app)',
             'Accept-Encoding': 'gzip, deflate',
@@ -33,9 +57,12 @@ class DataCollector:
         })
         # Optimize session for maximum performance and memory efficiency
         from requests.adapters import HTTPAdapter
+        # Keep a pool per upstream host and one connection per fetch worker,
+        # so parallel fetches reuse keep-alive connections instead of
+        # evicting each other's pools and re-handshaking TLS
         adapter = HTTPAdapter(
-            pool_connections=3,  # Reduced for memory optimization
-            pool_maxsize=5,      # Smaller pool for memory efficiency
+            pool_connections=DATA_LOADING.get('host_pools', 24),
+            pool_maxsize=max(DATA_LOADING.get('connection_pool_size', 5), _FETCH_WORKERS),
             max_retries=1        # Fast failure for CPU efficiency
         )
         self.session.mount('http://', adapter)
@@ -44,7 +71,7 @@ class DataCollector:
         # Force garbage collection for memory optimization
         gc.collect()
         
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_google_ipv6_stats(_self) -> Dict[str, Any]:
         """Fetch global IPv6 adoption percentage.
 
@@ -120,7 +147,7 @@ class DataCollector:
             ),
         }
     
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_google_country_stats(_self) -> List[Dict[str, Any]]:
         """Fetch country-specific IPv6 statistics"""
         try:
@@ -149,7 +176,7 @@ class DataCollector:
             logger.error(f"Error fetching country stats: {e}")
             return []
     
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_apnic_stats(_self) -> Optional[Dict[str, Any]]:
         """Fetch IPv6 statistics from APNIC"""
         try:
@@ -178,7 +205,6 @@ class DataCollector:
         is a community-maintained mirror that may or may not remain operational.
         Falls back to regional estimates derived from RIR and APNIC data.
         """
-        import json
         import re
 
         # Candidate URLs — try primary then alternative paths
@@ -293,7 +319,7 @@ class DataCollector:
             'note': 'Cisco 6lab.cisco.com shut down. 6lab-stats.com mirror unavailable. Showing regional estimates.',
         }
     
-    @st.cache_data(ttl=86400, max_entries=1)  # Cache for 24h — BGP tables change daily
+    @st.cache_data(ttl=86400, max_entries=1, show_spinner=False)  # Cache for 24h — BGP tables change daily
     def get_bgp_stats(_self) -> Dict[str, Any]:
         """Fetch BGP IPv6 statistics from BGP Stuff and Potaroo"""
         try:
@@ -353,7 +379,7 @@ class DataCollector:
             'error': 'Live data temporarily unavailable'
         }
     
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_internet_society_pulse_stats(_self) -> Dict[str, Any]:
         """Fetch IPv6 statistics from Internet Society Pulse.
 
@@ -453,7 +479,7 @@ class DataCollector:
             'note': 'Pulse site is JS-rendered. Values are from ISOC published 2024 reports.',
         }
     
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_akamai_stats(_self) -> Dict[str, Any]:
         """Fetch IPv6 statistics from Akamai"""
         try:
@@ -530,7 +556,7 @@ class DataCollector:
             'error': 'Live data temporarily unavailable'
         }
     
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_cloudflare_radar_stats(_self) -> Dict[str, Any]:
         """
         Fetch IPv6 statistics from Cloudflare Radar API
@@ -652,8 +678,7 @@ class DataCollector:
         Fallback sources are included in the returned metadata so callers can
         display appropriate disclaimers.
 
-        Note: no @st.cache_data here — each inner method is already individually
-        cached, so adding a second layer would cause Streamlit nested-cache errors.
+        Not cached itself; see ``fetch_parallel`` for why.
         """
         google = _self.get_google_ipv6_stats()
         cloudflare = _self.get_cloudflare_radar_stats()
@@ -697,6 +722,73 @@ class DataCollector:
             'last_updated': datetime.now().isoformat(),
         }
 
+    def fetch_parallel(_self, fetchers: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """Run independent zero-argument fetchers in a thread pool.
+
+        Returns a dict keyed like ``fetchers``.  A fetcher that raises yields
+        ``{'error': ..., 'fallback': True}`` instead of aborting the batch.
+        Because the fetchers are cached methods, calling this before rendering
+        a page also warms the cache for the page's own direct calls.
+
+        Caching lives on the individual fetchers only.  Helpers that batch or
+        combine them (this method, ``prefetch``, ``get_combined_snapshot``,
+        ``get_global_ipv6_consensus``) are deliberately left uncached: each
+        fetcher's result is already copied out of its own cache, an outer
+        @st.cache_data layer would store a second copy of every payload, and
+        its TTL would override the per-source TTLs the fetchers set.
+        """
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+            futures = {executor.submit(fn): key for key, fn in fetchers.items()}
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    logger.warning(f"Parallel fetch: {key} failed: {e}")
+                    results[key] = {'error': str(e), 'fallback': True}
+        return results
+
+    def prefetch(_self, fetchers: Dict[str, Callable[[], Any]]) -> Dict[str, concurrent.futures.Future]:
+        """Start zero-argument cached fetchers in the background and return at once.
+
+        Pages call this before rendering so each section can paint as soon as
+        its own source is ready.  A section that calls the same cached method
+        while its prefetch is still running waits on Streamlit's per-key
+        compute lock rather than fetching twice.
+        """
+        return {key: _prefetch_executor.submit(fn) for key, fn in fetchers.items()}
+
+    def get_combined_snapshot(_self) -> Dict[str, Any]:
+        """Fetch every source used by the Combined View in one parallel batch.
+
+        The per-source fetchers are network-bound, so running them in a thread
+        pool makes a cold load cost roughly the slowest source rather than the
+        sum of all of them.  A failing source yields a fallback dict carrying
+        the error instead of aborting the whole snapshot.
+
+        Not cached itself; see ``fetch_parallel`` for why.
+        """
+        fetchers = {
+            'google': _self.get_google_ipv6_stats,
+            'pulse': _self.get_internet_society_pulse_stats,
+            'akamai': _self.get_akamai_stats,
+            'vyncke': _self.get_vyncke_stats,
+            'cloudflare': _self.get_cloudflare_radar_stats,
+            'cloudflare_dns': _self.get_cloudflare_dns_stats,
+            'apnic': _self.get_apnic_ipv6_stats,
+            'arin': _self.get_arin_current_stats,
+            'rir_historical': _self.get_rir_historical_stats,
+            'bgp': _self.get_current_bgp_stats,
+            'facebook': _self.get_facebook_ipv6_stats,
+        }
+
+        snapshot = _self.fetch_parallel(fetchers)
+
+        # Inner sources are warm in the cache now, so this is cheap
+        snapshot['consensus'] = _self.get_global_ipv6_consensus()
+        return snapshot
+
     def get_country_code_from_name(_self, country_name: str) -> str:
         """
         Convert country name to ISO 3166-1 alpha-2 country code
@@ -798,7 +890,7 @@ class DataCollector:
                 'url': 'https://radar.cloudflare.com/adoption-and-usage#traffic-characteristics'
             }
 
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_nist_usgv6_deployment_stats(_self) -> Dict[str, Any]:
         """Get comprehensive NIST USGv6 Federal Government IPv6 deployment monitoring statistics"""
         try:
@@ -1673,7 +1765,7 @@ class DataCollector:
                 'source': 'Internet Society Pulse (Error)'
             }
     
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_lacnic_stats(_self):
         """Get LACNIC IPv6 statistics using LACNIC delegation data"""
         try:
@@ -1769,7 +1861,7 @@ class DataCollector:
 
 
 
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=1, show_spinner=False)  # Cache for 30 days (monthly), single entry
     def get_afrinic_stats(_self):
         """Get AFRINIC IPv6 allocation statistics using official delegation data"""
         try:
@@ -2126,7 +2218,7 @@ class DataCollector:
             # Try RIPE NCC API first (covers global resources)
             try:
                 ripe_url = f"https://stat.ripe.net/data/whois/data.json?resource={query}"
-                response = requests.get(ripe_url, timeout=15, headers={'User-Agent': 'IPv6Dashboard/1.0'})
+                response = self.session.get(ripe_url, timeout=15, headers={'User-Agent': 'IPv6Dashboard/1.0'})
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -2145,7 +2237,7 @@ class DataCollector:
                 if query_type == 'ASN' or query.startswith('AS'):
                     asn_num = query.replace('AS', '').replace('as', '')
                     alt_url = f"https://bgpview.io/api/asn/{asn_num}"
-                    response = requests.get(alt_url, timeout=10, headers={'User-Agent': 'IPv6Dashboard/1.0'})
+                    response = self.session.get(alt_url, timeout=10, headers={'User-Agent': 'IPv6Dashboard/1.0'})
                     
                     if response.status_code == 200:
                         bgp_data = response.json()
@@ -2235,7 +2327,7 @@ class DataCollector:
         """Perform direct WHOIS query using a web service"""
         try:
             # Use a WHOIS API service
-            response = requests.get(
+            response = self.session.get(
                 f"https://ipapi.co/{query}/json/",
                 timeout=10
             )
@@ -2369,7 +2461,7 @@ class DataCollector:
     
 
     
-    @st.cache_data(ttl=86400, max_entries=1)  # Cache for 24h — BGP tables change daily
+    @st.cache_data(ttl=86400, max_entries=1, show_spinner=False)  # Cache for 24h — BGP tables change daily
     def get_current_bgp_stats(_self) -> Dict[str, Any]:
         """Get current BGP table statistics"""
         base_stats = _self.get_bgp_stats()
@@ -3116,7 +3208,8 @@ class DataCollector:
             'Middle East': 30.0
         }
     
-    def get_global_historical_data(self, time_range: str) -> List[Dict[str, Any]]:
+    @st.cache_data(ttl=86400, max_entries=5)  # Cache for 24h, one entry per time range
+    def get_global_historical_data(_self, time_range: str) -> List[Dict[str, Any]]:
         """Get global historical adoption data"""
         months_back = {
             'Last 6 Months': 6,
@@ -3144,7 +3237,8 @@ class DataCollector:
         
         return historical_data
     
-    def get_regional_trends(self, time_range: str) -> Dict[str, List[Dict[str, Any]]]:
+    @st.cache_data(ttl=86400, max_entries=5)  # Cache for 24h, one entry per time range
+    def get_regional_trends(_self, time_range: str) -> Dict[str, List[Dict[str, Any]]]:
         """Get regional trend data over time"""
         regions = ['Europe', 'North America', 'Asia-Pacific', 'Latin America']
         current_rates = {'Europe': 65.0, 'North America': 50.0, 'Asia-Pacific': 45.0, 'Latin America': 35.0}
@@ -3177,7 +3271,8 @@ class DataCollector:
         
         return trends
     
-    def get_bgp_timeline(self, time_range: str) -> List[Dict[str, Any]]:
+    @st.cache_data(ttl=86400, max_entries=5)  # Cache for 24h, one entry per time range
+    def get_bgp_timeline(_self, time_range: str) -> List[Dict[str, Any]]:
         """Get BGP table growth timeline"""
         months_back = {
             'Last 6 Months': 6,
@@ -3830,7 +3925,7 @@ class DataCollector:
             'note': 'Meta no longer publishes public IPv6 stats. Set CLOUDFLARE_API_KEY for live data.',
         }
     
-    @st.cache_data(ttl=2592000, max_entries=1)  # Cache for 30 days (monthly), single entry
+    @st.cache_data(ttl=2592000, max_entries=5)  # Cache for 30 days (monthly), one entry per time range
     def get_facebook_historical_stats(_self, time_range='Last Year') -> Dict[str, Any]:
         """
         Get Facebook IPv6 historical statistics with time range support.
@@ -23,12 +23,17 @@ DATA_LOADING = {
     'request_timeout': 10,  # Shorter timeout for faster failures
     'max_retries': 1,  # Limit retries to reduce CPU usage
     'connection_pool_size': 5,  # Smaller connection pool
+    'host_pools': 24,  # One keep-alive pool per upstream host
+    'http_cache_path': 'ipv6stats_http_cache',  # SQLite response cache, relative to the app directory (needs requests-cache)
+    'http_cache_expire': 86400,  # Seconds a cached HTTP response stays fresh
+    'fetch_workers': 8,  # Thread cap for parallel source fetches
 }
 
 # UI optimization settings
 UI_OPTIMIZATION = {
     'default_expanded': False,  # Keep expanders collapsed by default
     'pagination_size': 10,  # Items per page
+    'table_rows': 25,  # Default rows shipped for long country tables
     'chart_height': 400,  # Fixed chart height
     'lazy_charts': True,  # Load charts only when requested
     'lazy_expanders': True,  # Lazy load content in collapsed expanders
@@ -3,21 +3,32 @@ from datetime import datetime, timedelta
 import json
 from typing import Dict, List, Any, Optional
 import hashlib
+import functools
 
 def format_number(number) -> str:
     """Format large numbers with appropriate suffixes"""
     # Handle both string and numeric inputs
     if isinstance(number, str):
-        # Remove commas and convert to int
-        try:
-            number = int(number.replace(',', ''))
-        except (ValueError, AttributeError):
-            return str(number)  # Return as-is if conversion fails
+        return _format_numeric_string(number)
     
     # Ensure we have a numeric value
     if not isinstance(number, (int, float)):
         return str(number)
     
+    return _format_numeric(number)
+
+@functools.lru_cache(maxsize=1024)
+def _format_numeric_string(number: str) -> str:
+    """Parse a scraped count such as '12,345' and format it; cached like _format_numeric"""
+    # Remove commas and convert to int
+    try:
+        return _format_numeric(int(number.replace(',', '')))
+    except (ValueError, AttributeError):
+        return number  # Return as-is if conversion fails
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _format_numeric(number) -> str:
+    """Suffix formatting for an int/float; the same values recur on every rerun"""
     if number >= 1_000_000:
         return f"{number / 1_000_000:.1f}M"
     elif number >= 1_000:
@@ -90,7 +101,15 @@ def format_date(date_str: str) -> str:
     try:
         date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
         return date_obj.strftime('%B %d, %Y')
-    except:
+    except (ValueError, AttributeError):
+        return date_str
+
+@functools.lru_cache(maxsize=64)
+def format_month_year(date_str: str) -> str:
+    """Shorten an RIR data date such as 'Mon Aug 11 2025' to 'Aug 2025'"""
+    try:
+        return datetime.strptime(date_str, '%a %b %d %Y').strftime('%b %Y')
+    except (ValueError, TypeError):
         return date_str
 
 def calculate_growth_rate(current: float, previous: float) -> float:
@@ -189,5 +208,5 @@ def get_data_freshness_indicator(last_updated: str) -> str:
             return "🟡 This week"
         else:
             return "🔴 Stale"
-    except:
+    except (ValueError, AttributeError, TypeError):
         return "❓ Unknown"
@@ -1,11 +1,17 @@
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
-import folium
-from streamlit_folium import st_folium
 from typing import Dict, List, Any
-import streamlit as st
+
+from utils import get_country_coordinates
+
+# Adoption bands for the country marker map: (lower bound, legend label,
+# hover status, outline colour, fill colour), highest band first
+ADOPTION_BANDS = (
+    (70, '70%+ High Adoption', '🟢 High Adoption', '#006600', '#00ff00'),
+    (50, '50-69% Medium Adoption', '🟡 Medium Adoption', '#ff8c00', '#ffa500'),
+    (30, '30-49% Growing Adoption', '🟠 Growing Adoption', '#ff4500', '#ff6347'),
+    (0, '<30% Early Stage', '🔴 Early Stage', '#8b0000', '#ff0000'),
+)
 
 class ChartGenerator:
     """Handles creation of all visualizations for the IPv6 dashboard"""
@@ -21,18 +27,18 @@ class ChartGenerator:
     
     def create_world_map(self, df: pd.DataFrame, value_column: str) -> go.Figure:
         """Create a choropleth world map for IPv6 adoption"""
-        fig = px.choropleth(
-            df,
-            locations='country',
+        # Build the trace from plain arrays rather than routing the frame through px
+        fig = go.Figure(go.Choropleth(
+            locations=df['country'].to_numpy(),
+            z=df[value_column].to_numpy(dtype='float32'),
             locationmode='country names',
-            color=value_column,
-            hover_name='country',
-            hover_data={value_column: ':.1f%'},
-            color_continuous_scale='Blues',
-            title='Global IPv6 Adoption by Country'
-        )
+            colorscale='Blues',
+            colorbar=dict(title=value_column),
+            hovertemplate='<b>%{location}</b><br>' + value_column + ': %{z:.1f}%<extra></extra>'
+        ))
         
         fig.update_layout(
+            title='Global IPv6 Adoption by Country',
             title_font_size=16,
             geo=dict(
                 showframe=False,
@@ -44,19 +50,86 @@ class ChartGenerator:
         
         return fig
     
+    def create_adoption_marker_map(self, country_stats: List[Dict[str, Any]]) -> go.Figure:
+        """Per-country adoption markers on a world map, one Scattergeo trace per adoption band"""
+        bands = [
+            {'lat': [], 'lon': [], 'size': [], 'label': [], 'customdata': []}
+            for _ in ADOPTION_BANDS
+        ]
+        for country_data in country_stats:
+            coords = get_country_coordinates(country_data['country'])
+            if not coords:
+                continue
+            pct = country_data['ipv6_percentage']
+            # NaN or negative values fall through to the last (Early Stage) band
+            band_index = next((i for i, band in enumerate(ADOPTION_BANDS) if pct >= band[0]), len(ADOPTION_BANDS) - 1)
+            band = bands[band_index]
+            band['lat'].append(coords[0])
+            band['lon'].append(coords[1])
+            band['size'].append(2 * (8 + (pct / 10 if pct > 0 else 0)))  # Marker diameter grows with adoption
+            band['label'].append(f"{pct}%")
+            band['customdata'].append((
+                country_data['country'], pct, country_data['rank'],
+                ADOPTION_BANDS[band_index][2],
+                'Mobile-first' if pct >= 60 else 'Mixed deployment'
+            ))
+
+        fig = go.Figure([
+            go.Scattergeo(
+                lat=band['lat'],
+                lon=band['lon'],
+                mode='markers+text',
+                text=band['label'],
+                textfont=dict(size=10, color='black'),
+                customdata=band['customdata'],
+                name=name,
+                marker=dict(
+                    size=band['size'],
+                    color=fill,
+                    opacity=0.7,
+                    line=dict(color=outline, width=2)
+                ),
+                hovertemplate=(
+                    '<b>%{customdata[0]}</b><br>'
+                    'IPv6 Adoption: %{customdata[1]}%<br>'
+                    'Global Rank: #%{customdata[2]}<br>'
+                    'Status: %{customdata[3]}<br>'
+                    'Network Type: %{customdata[4]}<extra></extra>'
+                )
+            )
+            for band, (_, name, _, outline, fill) in zip(bands, ADOPTION_BANDS)
+        ])
+
+        fig.update_layout(
+            geo=dict(
+                showframe=False,
+                showcoastlines=True,
+                showcountries=True,
+                showland=True,
+                projection_type='natural earth'
+            ),
+            legend_title_text='IPv6 Adoption Levels',
+            margin=dict(l=0, r=0, t=30, b=0),
+            height=500
+        )
+
+        return fig
+
     def create_bar_chart(self, df: pd.DataFrame, x_column: str, y_column: str, title: str) -> go.Figure:
         """Create a horizontal bar chart"""
-        fig = px.bar(
-            df,
-            x=y_column,
-            y=x_column,
+        values = df[y_column].to_numpy()
+        # One decimal for percentages, thousands separators for counts
+        value_format = ':.1f' if pd.api.types.is_float_dtype(df[y_column]) else ':,'
+        fig = go.Figure(go.Bar(
+            x=values,
+            y=df[x_column].to_numpy(),
             orientation='h',
-            title=title,
-            color=y_column,
-            color_continuous_scale='Blues'
-        )
+            marker=dict(color=values, colorscale='Blues', colorbar=dict(title=y_column)),
+            hovertemplate='%{y}<br>' + y_column + ': %{x' + value_format + '}<extra></extra>'
+        ))
         
         fig.update_layout(
+            title=title,
             title_font_size=16,
             xaxis_title='IPv6 Adoption (%)',
             yaxis_title='Country',
@@ -66,8 +139,42 @@ class ChartGenerator:
         
         return fig
     
+    def create_allocation_chart(self, top_countries: Dict[str, Dict[str, Any]], title: str,
+                                colorscale: str = 'Viridis', show_entries: bool = False) -> go.Figure:
+        """Create an RIR allocations-by-country bar chart straight from the top_countries dict"""
+        countries = list(top_countries)
+        details = list(top_countries.values())
+        hovertemplate = 'Country: %{x}<br>Allocations: %{y:,}<br>Percentage: %{marker.color:.2f}'
+        customdata = None
+        if show_entries:
+            customdata = [d.get('entries', 0) for d in details]
+            hovertemplate += '<br>Entries: %{customdata:,}'
+        fig = go.Figure(go.Bar(
+            x=countries,
+            y=[d['allocations'] for d in details],
+            customdata=customdata,
+            marker=dict(
+                color=[d['percentage'] for d in details],
+                colorscale=colorscale,
+                colorbar=dict(title='Percentage')
+            ),
+            hovertemplate=hovertemplate + '<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title=title,
+            xaxis_title='Country',
+            yaxis_title='Allocations',
+            xaxis_tickangle=-45,
+            height=400
+        )
+        
+        return fig
+    
     def create_line_chart(self, data: List[Dict[str, Any]], x_column: str, y_column: str, title: str) -> go.Figure:
         """Create a line chart for trends"""
+        import plotly.express as px
+
         df = pd.DataFrame(data)
         df[x_column] = pd.to_datetime(df[x_column])
         
@@ -309,6 +416,8 @@ class ChartGenerator:
     
     def create_top_asns_chart(self, asn_data: List[Dict[str, Any]]) -> go.Figure:
         """Create top ASNs chart"""
+        import plotly.express as px
+
         df = pd.DataFrame(asn_data)
         
         fig = px.bar(
@@ -424,6 +533,8 @@ class ChartGenerator:
     
     def create_bgp_timeline_chart(self, timeline_data: List[Dict[str, Any]]) -> go.Figure:
         """Create BGP timeline chart"""
+        from plotly.subplots import make_subplots
+
         df = pd.DataFrame(timeline_data)
         df['date'] = pd.to_datetime(df['date'])
         